@@ -5,12 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
-
 from api.bootstrap_api import regenerate_bootstrap
 from api.db import load_db
 from api.validate import validate_product
 from validation.validator import BOOTSTRAP_SCHEMA, CHECKLIST_SCHEMA, PRODUCT_SCHEMA
+from validation.yaml_loader import load_yaml
 
 PRODUCTS_DIR = Path("products")
 STRUCTURAL_EXCLUDE = {
@@ -49,11 +48,12 @@ def ci_structural_check() -> Dict[str, Any]:
     """Perform lightweight YAML parsing checks across product specs."""
 
     problems = []
+    # every products/*.yml, including the index and worksheets, not just specs
     for path in sorted(PRODUCTS_DIR.glob("*.yml")):
         if path.name in STRUCTURAL_EXCLUDE:
             continue
         try:
-            data = yaml.safe_load(path.read_text(encoding="utf-8"))
+            data = load_yaml(path, copy=False)
         except Exception as exc:  # pragma: no cover - defensive logging only
             problems.append({"file": str(path), "error": str(exc)})
             continue
@@ -8,10 +8,14 @@ deterministic, testable behavior and safe handling of missing files.
 from __future__ import annotations
 
 import ast
+import contextlib
 import hashlib
 import json
 import logging
 import os
+import sys
+import time
+import types
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import xml.etree.ElementTree as ET
@@ -22,6 +26,1465 @@ MISSING_FILE_HASH = "MISSING_FILE_HASH"
 logger = logging.getLogger("pil.scanner")
 logger.addHandler(logging.NullHandler())
 
+# call names that commonly indicate a state transition helper
+STATE_TRANSITION_CALL_NAMES = {"set_state", "change_state", "next_state", "transition_state", "apply_state", "apply_changes"}
+# decorator names that mark a function as a state transition
+STATE_TRANSITION_DECORATORS = {"state_transition", "transition", "state_change", "transition_decorator"}
+
+
+def _decorator_mentions_stage(node: ast.FunctionDef) -> bool:
+    """Return True when any simple/attribute decorator of `node` mentions 'stage'."""
+    return any(
+        (isinstance(d, ast.Name) and "stage" in d.id.lower())
+        or (isinstance(d, ast.Attribute) and "stage" in getattr(d, "attr", "").lower())
+        for d in node.decorator_list
+    )
+
+
+def _decorator_names(node: ast.FunctionDef) -> set:
+    """Return decorator names of `node` (simple names, attributes and called decorators)."""
+    dec_names = set()
+    for d in node.decorator_list:
+        # handle simple names, attributes, and calls (e.g. @decorator(), @pkg.decorator)
+        if isinstance(d, ast.Name):
+            dec_names.add(d.id)
+        elif isinstance(d, ast.Attribute):
+            dec_names.add(getattr(d, "attr", ""))
+        elif isinstance(d, ast.Call):
+            # decorator with call: inspect the underlying function
+            func = d.func
+            if isinstance(func, ast.Name):
+                dec_names.add(func.id)
+            elif isinstance(func, ast.Attribute):
+                dec_names.add(getattr(func, "attr", ""))
+        else:
+            try:
+                dec_names.add(ast.unparse(d))
+            except Exception:
+                pass
+    return dec_names
+
+
+def _decorator_labels(node: ast.FunctionDef) -> List[str]:
+    """Return decorator labels of `node` in order, as `FunctionDefIndex.check` compares them."""
+    labels = []
+    for d in node.decorator_list:
+        if isinstance(d, ast.Name):
+            labels.append(d.id)
+        elif isinstance(d, ast.Attribute):
+            labels.append(d.attr)
+        else:
+            labels.append(ast.dump(d))
+    return labels
+
+
+def _call_name(node: ast.Call) -> Optional[str]:
+    """Return the simple name of the called object (`f()` / `obj.f()`), if any."""
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return getattr(node.func, "attr", None)
+    return None
+
+
+class _FunctionFrame:
+    """Per-function bookkeeping while `ModuleSignalVisitor` is inside its body."""
+
+    __slots__ = ("node", "has_return", "has_bool_return")
+
+    def __init__(self, node: ast.FunctionDef):
+        self.node = node
+        self.has_return = False
+        self.has_bool_return = False
+
+
+class ModuleSignalVisitor(ast.NodeVisitor):
+    """Collect every scanner heuristic for a module in one traversal.
+
+    `visit_*` methods run when a node is entered and `leave_FunctionDef` once
+    its whole subtree has been seen (that is when "does this function return
+    a bool-like value / anything at all" is known). Traversal uses an explicit
+    stack instead of recursion so deeply nested expressions cannot exhaust
+    the interpreter's recursion limit.
+
+    The state-transition heuristic reports the *first* hit in `ast.walk`
+    (breadth-first) order. Each candidate is therefore ranked by its
+    breadth-first position `(depth, child-index path)` and the smallest wins.
+    """
+
+    def __init__(self) -> None:
+        self.facts: Dict[str, Any] = {
+            "functions": 0,
+            "classes": 0,
+            "function_names": [],
+            "stage_functions": 0,
+            "validate_functions": 0,
+            "bool_validators": 0,
+            "validator_classes": 0,
+            "adapter_classes": 0,
+            "validator_calls": 0,
+            "imports_pipeline": False,
+            "toplevel_docstring": False,
+            "state_transition": None,
+            "function_defs": [],
+        }
+        # (breadth-first rank, function_defs row) per FunctionDef
+        self._defs: List[Tuple[Tuple[int, Tuple[int, ...]], List[Any]]] = []
+        self._functions: List[_FunctionFrame] = []
+        self._path: List[int] = []
+        self._transition_rank: Optional[Tuple[int, Tuple[int, ...]]] = None
+
+    def visit(self, node: ast.AST) -> None:
+        handlers = {
+            ast.Module: self.visit_Module,
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.Return: self.visit_Return,
+            ast.Assign: self.visit_Assign,
+            ast.Call: self.visit_Call,
+        }
+        path = self._path
+        handler = handlers.get(type(node))
+        if handler is not None:
+            handler(node)
+        # (node, remaining children, index of the next child)
+        stack: List[List[Any]] = [[node, ast.iter_child_nodes(node), 0]]
+        while stack:
+            frame = stack[-1]
+            child = next(frame[1], None)
+            if child is None:
+                stack.pop()
+                if type(frame[0]) is ast.FunctionDef:
+                    self.leave_FunctionDef(frame[0])
+                if stack:
+                    path.pop()
+                continue
+            path.append(frame[2])
+            frame[2] += 1
+            handler = handlers.get(type(child))
+            if handler is not None:
+                handler(child)
+            stack.append([child, ast.iter_child_nodes(child), 0])
+        self.facts["function_defs"] = [row for _, row in sorted(self._defs, key=lambda d: d[0])]
+
+    def _propose_transition(self, prefix: str, suffix: str) -> None:
+        rank = (len(self._path), tuple(self._path))
+        if self._transition_rank is None or rank < self._transition_rank:
+            self._transition_rank = rank
+            self.facts["state_transition"] = [prefix, suffix]
+
+    # ---- imports ----
+    def visit_Import(self, node: ast.Import) -> None:
+        if any(k in (a.name or "").lower() for a in node.names for k in ("pipeline", "stage")):
+            self.facts["imports_pipeline"] = True
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if any(k in (node.module or "").lower() for k in ("pipeline", "stage")):
+            self.facts["imports_pipeline"] = True
+
+    # ---- definitions ----
+    def visit_Module(self, node: ast.Module) -> None:
+        for child in node.body:
+            if isinstance(child, (ast.FunctionDef, ast.ClassDef)) and ast.get_docstring(child):
+                self.facts["toplevel_docstring"] = True
+                break
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        facts = self.facts
+        facts["functions"] += 1
+        name = node.name.lower()
+        facts["function_names"].append(name)
+        if "stage" in name or "pipeline" in name or _decorator_mentions_stage(node):
+            facts["stage_functions"] += 1
+        if "validate" in name:
+            facts["validate_functions"] += 1
+        self._defs.append(
+            ((len(self._path), tuple(self._path)), [node.name, [a.arg for a in node.args.args], _decorator_labels(node)])
+        )
+        self._functions.append(_FunctionFrame(node))
+
+    def leave_FunctionDef(self, node: ast.FunctionDef) -> None:
+        frame = self._functions.pop()
+        name = node.name.lower()
+        if "validate" not in name:
+            # functions with a single non-self argument returning bool-like values
+            args_len = len(node.args.args)
+            arg_ok = args_len == 1 or (args_len == 2 and node.args.args[0].arg == "self")
+            if arg_ok and frame.has_bool_return:
+                self.facts["bool_validators"] += 1
+
+        # state transition: name, decorator, or a 'state' parameter plus a return
+        if "transition" in name:
+            self._propose_transition(f"found_function:{node.name}@", "")
+            return
+        hits = _decorator_names(node) & STATE_TRANSITION_DECORATORS
+        if hits:
+            self._propose_transition(f"decorator_state_transition:{node.name}@", f":{sorted(list(hits))}")
+            return
+        arg_names = [a.arg for a in node.args.args]
+        if arg_names and ("state" in arg_names or "old_state" in arg_names or "current_state" in arg_names):
+            if frame.has_return:
+                self._propose_transition(f"func_with_state_param_and_return:{node.name}@", f":{arg_names}")
+
+    def visit_Return(self, node: ast.Return) -> None:
+        rv = node.value
+        is_bool = rv is not None and (
+            (isinstance(rv, ast.Constant) and isinstance(rv.value, bool))
+            or isinstance(rv, (ast.Compare, ast.BoolOp, ast.UnaryOp))
+        )
+        # mark every enclosing function; an already-marked frame implies its
+        # outer frames were marked by the same earlier return
+        for frame in reversed(self._functions):
+            if frame.has_return and (frame.has_bool_return or not is_bool):
+                break
+            frame.has_return = True
+            if is_bool:
+                frame.has_bool_return = True
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.facts["classes"] += 1
+        name = node.name.lower()
+        if "validator" in name or "validate" in name:
+            self.facts["validator_classes"] += 1
+        if "adapter" in name:
+            self.facts["adapter_classes"] += 1
+
+    # ---- statements / expressions ----
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            if isinstance(target, ast.Attribute) and getattr(target, "attr", "") in ("state", "status"):
+                self._propose_transition("assign_attr_state:", f":{ast.unparse(target)}")
+                return
+
+    def visit_Call(self, node: ast.Call) -> None:
+        fname = _call_name(node)
+        if fname:
+            lowered = fname.lower()
+            if "validate" in lowered or "schema" in lowered:
+                self.facts["validator_calls"] += 1
+            if fname in STATE_TRANSITION_CALL_NAMES:
+                self._propose_transition(f"call_transition_helper:{fname}@", "")
+
+
+def extract_module_facts(tree: ast.Module) -> Dict[str, Any]:
+    """Derive every per-file fact the scanner heuristics need from one AST.
+
+    The returned mapping is plain JSON-compatible data so it can be shared
+    by all KPI computations of a scan:
+      - functions / classes: FunctionDef and ClassDef counts
+      - function_names: lower-cased function names (task-id matching)
+      - stage_functions: functions named or decorated like pipeline stages
+      - validate_functions: functions with 'validate' in the name
+      - bool_validators: single-argument functions returning bool-like values
+      - validator_classes / adapter_classes: classes named like validators/adapters
+      - validator_calls: calls to '*validate*' or '*schema*' callables
+      - imports_pipeline: whether the module imports pipeline/stage modules
+      - toplevel_docstring: whether a top-level function/class has a docstring
+      - state_transition: first state-transition hit as `[prefix, suffix]`;
+        the diagnostic for a file `f` is `prefix + f + suffix`
+      - function_defs: `[name, params, decorators]` per function definition,
+        in `ast.walk` order (feeds `FunctionDefIndex`)
+
+    All facts come from a single `ModuleSignalVisitor` traversal.
+    """
+    visitor = ModuleSignalVisitor()
+    visitor.visit(tree)
+    return visitor.facts
+
+
+SIGNAL_CACHE_DIR = ".pil_cache"
+SIGNAL_CACHE_FILE = "signals.json"
+# bump when the shape of the cached facts changes
+SIGNAL_CACHE_VERSION = 2
+TASK_FINGERPRINT_FILE = "task_fingerprints.json"
+
+
+def _heuristics_fingerprint() -> str:
+    """Return a digest identifying the current signal heuristics.
+
+    The digest covers the source of the fact extractors (so any edit to the
+    heuristics in this file invalidates persisted signals), the cache format
+    version and the running Python minor version (AST shapes differ).
+    """
+    import inspect
+
+    h = hashlib.sha256()
+    h.update(f"v{SIGNAL_CACHE_VERSION}:py{sys.version_info[0]}.{sys.version_info[1]}".encode("utf-8"))
+    try:
+        for obj in (
+            _decorator_mentions_stage,
+            _decorator_names,
+            _decorator_labels,
+            _call_name,
+            ModuleSignalVisitor,
+            extract_module_facts,
+        ):
+            h.update(inspect.getsource(obj).encode("utf-8"))
+    except Exception:
+        # source unavailable (e.g. frozen build): fall back to the whole module
+        try:
+            h.update(Path(__file__).read_bytes())
+        except Exception:
+            h.update(b"unknown")
+    return h.hexdigest()
+
+
+def _scoring_fingerprint() -> str:
+    """Return a digest of this scanner's source, covering every scoring rule."""
+    try:
+        return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    except Exception:
+        return _heuristics_fingerprint()
+
+
+def _digest(payload: Any) -> str:
+    """Return a stable SHA-256 over a JSON-serializable `payload`."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class SignalCache:
+    """Persistent per-file store of AST-derived facts under `.pil_cache/`.
+
+    Entries are keyed by repo-relative path and validated against the file's
+    size and mtime; when those differ the SHA-256 of the content decides
+    whether the stored facts are still valid, so touching a file without
+    changing it never forces a re-parse. The whole store is discarded when
+    `_heuristics_fingerprint()` changes. Reads and writes are best-effort: a
+    missing or corrupt cache behaves like an empty one.
+    """
+
+    def __init__(self, repo_path: Path, cache_dir: Optional[str] = None):
+        self.repo_path = Path(repo_path).resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else self.repo_path / SIGNAL_CACHE_DIR
+        self.path = self.cache_dir / SIGNAL_CACHE_FILE
+        self.fingerprint = _heuristics_fingerprint()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(data, dict) or data.get("fingerprint") != self.fingerprint:
+            # heuristics changed (or foreign file): start over
+            self._dirty = True
+            return
+        files = data.get("files")
+        if isinstance(files, dict):
+            self._entries = files
+
+    def _rel(self, key: str) -> str:
+        try:
+            return Path(key).relative_to(self.repo_path).as_posix()
+        except ValueError:
+            return key
+
+    def lookup(self, key: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return the entry for `key` when size and mtime still match, else None."""
+        entry = self._entries.get(self._rel(key))
+        if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            self.hits += 1
+            return entry
+        return None
+
+    def lookup_content(self, key: str, st: os.stat_result, sha256: str) -> Optional[Dict[str, Any]]:
+        """Return the entry for `key` when its content hash matches (refreshing stat data)."""
+        entry = self._entries.get(self._rel(key))
+        if entry and entry.get("sha256") == sha256:
+            entry["size"] = st.st_size
+            entry["mtime_ns"] = st.st_mtime_ns
+            self._dirty = True
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key: str, st: os.stat_result, sha256: str, facts: Optional[Dict[str, Any]], error: Optional[str]) -> None:
+        self._entries[self._rel(key)] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": sha256,
+            "facts": facts,
+            "error": error,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the store atomically, dropping entries for deleted files."""
+        if not self._dirty:
+            return
+        files = {}
+        for rel in sorted(self._entries):
+            p = Path(rel) if Path(rel).is_absolute() else self.repo_path / rel
+            if p.exists():
+                files[rel] = self._entries[rel]
+        payload = {"fingerprint": self.fingerprint, "files": files}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(str(tmp), str(self.path))
+            self._dirty = False
+        except Exception as exc:
+            logger.warning("could not write signal cache %s: %s", self.path, exc)
+
+
+class TaskFingerprintStore:
+    """Per-repo record of incremental task fingerprints under `.pil_cache/`.
+
+    Each task maps to the fingerprint of the inputs it was last scored with
+    and a digest of the result that scoring produced. `matching` only returns
+    fingerprints whose result digest equals the given previous scoring, so a
+    `repos_index` from some other run never has its results reused as if they
+    came from those inputs. Reads and writes are best-effort, like
+    `SignalCache`.
+    """
+
+    def __init__(self, repo_path: Path, cache_dir: Optional[str] = None):
+        self.repo_path = Path(repo_path).resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else self.repo_path / SIGNAL_CACHE_DIR
+        self.path = self.cache_dir / TASK_FINGERPRINT_FILE
+        self._entries: Dict[str, Any] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        tasks = data.get("tasks") if isinstance(data, dict) else None
+        if isinstance(tasks, dict):
+            self._entries = tasks
+
+    def matching(self, scoring: Dict[str, Any]) -> Dict[str, str]:
+        """Return stored fingerprints of the tasks whose result is still `scoring[task_id]`."""
+        fingerprints: Dict[str, str] = {}
+        for task_id, entry in self._entries.items():
+            result = scoring.get(task_id)
+            if isinstance(entry, dict) and isinstance(result, dict) and entry.get("result") == _digest(result):
+                fingerprints[task_id] = entry.get("fingerprint")
+        return fingerprints
+
+    def save(self, fingerprints: Dict[str, str], scoring: Dict[str, Any]) -> None:
+        """Persist `fingerprints` with digests of the `scoring` results they produced."""
+        tasks = {
+            task_id: {"fingerprint": fp, "result": _digest(scoring[task_id])}
+            for task_id, fp in sorted(fingerprints.items())
+            if isinstance(scoring.get(task_id), dict)
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"tasks": tasks}, sort_keys=True), encoding="utf-8")
+            os.replace(str(tmp), str(self.path))
+        except Exception as exc:
+            logger.warning("could not write task fingerprints %s: %s", self.path, exc)
+
+
+DEFAULT_SCAN_IGNORE = ("__pycache__", "venv", ".venv", "node_modules")
+
+
+class FileInventory:
+    """One pruned walk of a repository, categorized for the scanner's queries.
+
+    Directories are pruned before descending: hidden directories, the names in
+    `DEFAULT_SCAN_IGNORE` and any `scan_ignore` entries from `repo_contract.yml`
+    (bare names match at any depth, entries containing '/' match a single
+    repo-relative directory). Symlinked directories are not followed.
+
+    Files are bucketed by suffix (`by_suffix`) and by role (`by_role`):
+      - "impl": non-test `.py` modules under `src/`
+      - "test": `.py` files named `test_*`/`tests_*` or under a `tests` directory
+      - "schema": `.json`/`.yaml`/`.yml` files with 'schema' in the name
+    Every list is sorted, matching `sorted(Path.rglob(...))` ordering.
+    """
+
+    SCHEMA_SUFFIXES = (".json", ".yaml", ".yml")
+
+    def __init__(self, root: Path, ignore: Optional[List[str]] = None):
+        self.root = Path(root)
+        self.ignore_names = set(DEFAULT_SCAN_IGNORE)
+        self.ignore_paths = set()
+        for entry in ignore or []:
+            name = str(entry).strip().strip("/")
+            if not name:
+                continue
+            if "/" in name:
+                self.ignore_paths.add(name)
+            else:
+                self.ignore_names.add(name)
+        self.files: List[Path] = []
+        self.by_suffix: Dict[str, List[Path]] = {}
+        self.by_role: Dict[str, List[Path]] = {"impl": [], "test": [], "schema": []}
+        self._resolved_impl: Optional[List[str]] = None
+        self._walk()
+
+    def _pruned(self, name: str, rel: str) -> bool:
+        return name.startswith(".") or name in self.ignore_names or rel in self.ignore_paths
+
+    def _walk(self) -> None:
+        stack: List[Tuple[str, Tuple[str, ...]]] = [(str(self.root), ())]
+        while stack:
+            dirpath, rel_parts = stack.pop()
+            try:
+                entries = list(os.scandir(dirpath))
+            except OSError:
+                continue
+            for entry in entries:
+                parts = rel_parts + (entry.name,)
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if not self._pruned(entry.name, "/".join(parts)):
+                        stack.append((entry.path, parts))
+                    continue
+                self._add(self.root.joinpath(*parts), parts)
+        self.files.sort()
+        for bucket in list(self.by_suffix.values()) + list(self.by_role.values()):
+            bucket.sort()
+
+    def _add(self, path: Path, parts: Tuple[str, ...]) -> None:
+        self.files.append(path)
+        suffix = path.suffix
+        self.by_suffix.setdefault(suffix, []).append(path)
+        name = parts[-1]
+        if suffix == ".py":
+            is_test = name.startswith(("test_", "tests_")) or any(p.lower() == "tests" for p in parts[:-1])
+            if is_test:
+                self.by_role["test"].append(path)
+            elif parts[0] == "src" and len(parts) > 1:
+                self.by_role["impl"].append(path)
+        if suffix in self.SCHEMA_SUFFIXES and "schema" in name.lower():
+            self.by_role["schema"].append(path)
+
+    def suffix(self, suffix: str) -> List[Path]:
+        """Return the sorted files with the given suffix (e.g. ".py")."""
+        return list(self.by_suffix.get(suffix, []))
+
+    def role(self, role: str) -> List[Path]:
+        """Return the sorted files categorized under `role`."""
+        return list(self.by_role.get(role, []))
+
+    def stat_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Return `{path: (mtime_ns, size)}` for every inventoried file.
+
+        Cheap enough to poll; `PILScanner.watch` compares consecutive
+        snapshots to find changed, added and removed files.
+        """
+        out: Dict[str, Tuple[int, int]] = {}
+        for p in self.files:
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            out[str(p)] = (st.st_mtime_ns, st.st_size)
+        return out
+
+    def resolved_impl(self) -> List[str]:
+        """Return the "impl" files as resolved absolute strings, computed once."""
+        if self._resolved_impl is None:
+            out = []
+            for p in self.by_role["impl"]:
+                try:
+                    out.append(str(p.resolve()))
+                except Exception:
+                    continue
+            self._resolved_impl = out
+        return list(self._resolved_impl)
+
+
+class FunctionDefIndex:
+    """Name -> function definition lookup over one module's `function_defs` fact.
+
+    The rows cover every function definition `ast.walk` reaches (methods and
+    nested functions included), in walk order, so `check()` gives the same
+    verdict as scanning the tree for the first matching function. Being
+    plain data, they are parsed and cached together with the other facts.
+    """
+
+    def __init__(self, rows: List[List[Any]]):
+        self.rows = rows
+        self.by_name: Dict[str, List[List[Any]]] = {}
+        for row in rows:
+            self.by_name.setdefault(row[0], []).append(row)
+
+    def check(self, required_signature: Any, file_path: str) -> Tuple[bool, str]:
+        """Verdict for one `PILScanner.ast_check` signature against this module."""
+        if isinstance(required_signature, str):
+            func_name = required_signature
+            required_params = None
+            decorator = None
+        elif isinstance(required_signature, dict):
+            func_name = required_signature.get("function")
+            required_params = required_signature.get("params")
+            decorator = required_signature.get("decorator")
+        else:
+            return False, "Unsupported required_signature format"
+
+        if not func_name:
+            candidates = self.rows
+        else:
+            candidates = self.by_name.get(func_name, []) if isinstance(func_name, str) else []
+        if not candidates:
+            return False, f"Required function '{func_name}' not found in {file_path}"
+        # the first matching function decides, as in a walk over the tree
+        name, arg_names, dec_names = candidates[0]
+
+        # check params if requested
+        if required_params is not None:
+            # drop 'self' when present for methods
+            if arg_names and arg_names[0] == "self":
+                arg_names = arg_names[1:]
+            if arg_names != required_params:
+                return (
+                    False,
+                    f"Function '{name}' parameters mismatch: expected {required_params}, found {arg_names}",
+                )
+
+        # check decorator if requested
+        if decorator:
+            if decorator not in dec_names:
+                return (
+                    False,
+                    f"Decorator '{decorator}' not found on function '{name}' (found: {dec_names})",
+                )
+
+        # all requested checks passed for this function
+        return True, f"Function '{name}' compliant"
+
+
+class ModuleIndex:
+    """Scan-scoped index that reads and parses each Python file exactly once.
+
+    `facts(path)` returns the derived per-file facts produced by
+    `extract_module_facts`, or None when the file is missing or cannot be
+    read/parsed (the reason is available from `error(path)`). Paths are keyed
+    by their resolved absolute form so relative and absolute spellings share
+    one entry. `parse_count` records how many files were actually parsed.
+
+    When a `SignalCache` is supplied, facts persisted by earlier runs are
+    reused for files whose content did not change.
+    """
+
+    def __init__(self, repo_path: Path, cache: Optional[SignalCache] = None, profiler: Optional["PhaseProfiler"] = None):
+        self.repo_path = Path(repo_path)
+        self.cache = cache
+        self.profiler = profiler
+        self._facts: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._errors: Dict[str, str] = {}
+        # per-task KPIs resolve and stat the same paths for every task; the
+        # tree is assumed stable for the life of the index (see `invalidate`)
+        self._resolved: Dict[str, Path] = {}
+        self._exists: Dict[str, bool] = {}
+        self._depths: Dict[str, int] = {}
+        # `FunctionDefIndex` over the file's facts (or "missing"/the parse error) per file
+        self._function_defs: Dict[str, Tuple[Optional[FunctionDefIndex], Optional[str]]] = {}
+        # repository file inventory, built on first use by `PILScanner._inventory`
+        self.inventory: Optional[FileInventory] = None
+        # repo-wide complexity totals, memoized by `PILScanner.compute_repo_totals`
+        self.repo_totals: Optional[Dict[str, int]] = None
+        # content digests used by incremental fingerprints, keyed by path as given
+        self.content_hashes: Dict[str, str] = {}
+        self.parse_count = 0
+
+    def _key(self, path: Any) -> str:
+        return self.resolve(path)
+
+    def resolve(self, path: Any) -> str:
+        """Return `str(Path(path).resolve())`, memoized per spelling of `path`."""
+        return str(self.resolved_path(path))
+
+    def resolved_path(self, path: Any) -> Path:
+        """Return `Path(path).resolve()`, memoized per spelling of `path`."""
+        spelling = str(path)
+        resolved = self._resolved.get(spelling)
+        if resolved is None:
+            resolved = self._resolved[spelling] = Path(spelling).resolve()
+        return resolved
+
+    def depth(self, path: Path) -> int:
+        """Directory depth of `path` below the repo root (absolute depth outside it), memoized."""
+        spelling = str(path)
+        depth = self._depths.get(spelling)
+        if depth is None:
+            try:
+                rel = path.relative_to(self.repo_path)
+            except Exception:
+                rel = path
+            depth = self._depths[spelling] = len(rel.parts) - 1
+        return depth
+
+    def exists(self, path: Any) -> bool:
+        """Return `Path(path).exists()`, memoized per spelling of `path`."""
+        spelling = str(path)
+        found = self._exists.get(spelling)
+        if found is None:
+            found = self._exists[spelling] = Path(spelling).exists()
+        return found
+
+    def facts(self, path: Any) -> Optional[Dict[str, Any]]:
+        """Return cached facts for `path`, parsing the file on first access."""
+        key = self._key(path)
+        if key in self._facts:
+            return self._facts[key]
+        if self.cache is not None:
+            facts, error = self._load_through_cache(key)
+        else:
+            facts, error = self._parse(key, None)
+        if error is not None:
+            self._errors[key] = error
+        self._facts[key] = facts
+        return facts
+
+    def _parse(self, key: str, raw: Optional[bytes]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        if self.profiler is not None:
+            with self.profiler.phase("module_parse", files=1):
+                return self._parse_source(key, raw)
+        return self._parse_source(key, raw)
+
+    def _parse_source(self, key: str, raw: Optional[bytes]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        try:
+            src = raw.decode("utf-8") if raw is not None else Path(key).read_text(encoding="utf-8")
+            tree = ast.parse(src)
+            self.parse_count += 1
+            return extract_module_facts(tree), None
+        except Exception as e:
+            return None, str(e)
+
+    def _load_through_cache(self, key: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        try:
+            st = os.stat(key)
+        except OSError as e:
+            return None, str(e)
+        entry = self.cache.lookup(key, st)
+        if entry is None:
+            try:
+                raw = Path(key).read_bytes()
+            except OSError as e:
+                return None, str(e)
+            sha = hashlib.sha256(raw).hexdigest()
+            entry = self.cache.lookup_content(key, st, sha)
+            if entry is None:
+                facts, error = self._parse(key, raw)
+                self.cache.store(key, st, sha, facts, error)
+                return facts, error
+        return entry.get("facts"), entry.get("error")
+
+    def error(self, path: Any) -> Optional[str]:
+        """Return the read/parse error recorded for `path`, if any."""
+        return self._errors.get(self._key(path))
+
+    def function_defs(self, path: Path) -> Tuple[Optional[FunctionDefIndex], Optional[str]]:
+        """Return `(FunctionDefIndex, None)` for `path`, or `(None, reason)`.
+
+        The index is built from the `function_defs` fact, so it shares the
+        parse (and the `SignalCache` entry) of `facts(path)`. `reason` is
+        "missing" or the parse error message.
+        """
+        key = self._key(path)
+        cached = self._function_defs.get(key)
+        if cached is None:
+            if not Path(path).exists():
+                cached = (None, "missing")
+            else:
+                facts = self.facts(key)
+                cached = (FunctionDefIndex(facts["function_defs"]), None) if facts is not None else (None, self.error(key))
+            self._function_defs[key] = cached
+        return cached
+
+    def invalidate(self, paths: List[str], inventory: Optional[FileInventory] = None) -> None:
+        """Forget everything derived from `paths` so a long-lived index sees their new content.
+
+        Repo-wide memos (inventory, totals) are dropped too; `inventory`, when
+        given, replaces the old one.
+        """
+        keys = {self._key(p) for p in paths}
+        for key in keys:
+            self._facts.pop(key, None)
+            self._errors.pop(key, None)
+            self._function_defs.pop(key, None)
+        self.content_hashes = {p: h for p, h in self.content_hashes.items() if self._key(p) not in keys}
+        if inventory is None or self.inventory is None or inventory.files != self.inventory.files:
+            # added or removed files change what exists and may change resolution
+            self._resolved.clear()
+            self._exists.clear()
+            self._depths.clear()
+        self.inventory = inventory
+        self.repo_totals = None
+
+    def save(self) -> None:
+        """Flush the persistent cache, if any."""
+        if self.cache is not None:
+            self.cache.save()
+
+
+class JUnitResultIndex:
+    """Indexed view over JUnit-style results under `test-reports/`.
+
+    Results map `file::testname`, `classname::testname` or `testname` keys to
+    a pass flag (False for failure/error/skipped), exactly like
+    `PILScanner.parse_junit_reports`. On top of the mapping the index keeps
+    first-occurrence tables so the TESTS_PASS lookups are O(1):
+      - `get(key)`: exact key
+      - `by_test_name(name)`: first key ending with `::name`
+      - `by_file(artifact)`: first key starting with `artifact` or whose file
+        part ends with it (for `.py` artifacts)
+    "First" follows report order (sorted file names, document order), which
+    matches a linear scan over `results`.
+    """
+
+    def __init__(self) -> None:
+        self.results: Dict[str, bool] = {}
+        self._keys: List[str] = []
+        self._suffix_first: Dict[str, int] = {}
+        self._prefix_first: Dict[str, int] = {}
+        self._file_suffix_first: Dict[str, int] = {}
+        self._files_seen: set = set()
+        # number of report files read by `from_reports`
+        self.report_count = 0
+
+    @classmethod
+    def from_reports(cls, reports_dir: Path) -> "JUnitResultIndex":
+        """Build the index from `reports_dir/*.xml` using incremental parsing.
+
+        Each report is streamed with `iterparse` and processed testcases are
+        released, so memory stays bounded by the index itself. Malformed
+        reports are skipped as a whole.
+        """
+        index = cls()
+        if not reports_dir.exists():
+            return index
+        for p in sorted(reports_dir.glob("*.xml")):
+            try:
+                entries = cls._read_report(p)
+            except Exception:
+                # non-fatal: skip malformed report
+                continue
+            index.report_count += 1
+            for key, passed in entries:
+                if key:
+                    index.add(key, passed)
+        return index
+
+    @staticmethod
+    def _read_report(path: Path) -> List[List[Any]]:
+        entries: List[List[Any]] = []
+        stack: List[Any] = []
+        open_cases: List[int] = []
+        for event, elem in ET.iterparse(str(path), events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == "testcase":
+                    name = elem.attrib.get("name")
+                    classname = elem.attrib.get("classname") or ""
+                    file_attr = elem.attrib.get("file") or ""
+                    if file_attr:
+                        key = f"{file_attr}::{name}"
+                    elif classname:
+                        key = f"{classname}::{name}"
+                    else:
+                        key = name or ""
+                    # record in document order; the outcome is known at "end"
+                    open_cases.append(len(entries))
+                    entries.append([key, True])
+                continue
+            stack.pop()
+            if elem.tag != "testcase":
+                continue
+            # if testcase has child elements like failure/error/skipped -> not passed
+            entries[open_cases.pop()][1] = not any(child.tag.lower() in ("failure", "error", "skipped") for child in elem)
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+        return entries
+
+    def add(self, key: str, passed: bool) -> None:
+        """Record `key`; a repeated key updates its outcome but keeps its position."""
+        if key not in self.results:
+            pos = len(self._keys)
+            self._keys.append(key)
+            # every "::name" suffix (overlapping separators included)
+            i = key.find("::")
+            while i != -1:
+                self._suffix_first.setdefault(key[i + 2:], pos)
+                i = key.find("::", i + 1)
+            # every prefix ending in ".py"
+            i = key.find(".py")
+            while i != -1:
+                self._prefix_first.setdefault(key[: i + 3], pos)
+                i = key.find(".py", i + 1)
+            # every suffix of the file part (once per distinct file)
+            file_part = key.split("::")[0]
+            if file_part.endswith(".py") and file_part not in self._files_seen:
+                self._files_seen.add(file_part)
+                for j in range(len(file_part) - 2):
+                    self._file_suffix_first.setdefault(file_part[j:], pos)
+        self.results[key] = passed
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.results
+
+    def get(self, key: str) -> Optional[bool]:
+        return self.results.get(key)
+
+    def by_test_name(self, testname: str) -> Optional[bool]:
+        """Outcome of the first key ending with `::testname`, or None."""
+        pos = self._suffix_first.get(testname)
+        return None if pos is None else self.results[self._keys[pos]]
+
+    def by_file(self, artifact: str) -> Optional[bool]:
+        """Outcome of the first key matching the file-level `artifact`, or None."""
+        if not artifact.endswith(".py"):
+            for k, v in self.results.items():
+                if k.startswith(artifact) or k.split("::")[0].endswith(artifact):
+                    return v
+            return None
+        hits = [pos for pos in (self._prefix_first.get(artifact), self._file_suffix_first.get(artifact)) if pos is not None]
+        return self.results[self._keys[min(hits)]] if hits else None
+
+
+class TaskStatusIndex:
+    """Hashed `task_id -> (status, repo)` view over an aggregated `repos_index`.
+
+    Built once per index so each dependency lookup is a dict access instead
+    of a scan over every repo. Lookups follow `check_dependencies`' layout
+    rules: a top-level `task_id` entry (string or dict with `status`) wins,
+    otherwise the first repo (in index order) listing the task under
+    `task_details` or `tasks` provides it. `owners` records every repo that
+    lists a task so ids defined in several repos can be reported.
+    """
+
+    def __init__(self, repos_index: Dict[str, Any]):
+        self.repos_index = repos_index if isinstance(repos_index, dict) else {}
+        self._first: Dict[str, Tuple[Optional[str], str]] = {}
+        self.owners: Dict[str, List[str]] = {}
+        for repo_name, repo_val in self.repos_index.items():
+            if not isinstance(repo_val, dict):
+                continue
+            td = repo_val.get("task_details") or repo_val.get("tasks") or {}
+            if not isinstance(td, dict):
+                continue
+            for task_id, entry in td.items():
+                if isinstance(entry, str):
+                    status = entry
+                elif isinstance(entry, dict) and "status" in entry:
+                    status = entry.get("status")
+                else:
+                    continue
+                self._first.setdefault(task_id, (status, repo_name))
+                self.owners.setdefault(task_id, []).append(repo_name)
+
+    def lookup(self, task_id: str) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Return `(found, status, repo)` for `task_id`."""
+        if task_id in self.repos_index:
+            v = self.repos_index[task_id]
+            if isinstance(v, str):
+                return True, v, None
+            if isinstance(v, dict) and "status" in v:
+                return True, v.get("status"), None
+        hit = self._first.get(task_id)
+        if hit is None:
+            return False, None, None
+        return True, hit[0], hit[1]
+
+    def ambiguous(self) -> Dict[str, List[str]]:
+        """Return task ids listed by more than one repo, with those repos."""
+        return {task_id: repos for task_id, repos in self.owners.items() if len(repos) > 1}
+
+
+# State handed to forked scoring workers; populated only while a pool is alive.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _fork_context():
+    """Return the 'fork' multiprocessing context, or None where unsupported.
+
+    The scanner is loaded from its file path rather than imported, so spawned
+    interpreters could not re-import it; forked workers inherit it instead.
+    """
+    import multiprocessing
+
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+
+def _score_task_in_worker(task_id: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]:
+    """Pool entry point: score one task using the inherited `_WORKER_STATE`.
+
+    When profiling, the phases recorded for this task are returned so the
+    parent can merge them.
+    """
+    scanner = _WORKER_STATE["scanner"]
+    profiler = scanner.profiler
+    if profiler is not None:
+        profiler.phases = {}
+    try:
+        res = scanner._score_task(task_id, _WORKER_STATE["tasks"][task_id], _WORKER_STATE["ctx"])
+        return task_id, res, None, profiler.snapshot() if profiler is not None else None
+    except Exception as exc:
+        return task_id, None, f"{type(exc).__name__}: {exc}", None
+
+
+@contextlib.contextmanager
+def _module_registered_for_pickling():
+    """Make the pool entry points resolvable by module name while a pool runs.
+
+    Loading this file through importlib/runpy does not register it in
+    `sys.modules`, and pickle needs that to send the worker function to the
+    pool. A minimal stand-in module is registered for the duration and the
+    previous entry (if any) is restored afterwards.
+    """
+    name = _score_task_in_worker.__module__
+    previous = sys.modules.get(name)
+    if previous is not None and getattr(previous, "_score_task_in_worker", None) is _score_task_in_worker:
+        yield
+        return
+    stand_in = types.ModuleType(name)
+    stand_in._score_task_in_worker = _score_task_in_worker
+    stand_in._scan_repo_in_worker = globals()["_scan_repo_in_worker"]
+    sys.modules[name] = stand_in
+    try:
+        yield
+    finally:
+        if previous is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = previous
+
+
+# canonical default weights (implementation-focused), used when
+# scoring_kpis.yml provides no `score_weights`
+DEFAULT_SCORE_WEIGHTS: Dict[str, int] = {
+    "STRUCTURAL_COMPLETENESS": 25,
+    "IMPLEMENTATION_COMPLETENESS": 25,
+    "PIPELINE_STAGE_COMPLETENESS": 10,
+    "VALIDATOR_COMPLETENESS": 10,
+
+    "CODE_ARTIFACT_PRESENT": 10,
+    "TESTS_PASS": 10,
+    "SPEC_COVERAGE": 5,
+    "COMPLEXITY_PROFILE": 3,
+    "DOCUMENTATION": 2,
+}
+
+# Progress KPIs are strictly implementation-focused. Per specification
+# progress_score must be computed only from implementation signals and
+# tests evidence.
+DEFAULT_PROGRESS_KPIS: List[str] = [
+    "STRUCTURAL_COMPLETENESS",
+    "IMPLEMENTATION_COMPLETENESS",
+    "PIPELINE_STAGE_COMPLETENESS",
+    "VALIDATOR_COMPLETENESS",
+    "COMPLEXITY_PROFILE",
+    "TESTS_PASS",
+]
+
+# Compliance KPIs are policy/metadata oriented.
+DEFAULT_COMPLIANCE_KPIS: List[str] = [
+    "SPEC_COVERAGE",
+    "DOCUMENTATION",
+    "SANITY_GATE",
+    "STATE_TRANSITION",
+]
+
+# Map done_contract names to KPI metric keys
+DONE_CONTRACT_KPIS: Dict[str, str] = {
+    "implementation_files_present": "CODE_ARTIFACT_PRESENT",
+    "tests_pass": "TESTS_PASS",
+    "state_transition_implemented": "STATE_TRANSITION",
+    "dependency_fulfilled": "DEPENDENCY_FULFILLED",
+}
+
+
+def _normalize_score_weights(sk: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the KPI weights from a loaded `scoring_kpis.yml`.
+
+    Explicit `score_weights` are authoritative (not merged with the
+    defaults); otherwise `DEFAULT_SCORE_WEIGHTS` apply.
+    """
+    user_sw = sk.get("score_weights", None)
+    if isinstance(user_sw, dict) and user_sw:
+        score_weights: Dict[str, Any] = {}
+        for k, v in user_sw.items():
+            try:
+                score_weights[str(k)] = float(v)
+            except Exception:
+                score_weights[str(k)] = v
+        return score_weights
+    return dict(DEFAULT_SCORE_WEIGHTS)
+
+
+def _normalize_gate_caps(sk: Dict[str, Any]) -> Dict[str, int]:
+    """Return `gates` as a KPI -> cap mapping.
+
+    Gates may be a dict mapping KPI->cap (preferred) or a list of KPI names
+    (legacy, each capped at 50).
+    """
+    raw_gates = sk.get("gates", {})
+    if isinstance(raw_gates, dict):
+        return {k: int(v) for k, v in raw_gates.items()}
+    if isinstance(raw_gates, list):
+        return {k: 50 for k in raw_gates}
+    return {}
+
+
+def _kpi_groups(sk: Any) -> Tuple[List[str], List[str]]:
+    """Return the (progress, compliance) KPI lists, honouring `kpi_groups`."""
+    kpi_groups = (sk or {}).get("kpi_groups", {}) if isinstance(sk, dict) else {}
+    return kpi_groups.get("progress", DEFAULT_PROGRESS_KPIS), kpi_groups.get("compliance", DEFAULT_COMPLIANCE_KPIS)
+
+
+def _group_weights(sk: Any) -> Tuple[float, float]:
+    """Return the (progress, compliance) weights from `group_weights`."""
+    group_weights = (sk or {}).get("group_weights", {}) if isinstance(sk, dict) else {}
+    try:
+        pw = float(group_weights.get("progress", 1.0))
+    except Exception:
+        pw = 1.0
+    try:
+        cw = float(group_weights.get("compliance", 1.0))
+    except Exception:
+        cw = 1.0
+    return pw, cw
+
+
+def _load_numpy():
+    """Return the numpy module, or None when it is not installed."""
+    try:
+        import numpy
+
+        return numpy
+    except Exception:
+        return None
+
+
+class KPIMatrix:
+    """Tasks x KPIs matrix of raw KPI values for vectorized re-scoring.
+
+    `from_results` rebuilds the raw per-task KPI values from `scoring_loop`
+    output (or a saved `repos_index` entry's `scoring`) so alternative
+    weightings can be evaluated without re-scanning any code. `rescore`
+    repeats the weighted score, gate caps, `done_contract` enforcement,
+    progress/compliance split and task-type multiplier of `_score_task`
+    for every task at once and returns identical integers for the same
+    configuration.
+
+    NumPy (the optional `perf` extra, `pip install .[perf]`) is used when
+    installed; otherwise an equivalent pure-Python path runs. Not-applicable
+    KPIs are stored as NaN (NumPy) or None.
+    """
+
+    def __init__(
+        self,
+        task_ids: List[str],
+        kpis: List[str],
+        rows: List[List[Optional[float]]],
+        required: List[List[str]],
+        task_types: List[str],
+        scoring_kpis: Optional[Dict[str, Any]] = None,
+        use_numpy: Optional[bool] = None,
+    ):
+        self.task_ids = list(task_ids)
+        self.kpis = list(kpis)
+        self.scoring_kpis = scoring_kpis if isinstance(scoring_kpis, dict) else {}
+        self.task_types = list(task_types)
+        self._col = {k: j for j, k in enumerate(self.kpis)}
+        self._np = _load_numpy() if use_numpy is not False else None
+        if use_numpy and self._np is None:
+            raise ImportError("numpy is required for use_numpy=True")
+        self._rows = [list(r) for r in rows]
+        # required KPIs per task, restricted to KPIs present in the matrix
+        self._required = [[k for k in req if k in self._col] for req in required]
+        if self._np is not None:
+            np = self._np
+            self.values = np.array(
+                [[np.nan if v is None else float(v) for v in r] for r in self._rows], dtype=float
+            ).reshape(len(self._rows), len(self.kpis))
+            self.applicable = ~np.isnan(self.values)
+            self.required_mask = np.zeros(self.values.shape, dtype=bool)
+            for i, req in enumerate(self._required):
+                for k in req:
+                    self.required_mask[i, self._col[k]] = True
+        else:
+            self.values = self._rows
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Dict[str, Any],
+        project_map: Optional[Dict[str, Any]] = None,
+        scoring_kpis: Optional[Dict[str, Any]] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> "KPIMatrix":
+        """Build the matrix from per-task results and the inputs they were scored with.
+
+        Output metrics map not-applicable KPIs to 0.5; the only such KPI,
+        STATE_TRANSITION, is restored to "not applicable" when the task
+        neither required it in `done_contract` nor had it weighted.
+        """
+        pm = project_map if isinstance(project_map, dict) else {}
+        sk = scoring_kpis if isinstance(scoring_kpis, dict) else {}
+        score_weights = _normalize_score_weights(sk)
+        task_ids = [t for t, r in results.items() if isinstance(r, dict) and isinstance(r.get("metrics"), dict)]
+        kpis: List[str] = []
+        for t in task_ids:
+            for k in results[t]["metrics"]:
+                if k not in kpis:
+                    kpis.append(k)
+        rows: List[List[Optional[float]]] = []
+        required: List[List[str]] = []
+        task_types: List[str] = []
+        for t in task_ids:
+            res = results[t]
+            entry = pm.get(t) if isinstance(pm.get(t), dict) else {}
+            done = entry.get("done_contract") if isinstance(entry.get("done_contract"), list) else []
+            state_required = "state_transition_implemented" in done or "STATE_TRANSITION" in score_weights
+            row: List[Optional[float]] = []
+            for k in kpis:
+                v = res["metrics"].get(k)
+                if v is None or (k == "STATE_TRANSITION" and not state_required):
+                    row.append(None)
+                else:
+                    row.append(float(v))
+            rows.append(row)
+            required.append([DONE_CONTRACT_KPIS[d] for d in done if isinstance(d, str) and d in DONE_CONTRACT_KPIS])
+            task_types.append(str(res.get("task_type", "pipeline_stage")))
+        return cls(task_ids, kpis, rows, required, task_types, sk, use_numpy=use_numpy)
+
+    def rescore(
+        self,
+        weights: Optional[Dict[str, Any]] = None,
+        gates: Optional[Any] = None,
+        task_type_weights: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """Recompute scores for every task under an alternative configuration.
+
+        `weights`, `gates` and `task_type_weights` take the same shapes as
+        the `score_weights`, `gates` and `task_type_weights` keys of
+        `scoring_kpis.yml`; None keeps the value the matrix was built with.
+        Returns task_id -> {pre_gate_score, post_gate_score, progress_score,
+        compliance_score, combined_score, final_score}.
+        """
+        sk = dict(self.scoring_kpis)
+        if weights is not None:
+            sk["score_weights"] = weights
+        if gates is not None:
+            sk["gates"] = gates
+        if task_type_weights is not None:
+            sk["task_type_weights"] = task_type_weights
+        score_weights = _normalize_score_weights(sk)
+        gate_caps = _normalize_gate_caps(sk)
+        type_weights = sk.get("task_type_weights", {}) or {}
+        progress_kpis, compliance_kpis = _kpi_groups(sk)
+        pw, cw = _group_weights(sk)
+        config = {
+            "weights": [(k, float(w)) for k, w in score_weights.items()],
+            "total_weight": sum(float(v) for v in score_weights.values()) if score_weights else 100.0,
+            "gate_caps": gate_caps,
+            "progress": [(k, float(score_weights.get(k, 0.0))) for k in progress_kpis],
+            "compliance": [(k, float(score_weights.get(k, 0.0))) for k in compliance_kpis],
+            "compliance_kpis": compliance_kpis,
+            "pw": pw,
+            "cw": cw,
+            "type_mult": [float(type_weights.get(t, 1.0)) for t in self.task_types],
+        }
+        if config["total_weight"] == 0:
+            raise ZeroDivisionError("score weights sum to zero")
+        if not self.task_ids:
+            return {}
+        if self._np is not None:
+            scores = self._rescore_numpy(config)
+        else:
+            scores = self._rescore_python(config)
+        names = ("pre_gate_score", "post_gate_score", "progress_score", "compliance_score", "combined_score", "final_score")
+        return {t: dict(zip(names, (int(v) for v in row))) for t, row in zip(self.task_ids, scores)}
+
+    def _rescore_python(self, config: Dict[str, Any]) -> List[Tuple[int, ...]]:
+        out = []
+        for i, row in enumerate(self._rows):
+            def kpi(k: str) -> Optional[float]:
+                j = self._col.get(k)
+                return None if j is None else row[j]
+
+            def weighted_sum(pairs: List[Tuple[str, float]]) -> float:
+                acc = 0.0
+                for k, w in pairs:
+                    v = kpi(k)
+                    acc += w * (0.5 if v is None else v)
+                return acc
+
+            pre = int(round((weighted_sum(config["weights"]) / config["total_weight"]) * 100.0))
+            subsets = []
+            for group in ("progress", "compliance"):
+                total = sum(w for _, w in config[group])
+                subsets.append((0 if total <= 0.0 else int(round((weighted_sum(config[group]) / total) * 100.0)), total))
+            (progress, p_total), (compliance, c_total) = subsets
+            if p_total <= 0.0 and c_total <= 0.0:
+                progress = compliance = pre
+            post = pre
+            for g, cap in config["gate_caps"].items():
+                v = kpi(g)
+                if v is not None and v < 1.0:
+                    post = min(post, cap)
+                    if g in config["compliance_kpis"]:
+                        compliance = min(compliance, cap)
+            hard_zero = False
+            for rk in self._required[i]:
+                v = kpi(rk)
+                if v is None:
+                    continue
+                if v == 0.0:
+                    post = compliance = 0
+                    hard_zero = True
+                    break
+                if v < 1.0:
+                    post = min(post, 50)
+                    if rk in config["compliance_kpis"]:
+                        compliance = min(compliance, 50)
+            pw, cw = config["pw"], config["cw"]
+            denom = pw + cw if (pw + cw) != 0 else 1.0
+            combined = 0 if hard_zero else int(round((float(progress) * pw + float(compliance) * cw) / denom))
+            final = int(round(combined * config["type_mult"][i]))
+            out.append((pre, post, progress, compliance, combined, final))
+        return out
+
+    def _rescore_numpy(self, config: Dict[str, Any]) -> List[Tuple[int, ...]]:
+        np = self._np
+        n = len(self.task_ids)
+        neutral = np.where(self.applicable, self.values, 0.5)
+
+        def weighted_sum(pairs: List[Tuple[str, float]]):
+            # accumulate column by column in configuration order so the float
+            # results match the per-task loop bit for bit
+            acc = np.zeros(n)
+            for k, w in pairs:
+                j = self._col.get(k)
+                acc = acc + (w * (neutral[:, j] if j is not None else 0.5))
+            return acc
+
+        pre = np.round((weighted_sum(config["weights"]) / config["total_weight"]) * 100.0)
+        groups = []
+        for group in ("progress", "compliance"):
+            total = sum(w for _, w in config[group])
+            if total <= 0.0:
+                groups.append((np.zeros(n), total))
+            else:
+                groups.append((np.round((weighted_sum(config[group]) / total) * 100.0), total))
+        (progress, p_total), (compliance, c_total) = groups
+        if p_total <= 0.0 and c_total <= 0.0:
+            progress = compliance = pre
+        post = pre.copy()
+        compliance = compliance.copy()
+        unmet = self.applicable & (self.values < 1.0)
+        for g, cap in config["gate_caps"].items():
+            j = self._col.get(g)
+            if j is None:
+                continue
+            post = np.where(unmet[:, j], np.minimum(post, cap), post)
+            if g in config["compliance_kpis"]:
+                compliance = np.where(unmet[:, j], np.minimum(compliance, cap), compliance)
+        required = self.required_mask & self.applicable
+        hard_zero = (required & (self.values == 0.0)).any(axis=1)
+        partial = required & unmet
+        post = np.where(partial.any(axis=1), np.minimum(post, 50), post)
+        in_compliance = np.array([k in config["compliance_kpis"] for k in self.kpis], dtype=bool)
+        compliance = np.where((partial & in_compliance).any(axis=1), np.minimum(compliance, 50), compliance)
+        post = np.where(hard_zero, 0, post)
+        compliance = np.where(hard_zero, 0, compliance)
+        pw, cw = config["pw"], config["cw"]
+        denom = pw + cw if (pw + cw) != 0 else 1.0
+        combined = np.where(hard_zero, 0, np.round((progress * pw + compliance * cw) / denom))
+        final = np.round(combined * np.array(config["type_mult"]))
+        stacked = np.stack([pre, post, progress, compliance, combined, final], axis=1).astype(np.int64)
+        return [tuple(int(v) for v in row) for row in stacked.tolist()]
+
+
+class PhaseProfiler:
+    """Accumulates wall time, call counts and files touched per scanner phase.
+
+    Pass one to `PILScanner(profiler=...)` or `aggregate_all_repos` to
+    instrument a run; `report()` returns a JSON-ready summary. Without a
+    profiler the instrumented code paths enter a shared no-op context.
+    Phases nest (e.g. `task.*` inside `scoring_loop`), so their times do not
+    add up. Work done in pool workers is merged back, which makes the times
+    of parallel phases summed worker time rather than elapsed time.
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, Dict[str, float]] = {}
+
+    def record(self, name: str, seconds: float, files: int = 0, calls: int = 1) -> None:
+        stat = self.phases.get(name)
+        if stat is None:
+            stat = self.phases[name] = {"wall_s": 0.0, "calls": 0, "files": 0}
+        stat["wall_s"] += seconds
+        stat["calls"] += calls
+        stat["files"] += files
+
+    def add_files(self, name: str, files: int) -> None:
+        """Attribute `files` more touched files to `name` without a call."""
+        self.record(name, 0.0, files, calls=0)
+
+    @contextlib.contextmanager
+    def phase(self, name: str, files: int = 0):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, files)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {name: dict(stat) for name, stat in self.phases.items()}
+
+    def merge(self, snapshot: Optional[Dict[str, Dict[str, float]]]) -> None:
+        """Fold a `snapshot()` taken elsewhere (e.g. in a worker) into this profiler."""
+        for name, stat in (snapshot or {}).items():
+            self.record(name, stat.get("wall_s", 0.0), int(stat.get("files", 0)), calls=int(stat.get("calls", 0)))
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "phases": {
+                name: {"wall_s": round(stat["wall_s"], 6), "calls": int(stat["calls"]), "files": int(stat["files"])}
+                for name, stat in sorted(self.phases.items())
+            }
+        }
+
+
+# shared no-op context entered by instrumented phases when profiling is off
+_NULL_PHASE = contextlib.nullcontext()
+
+
+def score_deltas(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Return `{task_id: {"before": old, "after": new}}` for tasks whose final_score changed.
+
+    Tasks only present in `after` have `before` None and vice versa. Non-task
+    results (e.g. the UNABLE_TO_SCORE sentinel) contribute no entries.
+    """
+
+    def final_scores(results: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            tid: res.get("final_score")
+            for tid, res in (results or {}).items()
+            if isinstance(res, dict) and "final_score" in res
+        }
+
+    old, new = final_scores(before), final_scores(after)
+    out: Dict[str, Dict[str, Any]] = {}
+    for tid in sorted(set(old) | set(new)):
+        if tid not in old or tid not in new or old[tid] != new[tid]:
+            out[tid] = {"before": old.get(tid), "after": new.get(tid)}
+    return out
+
 
 class PILScanner:
     """Scanner class responsible for reading PIL contracts and running checks.
@@ -31,8 +1494,21 @@ class PILScanner:
     files are missing.
     """
 
-    def __init__(self, repo_path: str):
+    def __init__(
+        self,
+        repo_path: str,
+        use_cache: bool = False,
+        cache_dir: Optional[str] = None,
+        jobs: int = 1,
+        profiler: Optional[PhaseProfiler] = None,
+    ):
         self.repo_path = Path(repo_path)
+        # number of worker processes used to score tasks (1 = serial)
+        self.jobs = max(1, int(jobs or 1))
+        # persistent signal cache (`.pil_cache/` by default); opt-in so library
+        # use stays free of filesystem side effects
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
         self.repo_contract_path = self.repo_path / "repo_contract.yml"
         self.project_map_path = self.repo_path / "project_map.yml"
         self.scoring_kpis_path = self.repo_path / "scoring_kpis.yml"
@@ -41,8 +1517,21 @@ class PILScanner:
         # in-memory caches
         self._hash_cache: Dict[str, str] = {}
         self._loaded_repo_contract: Optional[Dict[str, Any]] = None
+        # scan-scoped module index; set for the duration of `scoring_loop`
+        self._module_index: Optional[ModuleIndex] = None
+        # filled by an incremental `scoring_loop`: task fingerprints, the
+        # dependency checks folded into them and which tasks were re-scored
+        self.incremental_state: Optional[Dict[str, Any]] = None
+        # optional phase timing (see `PhaseProfiler`); None disables it
+        self.profiler = profiler
 
     # ------------------------ Utility functions ------------------------
+    def _phase(self, name: str, files: int = 0):
+        """Return a context timing phase `name`, or a no-op when not profiling."""
+        if self.profiler is None:
+            return _NULL_PHASE
+        return self.profiler.phase(name, files)
+
     def calculate_artifact_hash(self, file_path: str) -> str:
         """Return SHA-256 hex digest for `file_path`.
 
@@ -72,78 +1561,122 @@ class PILScanner:
          - a string: function name that must be present
          - a dict: {"function": name, "params": [p1, p2], "decorator": "name"}
 
-        Returns (is_compliant, diagnostic_message).
+        Returns (is_compliant, diagnostic_message). Use `ast_check_batch` to
+        check many signatures without re-parsing the same file.
         """
-        p = Path(file_path)
-        if not p.exists():
-            return False, f"File not found: {file_path}"
-
-        try:
-            src = p.read_text(encoding="utf-8")
-            tree = ast.parse(src)
-        except Exception as e:
-            return False, f"AST parse error: {e}"
-
-        # Normalize required_signature
-        if isinstance(required_signature, str):
-            func_name = required_signature
-            required_params = None
-            decorator = None
-        elif isinstance(required_signature, dict):
-            func_name = required_signature.get("function")
-            required_params = required_signature.get("params")
-            decorator = required_signature.get("decorator")
-        else:
-            return False, "Unsupported required_signature format"
+        return self._signature_verdict(Path(file_path), str(file_path), required_signature)
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if func_name and node.name != func_name:
-                    continue
+    def ast_check_batch(self, checks: Dict[str, List[Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Check many `ast_check` signatures, parsing each file once.
 
-                # check params if requested
-                if required_params is not None:
-                    arg_names = [a.arg for a in node.args.args]
-                    # drop 'self' when present for methods
-                    if arg_names and arg_names[0] == "self":
-                        arg_names = arg_names[1:]
-                    if arg_names != required_params:
-                        return (
-                            False,
-                            f"Function '{node.name}' parameters mismatch: expected {required_params}, found {arg_names}",
-                        )
-
-                # check decorator if requested
-                if decorator:
-                    dec_names = []
-                    for d in node.decorator_list:
-                        if isinstance(d, ast.Name):
-                            dec_names.append(d.id)
-                        elif isinstance(d, ast.Attribute):
-                            dec_names.append(d.attr)
-                        else:
-                            dec_names.append(ast.dump(d))
-                    if decorator not in dec_names:
-                        return (
-                            False,
-                            f"Decorator '{decorator}' not found on function '{node.name}' (found: {dec_names})",
-                        )
-
-                # all requested checks passed for this function
-                return True, f"Function '{node.name}' compliant"
+        `checks` maps a file path (relative paths are taken from the repo
+        root) to a list of required signatures. Returns the same keys, each
+        with one `{"signature", "compliant", "diagnostic"}` verdict per
+        signature, in order. Inside a scan the parsed modules are shared
+        with every other batch of that scan.
+        """
+        out: Dict[str, List[Dict[str, Any]]] = {}
+        for file_path, signatures in (checks or {}).items():
+            p = Path(str(file_path))
+            if not p.is_absolute():
+                p = self.repo_path / p
+            if isinstance(signatures, (str, dict)):
+                signatures = [signatures]
+            verdicts = []
+            for sig in signatures or []:
+                ok, diag = self._signature_verdict(p, str(file_path), sig)
+                verdicts.append({"signature": sig, "compliant": ok, "diagnostic": diag})
+            out[file_path] = verdicts
+        return out
 
-        return False, f"Required function '{func_name}' not found in {file_path}"
+    def _signature_verdict(self, path: Path, display: str, required_signature: Any) -> Tuple[bool, str]:
+        defs, error = self._index().function_defs(path)
+        if error == "missing":
+            return False, f"File not found: {display}"
+        if defs is None:
+            return False, f"AST parse error: {error}"
+        return defs.check(required_signature, display)
 
     # ------------------------ Implementation signal scanners ------------------
     def _gather_python_files(self) -> List[Path]:
         """Return a sorted list of .py files under the repository (deterministic)."""
-        files = []
-        for p in sorted(self.repo_path.rglob("*.py")):
-            # skip common virtualenv or hidden dirs
-            if any(part.startswith(".") or part in (".venv", "venv", "__pycache__") for part in p.parts):
-                continue
-            files.append(p)
-        return files
+        # a repository that itself lives in a hidden or virtualenv dir yields nothing
+        if any(part.startswith(".") or part in (".venv", "venv", "__pycache__") for part in self.repo_path.parts):
+            return []
+        return self._inventory().suffix(".py")
+
+    def _scan_ignore(self) -> List[str]:
+        """Return the `scan_ignore` list from `repo_contract.yml`, if any."""
+        contract = self._loaded_repo_contract
+        if contract is None and self.repo_contract_path.exists():
+            try:
+                import yaml
+
+                contract = yaml.safe_load(self.repo_contract_path.read_text(encoding="utf-8"))
+            except Exception:
+                contract = None
+        if isinstance(contract, dict) and isinstance(contract.get("scan_ignore"), list):
+            return [str(x) for x in contract["scan_ignore"]]
+        return []
+
+    def _scan_artifact_hash(self, file_path: str) -> str:
+        """`calculate_artifact_hash`, memoized on the active scan's `ModuleIndex`."""
+        hashes = self._index().content_hashes
+        digest = hashes.get(file_path)
+        if digest is None:
+            digest = hashes[file_path] = self.calculate_artifact_hash(file_path)
+        return digest
+
+    def _inventory(self) -> FileInventory:
+        """Return the `FileInventory` for the active scan, walking the tree once.
+
+        Outside of a scan a fresh inventory is built on every call.
+        """
+        index = self._module_index
+        if index is not None and index.inventory is not None:
+            return index.inventory
+        with self._phase("file_inventory"):
+            inventory = FileInventory(self.repo_path, self._scan_ignore())
+        if self.profiler is not None:
+            self.profiler.add_files("file_inventory", len(inventory.files))
+        if index is not None:
+            index.inventory = inventory
+        return inventory
+
+    @contextlib.contextmanager
+    def scan_scope(self):
+        """Keep one `ModuleIndex` alive across several scanner calls.
+
+        Every file is parsed at most once inside the scope, and the persistent
+        signal cache (when enabled) is flushed on exit. Nested scopes reuse
+        the outer index. Yields the active index.
+        """
+        if self._module_index is not None:
+            yield self._module_index
+            return
+        cache = SignalCache(self.repo_path, self.cache_dir) if self.use_cache else None
+        index = ModuleIndex(self.repo_path, cache=cache, profiler=self.profiler)
+        self._module_index = index
+        try:
+            yield index
+        finally:
+            with self._phase("signal_cache_save"):
+                index.save()
+            self._module_index = None
+
+    def _index(self) -> ModuleIndex:
+        """Return the active scan-scoped `ModuleIndex`.
+
+        Outside of `scoring_loop` a fresh transient index is returned so
+        standalone calls always observe the current file contents.
+        """
+        if self._module_index is not None:
+            return self._module_index
+        return ModuleIndex(self.repo_path, profiler=self.profiler)
+
+    def _repo_python_files(self) -> List[Path]:
+        """Return `_gather_python_files()`; the inventory is shared for the active scan."""
+        return self._gather_python_files()
 
     def discover_impl_files(self, declared_impl_files: Optional[List[str]] = None) -> List[str]:
         """Discover implementation .py files under `src/`.
@@ -151,7 +1684,7 @@ class PILScanner:
         Rules:
         - Scan `src/` recursively for `.py` modules
         - Exclude any path segment named `tests` or files starting with `test_`
-        - Exclude `__pycache__` directories
+        - Exclude `__pycache__` and any directory pruned by the `FileInventory`
         - Return absolute, resolved string paths
         - Deduplicate with `declared_impl_files` (exclude declared paths from results)
         """
@@ -159,38 +1692,24 @@ class PILScanner:
         src_root = self.repo_path / "src"
         declared_set = set()
         if declared_impl_files:
+            index = self._index()
             for f in declared_impl_files:
                 try:
-                    p = Path(f)
-                    if not p.is_absolute():
-                        p = (self.repo_path / p).resolve()
-                    else:
-                        p = p.resolve()
-                    declared_set.add(str(p))
+                    declared_set.add(index.resolve(f if os.path.isabs(f) else self.repo_path / f))
                 except Exception:
                     continue
 
         if not src_root.exists():
             return []
 
-        for p in sorted(src_root.rglob("*.py")):
-            # skip __pycache__ and hidden/venv dirs
-            if any(part in ("__pycache__", "venv", ".venv") for part in p.parts):
-                continue
-            # skip tests folders or files beginning with test_
-            if any(part.lower() == "tests" for part in p.parts):
-                continue
-            if p.name.startswith("test_") or p.name.startswith("tests_"):
-                continue
-            try:
-                rp = p.resolve()
-                rs = str(rp)
-                if rs in declared_set:
-                    # deduplicate: do not return declared files
-                    continue
-                out.append(rs)
-            except Exception:
+        # path segments above `src/` are subject to the same exclusions
+        if any(part in ("__pycache__", "venv", ".venv") or part.lower() == "tests" for part in self.repo_path.parts):
+            return []
+        for rs in self._inventory().resolved_impl():
+            if rs in declared_set:
+                # deduplicate: do not return declared files
                 continue
+            out.append(rs)
 
         return out
 
@@ -205,15 +1724,12 @@ class PILScanner:
         # to derive implementation files from the supplied `pm` (project_map);
         # otherwise fall back to scanning all python files in the repository.
         py_files = []
+        index = self._index()
         if impl_files:
             for f in impl_files:
                 try:
-                    p = Path(f)
-                    if not p.is_absolute():
-                        p = (self.repo_path / p).resolve()
-                    else:
-                        p = p.resolve()
-                    if p.exists():
+                    p = index.resolved_path(f if os.path.isabs(f) else self.repo_path / f)
+                    if index.exists(p):
                         py_files.append(p)
                 except Exception:
                     continue
@@ -250,14 +1766,14 @@ class PILScanner:
                     except Exception:
                         continue
             if not py_files:
-                py_files = self._gather_python_files()
+                py_files = self._repo_python_files()
         module_count = len(py_files)
         folder_set = set()
-        for f in py_files:
+        for parent in {str(f.parent) for f in py_files}:
             try:
-                rel = os.path.relpath(str(f.parent), start=str(self.repo_path))
+                rel = os.path.relpath(parent, start=str(self.repo_path))
             except Exception:
-                rel = str(f.parent)
+                rel = parent
             folder_set.add(rel)
         folder_count = len(folder_set)
 
@@ -267,7 +1783,7 @@ class PILScanner:
         present["adapters/"] = any("adapter" in p.name.lower() or "/adapters/" in str(p).lower() for p in py_files)
         present["validators/"] = any("validator" in p.name.lower() or "validate" in p.name.lower() for p in py_files)
         present["tests/"] = (self.repo_path / "test-reports").exists() or any("test_" in p.name or p.name.startswith("test") for p in py_files)
-        present["schemas/"] = any(p.suffix in (".json", ".yaml", ".yml") and "schema" in p.name.lower() for p in sorted(self.repo_path.rglob("*.*")))
+        present["schemas/"] = bool(self._inventory().role("schema"))
         # CLI entrypoint heuristics
         present["cli_entry"] = any(p.name in ("cli.py", "main.py") or (p.name == "__main__.py") for p in py_files)
 
@@ -282,7 +1798,7 @@ class PILScanner:
                 if isinstance(entry, dict):
                     for f in entry.get("implementation_files", []) or []:
                         if isinstance(f, str):
-                            declared_files.append(str((self.repo_path / f).resolve()))
+                            declared_files.append(index.resolve(self.repo_path / f))
         except Exception:
             declared_files = []
 
@@ -292,7 +1808,7 @@ class PILScanner:
         declared_found = 0
         for f in declared_files:
             try:
-                if Path(f).exists():
+                if index.exists(f):
                     declared_found += 1
             except Exception:
                 continue
@@ -332,17 +1848,18 @@ class PILScanner:
         # Prefer scanning the provided implementation files to focus the
         # complexity/profile on the task-level code. If none provided, fall
         # back to scanning all python files in the repository.
+        index = self._index()
         if impl_files:
             py_files = []
             for f in impl_files:
                 try:
                     p = Path(f)
-                    if p.exists():
+                    if index.exists(p):
                         py_files.append(p)
                 except Exception:
                     continue
         else:
-            py_files = self._gather_python_files()
+            py_files = self._repo_python_files()
         modules_found = 0
         functions_found = 0
         classes_found = 0
@@ -354,115 +1871,33 @@ class PILScanner:
         tid_lower = (task_id or "").lower()
 
         for p in py_files:
-            try:
-                src = p.read_text(encoding="utf-8")
-                tree = ast.parse(src)
-            except Exception:
+            facts = index.facts(p)
+            if facts is None:
                 continue
             # module-level name checks (validators module)
-            try:
-                lname = p.name.lower()
-                if lname == "validators.py" or lname.endswith("_validators.py"):
-                    validators_detected += 1
-            except Exception:
-                pass
-
-            # detect imports referencing pipeline modules at the file level
-            file_imports_pipeline = False
-            for n in ast.walk(tree):
-                if isinstance(n, (ast.Import, ast.ImportFrom)):
-                    if isinstance(n, ast.Import):
-                        for a in n.names:
-                            an = (a.name or "").lower()
-                            if any(k in an for k in ("pipeline", "stage", "stages")):
-                                file_imports_pipeline = True
-                                break
-                    else:
-                        mod = (n.module or "").lower()
-                        if any(k in mod for k in ("pipeline", "stage", "stages")):
-                            file_imports_pipeline = True
-                            break
-
-            file_has_impl = False
-            # detect imports that reference pipeline modules (e.g. import pipelines.x)
-            file_imports_pipeline = False
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.Import, ast.ImportFrom)):
-                    # handle Import
-                    if isinstance(node, ast.Import):
-                        for a in node.names:
-                            nm = (a.name or "").lower()
-                            if "pipeline" in nm or "stage" in nm or "stages" in nm:
-                                file_imports_pipeline = True
-                                break
-                    else:
-                        # ImportFrom
-                        mod = (node.module or "").lower()
-                        if "pipeline" in mod or "stage" in mod or "stages" in mod:
-                            file_imports_pipeline = True
-                            break
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    functions_found += 1
-                    file_has_impl = True
-                    name = node.name.lower()
-                    # pipeline stage heuristics
-                    dec_has_stage = any((isinstance(d, ast.Name) and "stage" in d.id.lower()) or (isinstance(d, ast.Attribute) and "stage" in getattr(d, "attr", "").lower()) for d in node.decorator_list)
-                    if "stage" in name or "pipeline" in name or dec_has_stage:
-                        pipeline_stages_detected += 1
-                    if tid_lower and tid_lower in name:
-                        modules_found += 1
-                    # validator heuristics: functions named *validate* OR functions
-                    # with a single non-self argument that return boolean-like values
-                    try:
-                        if "validate" in name:
-                            validators_detected += 1
-                        else:
-                            # count args (allow methods with 'self')
-                            args_len = len(node.args.args)
-                            arg_ok = args_len == 1 or (args_len == 2 and node.args.args and node.args.args[0].arg == 'self')
-                            if arg_ok:
-                                # inspect returns for boolean-like expressions
-                                has_bool_return = False
-                                for sub in ast.walk(node):
-                                    if isinstance(sub, ast.Return) and sub.value is not None:
-                                        rv = sub.value
-                                        if isinstance(rv, ast.Constant) and isinstance(rv.value, bool):
-                                            has_bool_return = True
-                                            break
-                                        if isinstance(rv, (ast.Compare, ast.BoolOp, ast.UnaryOp)):
-                                            has_bool_return = True
-                                            break
-                                if has_bool_return:
-                                    validators_detected += 1
-                    except Exception:
-                        pass
-                if isinstance(node, ast.ClassDef):
-                    classes_found += 1
-                    file_has_impl = True
-                    name = node.name.lower()
-                    if "validator" in name or "validate" in name:
-                        validators_detected += 1
-                    if "adapter" in name:
-                        adapters_detected += 1
-
-                # detect top-level calls to validator factories
-                if isinstance(node, ast.Call):
-                    fn = node.func
-                    fname = None
-                    if isinstance(fn, ast.Name):
-                        fname = fn.id.lower()
-                    elif isinstance(fn, ast.Attribute):
-                        fname = getattr(fn, "attr", "").lower()
-                    if fname and ("validate" in fname or "schema" in fname):
-                        validators_detected += 1
-
-            if file_has_impl and (tid_lower and tid_lower in p.name.lower()):
+            lname = p.name.lower()
+            if lname == "validators.py" or lname.endswith("_validators.py"):
+                validators_detected += 1
+
+            functions_found += facts["functions"]
+            classes_found += facts["classes"]
+            file_has_impl = bool(facts["functions"] or facts["classes"])
+            pipeline_stages_detected += facts["stage_functions"]
+            if tid_lower:
+                modules_found += sum(1 for name in facts["function_names"] if tid_lower in name)
+            # validator heuristics: functions named *validate*, single-argument
+            # functions returning boolean-like values, validator classes and
+            # calls to validator/schema factories
+            validators_detected += (
+                facts["validate_functions"] + facts["bool_validators"] + facts["validator_classes"] + facts["validator_calls"]
+            )
+            adapters_detected += facts["adapter_classes"]
+
+            if file_has_impl and (tid_lower and tid_lower in lname):
                 modules_found += 1
 
             # if file imports indicate pipeline linking, attribute one detection
-            if file_imports_pipeline:
+            if facts["imports_pipeline"]:
                 pipeline_stages_detected += 1
 
         # normalize modules_found: cap at 1 per task signal
@@ -490,94 +1925,23 @@ class PILScanner:
         """
         diagnostics: List[str] = []
         found = False
-
-        # helper sets of known call/function names that often indicate transitions
-        transition_call_names = {"set_state", "change_state", "next_state", "transition_state", "apply_state", "apply_changes"}
+        index = self._index()
 
         for f in impl_files:
-            try:
-                p = Path(f)
-                if not p.exists():
-                    diagnostics.append(f"missing:{f}")
-                    continue
-                src = p.read_text(encoding="utf-8")
-                tree = ast.parse(src)
-            except Exception as e:
-                diagnostics.append(f"parse_error:{f}:{e}")
+            p = Path(f)
+            if not index.exists(p):
+                diagnostics.append(f"missing:{f}")
+                continue
+            facts = index.facts(p)
+            if facts is None:
+                diagnostics.append(f"parse_error:{f}:{index.error(p)}")
                 continue
 
-            # scan AST for multiple heuristic signals
-            for node in ast.walk(tree):
-                # 1) function name or decorated function
-                if isinstance(node, ast.FunctionDef):
-                    name_lower = node.name.lower()
-                    if "transition" in name_lower or name_lower.startswith("apply_") and "transition" in name_lower:
-                        found = True
-                        diagnostics.append(f"found_function:{node.name}@{f}")
-                        break
-
-                    # decorator check
-                    dec_names = set()
-                    for d in node.decorator_list:
-                        # handle simple names, attributes, and calls (e.g. @decorator(), @pkg.decorator)
-                        if isinstance(d, ast.Name):
-                            dec_names.add(d.id)
-                        elif isinstance(d, ast.Attribute):
-                            dec_names.add(getattr(d, "attr", ""))
-                        elif isinstance(d, ast.Call):
-                            # decorator with call: inspect the underlying function
-                            func = d.func
-                            if isinstance(func, ast.Name):
-                                dec_names.add(func.id)
-                            elif isinstance(func, ast.Attribute):
-                                dec_names.add(getattr(func, "attr", ""))
-                        else:
-                            try:
-                                dec_names.add(ast.unparse(d))
-                            except Exception:
-                                pass
-
-                    known = {"state_transition", "transition", "state_change", "transition_decorator"}
-                    if dec_names & known:
-                        found = True
-                        diagnostics.append(f"decorator_state_transition:{node.name}@{f}:{sorted(list(dec_names & known))}")
-                        break
-
-                    # detect functions that take a 'state' param and return something -> likely transition
-                    arg_names = [a.arg for a in node.args.args]
-                    if arg_names and ("state" in arg_names or "old_state" in arg_names or "current_state" in arg_names):
-                        # ensure function has a return statement
-                        has_return = any(isinstance(n, ast.Return) for n in ast.walk(node))
-                        if has_return:
-                            found = True
-                            diagnostics.append(f"func_with_state_param_and_return:{node.name}@{f}:{arg_names}")
-                            break
-
-                # 2) assignment to `.state` attribute (obj.state = ... or self.state = ...)
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Attribute) and getattr(target, "attr", "") in ("state", "status"):
-                            found = True
-                            diagnostics.append(f"assign_attr_state:{f}:{ast.unparse(target) if hasattr(ast, 'unparse') else 'attr'}")
-                            break
-                    if found:
-                        break
-
-                # 3) calls to well-known transition helpers
-                if isinstance(node, ast.Call):
-                    # extract simple call name
-                    func_name = None
-                    if isinstance(node.func, ast.Name):
-                        func_name = node.func.id
-                    elif isinstance(node.func, ast.Attribute):
-                        func_name = getattr(node.func, "attr", None)
-
-                    if func_name and func_name in transition_call_names:
-                        found = True
-                        diagnostics.append(f"call_transition_helper:{func_name}@{f}")
-                        break
-
-            if found:
+            # the first heuristic signal in the module (see `ModuleSignalVisitor`)
+            hit = facts["state_transition"]
+            if hit:
+                found = True
+                diagnostics.append(f"{hit[0]}{f}{hit[1]}")
                 # stop early as one signal suffices
                 break
 
@@ -629,7 +1993,7 @@ class PILScanner:
         # If src missing, determine whether code-based KPIs can run by scanning
         # for any python files outside src. If none, block; else warn but continue.
         if not src_ok:
-            py_files = self._gather_python_files()
+            py_files = self._repo_python_files()
             if not py_files:
                 # no code found -> cannot compute implementation KPIs
                 details["code_present_elsewhere"] = False
@@ -719,44 +2083,23 @@ class PILScanner:
         indicates whether the test passed (True) or failed/skipped (False).
         This is best-effort and non-fatal if files are missing or malformed.
         """
-        out: Dict[str, bool] = {}
-        reports_dir = self.repo_path / "test-reports"
-        if not reports_dir.exists():
-            return out
-
-        for p in sorted(reports_dir.glob("*.xml")):
-            try:
-                tree = ET.parse(str(p))
-                root = tree.getroot()
-                for tc in root.iter("testcase"):
-                    name = tc.attrib.get("name")
-                    classname = tc.attrib.get("classname") or ""
-                    file_attr = tc.attrib.get("file") or ""
-
-                    if file_attr:
-                        key = f"{file_attr}::{name}"
-                    elif classname:
-                        key = f"{classname}::{name}"
-                    else:
-                        key = name or ""
-
-                    passed = True
-                    # if testcase has child elements like failure/error/skipped -> not passed
-                    for child in list(tc):
-                        tag = child.tag.lower()
-                        if tag in ("failure", "error", "skipped"):
-                            passed = False
-                            break
-
-                    if key:
-                        out[key] = passed
-            except Exception:
-                # non-fatal: skip malformed report
-                continue
-
-        return out
-
-    def check_dependencies(self, task_id: str, repos_index: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(self.junit_index().results)
+
+    def junit_index(self) -> JUnitResultIndex:
+        """Return a `JUnitResultIndex` over `test-reports/*.xml`."""
+        with self._phase("junit_parse"):
+            index = JUnitResultIndex.from_reports(self.repo_path / "test-reports")
+        if self.profiler is not None:
+            self.profiler.add_files("junit_parse", index.report_count)
+        return index
+
+    def check_dependencies(
+        self,
+        task_id: str,
+        repos_index: Dict[str, Any],
+        project_map: Optional[Dict[str, Any]] = None,
+        status_index: Optional[TaskStatusIndex] = None,
+    ) -> Dict[str, Any]:
         """Verify prerequisites for `task_id` using `repos_index` and return details.
 
         The `repos_index` shape is flexible; this function will attempt to resolve
@@ -768,7 +2111,12 @@ class PILScanner:
         Returns a dict:
           {"ok": bool, "details": { dep_id: {"found": bool, "status": str|None, "repo": repo_name|None}}}
 
+        A dependency listed by several repos resolves to the first one and its
+        detail carries an `ambiguous` list naming every candidate repo.
+
         The function is deterministic and logs exceptions rather than raising.
+        `project_map` may carry an already-loaded `project_map.yml` and
+        `status_index` a `TaskStatusIndex` built once over `repos_index`.
         """
         details: Dict[str, Any] = {}
         ok = True
@@ -776,7 +2124,9 @@ class PILScanner:
             import yaml
 
             pm: Dict[str, Any] = {}
-            if self.project_map_path.exists():
+            if project_map is not None:
+                pm = project_map
+            elif self.project_map_path.exists():
                 pm = yaml.safe_load(self.project_map_path.read_text(encoding="utf-8")) or {}
 
             task = pm.get(task_id, {})
@@ -786,35 +2136,14 @@ class PILScanner:
             if not deps:
                 return {"ok": True, "details": {}, "message": "no dependencies"}
 
-            # Helper to search repos_index for a dependency
-            def find_dep(d: str) -> Tuple[bool, Optional[str], Optional[str]]:
-                # direct mapping: repos_index.get(d)
-                if isinstance(repos_index, dict) and d in repos_index:
-                    v = repos_index[d]
-                    if isinstance(v, str):
-                        return True, v, None
-                    if isinstance(v, dict) and "status" in v:
-                        return True, v.get("status"), None
-
-                # search repo entries for task_details
-                if isinstance(repos_index, dict):
-                    for repo_name, repo_val in repos_index.items():
-                        if not isinstance(repo_val, dict):
-                            continue
-                        td = repo_val.get("task_details") or repo_val.get("tasks") or {}
-                        if isinstance(td, dict) and d in td:
-                            entry = td[d]
-                            if isinstance(entry, str):
-                                return True, entry, repo_name
-                            if isinstance(entry, dict) and "status" in entry:
-                                return True, entry.get("status"), repo_name
-                # not found
-                return False, None, None
-
+            index = status_index if status_index is not None else TaskStatusIndex(repos_index)
             for d in deps:
-                found, status, repo = find_dep(d)
+                found, status, repo = index.lookup(d)
                 ok_dep = found and (status == "done")
                 details[d] = {"found": found, "status": status, "repo": repo, "satisfied": bool(ok_dep)}
+                candidates = index.owners.get(d, [])
+                if len(candidates) > 1:
+                    details[d]["ambiguous"] = list(candidates)
                 if not ok_dep:
                     ok = False
 
@@ -822,591 +2151,832 @@ class PILScanner:
             logger.exception("check_dependencies failed: %s", exc)
             return {"ok": False, "details": {}, "error": str(exc)}
 
-        return {"ok": bool(ok), "details": details}
+        return {"ok": bool(ok), "details": details}
+
+    # Placeholder methods for the rest of the PHASE 2 features. Implemented later.
+    def scoring_loop(
+        self,
+        repo_totals: Optional[Dict[str, int]] = None,
+        previous: Optional[Dict[str, Any]] = None,
+        dependency_index: Optional[Dict[str, Any]] = None,
+    ):
+        """Primary scoring loop.
+
+        Reads `project_map.yml`, `scoring_kpis.yml`, and `task_contract.yml` when present
+        and computes a deterministic per-task score and detailed metrics.
+
+        Returns a dict mapping `task_id` -> result object containing:
+          - metrics: raw KPI values
+          - pre_gate_score: weighted score before gates
+          - post_gate_score: weighted score after gates
+          - final_score: post_gate_score * task_type_weight
+          - details: diagnostic metadata
+
+        When the scanner was created with `jobs > 1`, tasks are scored on a
+        process pool once the repo-level aggregates are known; the output is
+        identical to the serial path.
+
+        `repo_totals` may carry precomputed `compute_repo_totals()` output so
+        callers that already scanned the repository do not recompute it.
+
+        Passing `previous` (this repo's entry from an earlier `repos_index`,
+        or `{}` on a first run) makes scoring incremental: every task gets a
+        fingerprint of its inputs and tasks whose fingerprint matches
+        `previous["task_fingerprints"]` reuse `previous["scoring"]` unchanged.
+        Dependency statuses resolved against `dependency_index` are part of
+        the fingerprint. Fingerprints and the re-scored task ids are left in
+        `self.incremental_state`.
+        """
+        results: Dict[str, Any] = {}
+        self.incremental_state = None
+        # every file is read and parsed at most once per scan; the index is
+        # shared by all KPI computations below and dropped when the scan ends
+        with self._phase("scoring_loop"), self.scan_scope() as index:
+            try:
+                import yaml
+
+                pm = {}
+                sk = {}
+                tc = {}
+                if self.project_map_path.exists():
+                    pm = yaml.safe_load(self.project_map_path.read_text(encoding="utf-8")) or {}
+                if self.scoring_kpis_path.exists():
+                    sk = yaml.safe_load(self.scoring_kpis_path.read_text(encoding="utf-8")) or {}
+                if self.task_contract_path.exists():
+                    tc = yaml.safe_load(self.task_contract_path.read_text(encoding="utf-8")) or {}
+
+                score_weights = _normalize_score_weights(sk)
+                task_type_weights = sk.get("task_type_weights", {})
+                gate_caps = _normalize_gate_caps(sk)
+
+                # Sanity gate: if the repository-level sanity checks fail, we must not
+                # compute numeric scores. Instead return a sentinel indicating we are
+                # UNABLE_TO_SCORE as required by the PIL spec.
+                with self._phase("sanity_gate"):
+                    sanity = self.run_sanity_gate()
+                if not sanity.get("healthy", False):
+                    return {
+                        "status": "UNABLE_TO_SCORE",
+                        "explanation": "Repository sanity checks failed",
+                        "sanity": sanity.get("details", {}),
+                    }
+
+                # Precompute repository-level expected signals used by IMPLEMENTATION_COMPLETENESS
+                try:
+                    repo_expected_pipeline_stages = sum(1 for t, e in (pm.items()) if isinstance(e, dict) and e.get("task_type") == "pipeline_stage")
+                    repo_expected_validators = sum(1 for t, e in (pm.items()) if isinstance(e, dict) and (e.get("validation_artifacts") or []))
+                except Exception:
+                    repo_expected_pipeline_stages = 0
+                    repo_expected_validators = 0
+
+                # compute median of functions+classes per python file across the repo
+                repo_median_combined = 0
+                with self._phase("median"):
+                    try:
+                        import statistics
+
+                        counts: List[int] = []
+                        for p in self._repo_python_files():
+                            facts = index.facts(p)
+                            if facts is None:
+                                continue
+                            counts.append(facts["functions"] + facts["classes"])
+                        if self.profiler is not None:
+                            self.profiler.add_files("median", len(counts))
+                        if counts:
+                            repo_median_combined = int(statistics.median(counts))
+                        else:
+                            repo_median_combined = 0
+                    except Exception:
+                        repo_median_combined = 0
+
+                task_ctx = {
+                    "pm": pm,
+                    "sk": sk,
+                    "score_weights": score_weights,
+                    "task_type_weights": task_type_weights,
+                    "gate_caps": gate_caps,
+                    "repo_expected_pipeline_stages": repo_expected_pipeline_stages,
+                    "repo_expected_validators": repo_expected_validators,
+                    "repo_median_combined": repo_median_combined,
+                    # complexity normalization denominators, computed once per scan
+                    "repo_totals": dict(repo_totals) if repo_totals is not None else self.compute_repo_totals(),
+                    # JUnit results parsed once and shared by every TESTS_PASS lookup
+                    "junit": self.junit_index(),
+                }
+                task_items = sorted(pm.items())
+                pending = task_items
+                reused: Dict[str, Any] = {}
+                if previous is not None:
+                    with self._phase("incremental_plan", len(task_items)):
+                        pending, reused = self._plan_incremental(task_items, task_ctx, previous, dependency_index)
+                if self.jobs > 1 and len(pending) > 1 and _fork_context() is not None:
+                    self._score_tasks_parallel(pending, task_ctx, results)
+                else:
+                    for task_id, task_entry in pending:
+                        results[task_id] = self._score_task(task_id, task_entry, task_ctx)
+                if reused:
+                    results.update(reused)
+                    results = {task_id: results[task_id] for task_id, _ in task_items}
 
-    # Placeholder methods for the rest of the PHASE 2 features. Implemented later.
-    def scoring_loop(self):
-        """Primary scoring loop.
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.exception("scoring_loop failed: %s", exc)
 
-        Reads `project_map.yml`, `scoring_kpis.yml`, and `task_contract.yml` when present
-        and computes a deterministic per-task score and detailed metrics.
+        return results
 
-        Returns a dict mapping `task_id` -> result object containing:
-          - metrics: raw KPI values
-          - pre_gate_score: weighted score before gates
-          - post_gate_score: weighted score after gates
-          - final_score: post_gate_score * task_type_weight
-          - details: diagnostic metadata
+    def kpi_matrix(self, results: Dict[str, Any], use_numpy: Optional[bool] = None) -> KPIMatrix:
+        """Return a `KPIMatrix` over `scoring_loop` results for what-if re-scoring.
+
+        Reads this repo's `project_map.yml` and `scoring_kpis.yml`, which must
+        be the ones `results` were scored with.
         """
-        results: Dict[str, Any] = {}
+        pm: Dict[str, Any] = {}
+        sk: Dict[str, Any] = {}
         try:
             import yaml
 
-            pm = {}
-            sk = {}
-            tc = {}
             if self.project_map_path.exists():
                 pm = yaml.safe_load(self.project_map_path.read_text(encoding="utf-8")) or {}
             if self.scoring_kpis_path.exists():
                 sk = yaml.safe_load(self.scoring_kpis_path.read_text(encoding="utf-8")) or {}
-            if self.task_contract_path.exists():
-                tc = yaml.safe_load(self.task_contract_path.read_text(encoding="utf-8")) or {}
-
-            # canonical default weights (implementation-focused). User values override these.
-            default_weights = {
-                "STRUCTURAL_COMPLETENESS": 25,
-                "IMPLEMENTATION_COMPLETENESS": 25,
-                "PIPELINE_STAGE_COMPLETENESS": 10,
-                "VALIDATOR_COMPLETENESS": 10,
-
-                "CODE_ARTIFACT_PRESENT": 10,
-                "TESTS_PASS": 10,
-                "SPEC_COVERAGE": 5,
-                "COMPLEXITY_PROFILE": 3,
-                "DOCUMENTATION": 2,
-            }
-            # If user provides explicit score_weights, use them as authoritative
-            # (do not merge with defaults). Otherwise fall back to canonical defaults.
-            user_sw = sk.get("score_weights", None)
-            if isinstance(user_sw, dict) and user_sw:
-                score_weights = {}
-                for k, v in user_sw.items():
-                    try:
-                        score_weights[str(k)] = float(v)
-                    except Exception:
-                        score_weights[str(k)] = v
-            else:
-                score_weights = dict(default_weights)
-
-            task_type_weights = sk.get("task_type_weights", {})
-            # gates may be represented as a dict mapping KPI->cap (preferred),
-            # or as a list of KPI names (legacy). Normalize to gate_caps mapping.
-            raw_gates = sk.get("gates", {})
-            gate_caps: Dict[str, int] = {}
-            if isinstance(raw_gates, dict):
-                # explicit mapping: {"TESTS_PASS": 50}
-                gate_caps = {k: int(v) for k, v in raw_gates.items()}
-            elif isinstance(raw_gates, list):
-                # legacy list -> default cap 50
-                gate_caps = {k: 50 for k in raw_gates}
-
-            # Sanity gate: if the repository-level sanity checks fail, we must not
-            # compute numeric scores. Instead return a sentinel indicating we are
-            # UNABLE_TO_SCORE as required by the PIL spec.
-            sanity = self.run_sanity_gate()
-            if not sanity.get("healthy", False):
-                return {
-                    "status": "UNABLE_TO_SCORE",
-                    "explanation": "Repository sanity checks failed",
-                    "sanity": sanity.get("details", {}),
+        except Exception as exc:
+            logger.warning("kpi_matrix could not read scoring inputs: %s", exc)
+        return KPIMatrix.from_results(results, pm, sk, use_numpy=use_numpy)
+
+    def watch(self, interval: float = 1.0, debounce: float = 0.3, max_updates: Optional[int] = None, sleep=time.sleep):
+        """Keep this scanner resident and yield fresh scores whenever the repo changes.
+
+        The file inventory is polled every `interval` seconds by mtime and
+        size. Once a change is seen, polling continues every `debounce`
+        seconds until the tree holds still, so a burst of saves produces one
+        update. Module facts and content hashes live in one long-lived
+        `ModuleIndex` that only forgets the changed files, and each update is
+        an incremental `scoring_loop` that re-scores only the tasks whose
+        fingerprint changed.
+
+        Yields dicts with `results`, `deltas` (see `score_deltas`), the
+        `rescored` task ids, the repo-relative `changed` paths and
+        `elapsed_s`. The first update is the initial full scan. Stops after
+        `max_updates` updates or when the caller closes the generator.
+        """
+        updates = 0
+        with self.scan_scope() as index:
+            snapshot = self._inventory().stat_snapshot()
+            results: Dict[str, Any] = {}
+            previous: Dict[str, Any] = {}
+            changed: List[str] = []
+            start = time.perf_counter()
+            while True:
+                new_results = self.scoring_loop(previous=previous)
+                state = self.incremental_state or {}
+                yield {
+                    "results": new_results,
+                    "deltas": score_deltas(results, new_results),
+                    "rescored": list(state.get("rescored", [])),
+                    "changed": [os.path.relpath(p, self.repo_path) for p in changed],
+                    "elapsed_s": round(time.perf_counter() - start, 6),
                 }
+                updates += 1
+                if max_updates is not None and updates >= max_updates:
+                    return
+                results = new_results
+                previous = {"scoring": new_results, "task_fingerprints": state.get("fingerprints", {})}
+                inventory, snapshot, changed = self._wait_for_change(snapshot, interval, debounce, sleep)
+                start = time.perf_counter()
+                index.invalidate(changed, inventory)
+
+    def _wait_for_change(
+        self, snapshot: Dict[str, Tuple[int, int]], interval: float, debounce: float, sleep
+    ) -> Tuple[FileInventory, Dict[str, Tuple[int, int]], List[str]]:
+        """Poll until the tree differs from `snapshot`, then until it settles.
+
+        Returns the settled inventory, its stat snapshot and the sorted paths
+        that were added, removed or modified.
+        """
+        while True:
+            sleep(interval)
+            inventory = FileInventory(self.repo_path, self._scan_ignore())
+            current = inventory.stat_snapshot()
+            if current == snapshot:
+                continue
+            while True:
+                sleep(debounce)
+                settled_inventory = FileInventory(self.repo_path, self._scan_ignore())
+                settled = settled_inventory.stat_snapshot()
+                if settled == current:
+                    break
+                inventory, current = settled_inventory, settled
+            changed = sorted(p for p in set(snapshot) | set(current) if snapshot.get(p) != current.get(p))
+            return inventory, current, changed
+
+    def _repo_fingerprint(self, ctx: Dict[str, Any]) -> str:
+        """Digest of the repo-wide inputs every task score depends on.
+
+        Covers the scoring code, `project_map`/`scoring_kpis`, the repo-level
+        aggregates in `ctx` and the file-presence probes used by the
+        structure and documentation KPIs; any change re-scores every task.
+        """
+        index = self._index()
+        pm = ctx["pm"]
+        python_files = self._repo_python_files()
+        declared = set()
+        for entry in pm.values():
+            if isinstance(entry, dict):
+                for f in entry.get("implementation_files", []) or []:
+                    if isinstance(f, str):
+                        declared.add(str((self.repo_path / f).resolve()))
+        docstring = False
+        for p in python_files:
+            facts = index.facts(p)
+            if facts is not None and facts["toplevel_docstring"]:
+                docstring = True
+                break
+        payload = {
+            "scanner": _scoring_fingerprint(),
+            "pm": pm,
+            "sk": ctx["sk"],
+            "aggregates": {
+                k: ctx[k]
+                for k in ("repo_expected_pipeline_stages", "repo_expected_validators", "repo_median_combined", "repo_totals")
+            },
+            "python_files": [str(p) for p in python_files],
+            "schemas": [str(p) for p in self._inventory().role("schema")],
+            "declared_present": sorted(f for f in declared if Path(f).exists()),
+            "markers": {name: (self.repo_path / name).exists() for name in ("README.md", "docs", "src", "test-reports")},
+            "docstring": docstring,
+        }
+        return _digest(payload)
+
+    def _task_fingerprint(
+        self,
+        task_id: str,
+        task_entry: Any,
+        repo_fp: str,
+        junit_fp: str,
+        dependency: Optional[Dict[str, Any]],
+        hashes: Dict[str, str],
+    ) -> str:
+        """Digest of everything `_score_task` reads for one task.
+
+        Hashes the task entry, the content of its declared and discovered
+        implementation files and of any validation artifacts that are files,
+        plus the JUnit results when the task references tests.
+        """
+        entry = task_entry if isinstance(task_entry, dict) else {}
+
+        def file_hash(path: str) -> str:
+            if path not in hashes:
+                hashes[path] = self.calculate_artifact_hash(path)
+            return hashes[path]
+
+        declared = [str((self.repo_path / p).resolve()) for p in entry.get("implementation_files", []) or [] if isinstance(p, str)]
+        impl_files = declared + self.discover_impl_files(declared)
+        artifacts: Dict[str, str] = {}
+        tests_referenced = False
+        for a in entry.get("validation_artifacts", []) or []:
+            if not isinstance(a, str):
+                continue
+            tests_referenced = tests_referenced or "::" in a or a.endswith(".py")
+            p = self.repo_path / a.split("::", 1)[0]
+            if p.is_file():
+                artifacts[a] = file_hash(str(p))
+        signature_files = entry.get("required_signatures")
+        if isinstance(signature_files, dict):
+            for f in map(str, signature_files):
+                p = Path(f) if os.path.isabs(f) else self.repo_path / f
+                artifacts[f"signatures:{f}"] = file_hash(str(p))
+        payload = {
+            "repo": repo_fp,
+            "task": task_id,
+            "entry": task_entry,
+            "impl_files": {f: file_hash(f) for f in impl_files},
+            "artifacts": artifacts,
+            "junit": junit_fp if tests_referenced else None,
+            "dependency": dependency,
+        }
+        return _digest(payload)
+
+    def _plan_incremental(
+        self,
+        task_items: List[Tuple[str, Any]],
+        ctx: Dict[str, Any],
+        previous: Dict[str, Any],
+        dependency_index: Optional[Dict[str, Any]],
+    ) -> Tuple[List[Tuple[str, Any]], Dict[str, Any]]:
+        """Split `task_items` into tasks to score and results to carry forward.
+
+        Records fingerprints, dependency checks and the re-scored task ids in
+        `self.incremental_state`.
+        """
+        previous = previous if isinstance(previous, dict) else {}
+        prev_fps = previous.get("task_fingerprints") or {}
+        prev_scoring = previous.get("scoring") or {}
+        repo_fp = self._repo_fingerprint(ctx)
+        junit_fp = _digest(sorted(ctx["junit"].results.items()))
+        # shared with the scan-scoped index so a resident index hashes each file once
+        hashes = self._index().content_hashes
+        fingerprints: Dict[str, str] = {}
+        dependencies: Dict[str, Any] = {}
+        pending: List[Tuple[str, Any]] = []
+        reused: Dict[str, Any] = {}
+        status_index = TaskStatusIndex(dependency_index or {})
+        for task_id, task_entry in task_items:
+            dependencies[task_id] = self.check_dependencies(task_id, dependency_index or {}, ctx["pm"], status_index)
+            fp = self._task_fingerprint(task_id, task_entry, repo_fp, junit_fp, dependencies[task_id], hashes)
+            fingerprints[task_id] = fp
+            if prev_fps.get(task_id) == fp and isinstance(prev_scoring.get(task_id), dict):
+                reused[task_id] = prev_scoring[task_id]
+            else:
+                pending.append((task_id, task_entry))
+        self.incremental_state = {
+            "fingerprints": fingerprints,
+            "dependencies": dependencies,
+            "rescored": [task_id for task_id, _ in pending],
+        }
+        return pending, reused
 
-            # Precompute repository-level expected signals used by IMPLEMENTATION_COMPLETENESS
-            try:
-                repo_expected_pipeline_stages = sum(1 for t, e in (pm.items()) if isinstance(e, dict) and e.get("task_type") == "pipeline_stage")
-                repo_expected_validators = sum(1 for t, e in (pm.items()) if isinstance(e, dict) and (e.get("validation_artifacts") or []))
-            except Exception:
-                repo_expected_pipeline_stages = 0
-                repo_expected_validators = 0
+    def _score_task(self, task_id: str, task_entry: Any, ctx: Dict[str, Any]) -> Dict[str, Any]:
+        """Score a single `project_map` task against precomputed repo-level context.
 
-            # compute median of functions+classes per python file across the repo
-            repo_median_combined = 0
+        `ctx` carries the aggregates `scoring_loop` computes once per scan
+        (parsed `project_map`/`scoring_kpis`, normalized weights and gates,
+        expected stage/validator counts and the repo median). The method only
+        reads shared state, so tasks can be scored in any order or process.
+        """
+        pm = ctx["pm"]
+        sk = ctx["sk"]
+        score_weights = ctx["score_weights"]
+        task_type_weights = ctx["task_type_weights"]
+        gate_caps = ctx["gate_caps"]
+        repo_expected_pipeline_stages = ctx["repo_expected_pipeline_stages"]
+        repo_expected_validators = ctx["repo_expected_validators"]
+        repo_median_combined = ctx["repo_median_combined"]
+        index = self._index()
+
+        entry = task_entry or {}
+        declared_impl_files = [str((self.repo_path / p).resolve()) for p in entry.get("implementation_files", []) if isinstance(p, str)]
+        val_artifacts = entry.get("validation_artifacts", []) or []
+
+        # Discover inferred implementation files under src/ when declared
+        # files are missing, empty, or incomplete. The discovered files
+        # are deduplicated against declared_impl_files.
+        inferred_impl_files = self.discover_impl_files(declared_impl_files)
+
+        # combine declared + inferred for actual scanning scope
+        used_impl_files: List[str] = []
+        # include declared resolved files that exist
+        for f in declared_impl_files:
             try:
-                import statistics
-
-                counts: List[int] = []
-                for p in self._gather_python_files():
-                    try:
-                        src = p.read_text(encoding="utf-8")
-                        tree = ast.parse(src)
-                    except Exception:
-                        continue
-                    fcount = 0
-                    ccount = 0
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.FunctionDef):
-                            fcount += 1
-                        if isinstance(node, ast.ClassDef):
-                            ccount += 1
-                    counts.append(fcount + ccount)
-                if counts:
-                    repo_median_combined = int(statistics.median(counts))
-                else:
-                    repo_median_combined = 0
+                if index.exists(f):
+                    used_impl_files.append(f)
             except Exception:
-                repo_median_combined = 0
+                continue
+        # supplement with inferred files (deduped by discover_impl_files)
+        used_set = set(used_impl_files)
+        for f in inferred_impl_files:
+            if f not in used_set:
+                used_set.add(f)
+                used_impl_files.append(f)
+
+        # ------------------ Implementation-first KPIs & signals ------------------
+        # gather repo-level structure once (prefer passing used impl files)
+        with self._phase("task.structure", len(used_impl_files)):
+            structure_signals = self.scan_structure(pm, impl_files=used_impl_files)
+
+        # per-task implementation signals (scan both declared and inferred)
+        with self._phase("task.impl_signals", len(used_impl_files)):
+            impl_signals = self.scan_implementation_signals(used_impl_files, task_id)
+
+        # CODE_ARTIFACT_PRESENT: prefer declared files; else infer from code
+        if used_impl_files:
+            exist_status = [self._scan_artifact_hash(f) != MISSING_FILE_HASH for f in used_impl_files]
+            if all(exist_status):
+                code_k = 1.0
+            else:
+                # declared but missing or partially present -> neutral (do not penalize)
+                code_k = 0.5
+        else:
+            # infer from codebase: if any module/function matches task -> 1.0, else 0.5 (unknown)
+            if impl_signals.get("modules_found", 0) > 0 or impl_signals.get("functions_found", 0) > 0:
+                code_k = 1.0
+            else:
+                code_k = 0.5
+
+        # Targeted test aggregation against the scan-wide JUnit index
+        test_results = ctx["junit"]
+
+        def artifact_tests_kpi(a: str) -> float:
+            # if a specific test case is referenced
+            if "::" in a:
+                filepart, testname = a.split("::", 1)
+                key = f"{filepart}::{testname}"
+                if key in test_results:
+                    return 1.0 if test_results.get(key) else 0.0
+                # try matching any key that ends with ::testname
+                v = test_results.by_test_name(testname)
+                if v is not None:
+                    return 1.0 if v else 0.0
+                # targeted tests referenced but not present -> uncertain
+                # Treat missing explicit referenced tests as partial evidence
+                # (0.5) rather than definitive failure (0.0)
+                return 0.5
 
-            for task_id, task_entry in sorted(pm.items()):
-                entry = task_entry or {}
-                declared_impl_files = [str((self.repo_path / p).resolve()) for p in entry.get("implementation_files", []) if isinstance(p, str)]
-                val_artifacts = entry.get("validation_artifacts", []) or []
+            # file-level artifact e.g. tests/foo.py
+            if isinstance(a, str) and a.endswith(".py"):
+                v = test_results.by_file(a)
+                if v is not None:
+                    return 1.0 if v else 0.0
+                # targeted tests do not exist -> uncertain (0.5)
+                return 0.5
 
-                # Discover inferred implementation files under src/ when declared
-                # files are missing, empty, or incomplete. The discovered files
-                # are deduplicated against declared_impl_files.
-                inferred_impl_files = self.discover_impl_files(declared_impl_files)
+            return 0.5
 
-                # combine declared + inferred for actual scanning scope
-                used_impl_files: List[str] = []
-                # include declared resolved files that exist
-                for f in declared_impl_files:
-                    try:
-                        if Path(f).exists():
-                            used_impl_files.append(f)
-                    except Exception:
-                        continue
-                # supplement with inferred files (deduped by discover_impl_files)
-                for f in inferred_impl_files:
-                    if f not in used_impl_files:
-                        used_impl_files.append(f)
-
-                # ------------------ Implementation-first KPIs & signals ------------------
-                # gather repo-level structure once (prefer passing used impl files)
-                structure_signals = self.scan_structure(pm, impl_files=used_impl_files)
-
-                # per-task implementation signals (scan both declared and inferred)
-                impl_signals = self.scan_implementation_signals(used_impl_files, task_id)
-
-                # CODE_ARTIFACT_PRESENT: prefer declared files; else infer from code
-                if used_impl_files:
-                    exist_status = [self.calculate_artifact_hash(f) != MISSING_FILE_HASH for f in used_impl_files]
-                    if all(exist_status):
-                        code_k = 1.0
-                    else:
-                        # declared but missing or partially present -> neutral (do not penalize)
-                        code_k = 0.5
-                else:
-                    # infer from codebase: if any module/function matches task -> 1.0, else 0.5 (unknown)
-                    if impl_signals.get("modules_found", 0) > 0 or impl_signals.get("functions_found", 0) > 0:
-                        code_k = 1.0
-                    else:
-                        code_k = 0.5
-
-                # Targeted test aggregation
-                test_results = self.parse_junit_reports()
-
-                def artifact_tests_kpi(a: str) -> float:
-                    # if a specific test case is referenced
-                    if "::" in a:
-                        filepart, testname = a.split("::", 1)
-                        key = f"{filepart}::{testname}"
-                        if key in test_results:
-                            return 1.0 if test_results.get(key) else 0.0
-                        # try matching any key that ends with ::testname
-                        for k, v in test_results.items():
-                            if k.endswith(f"::{testname}"):
-                                return 1.0 if v else 0.0
-                        # targeted tests referenced but not present -> uncertain
-                        # Treat missing explicit referenced tests as partial evidence
-                        # (0.5) rather than definitive failure (0.0)
-                        return 0.5
-
-                    # file-level artifact e.g. tests/foo.py
-                    if isinstance(a, str) and a.endswith(".py"):
-                        found_any = False
-                        for k, v in test_results.items():
-                            if k.startswith(a) or k.split("::")[0].endswith(a):
-                                found_any = True
-                                if v:
-                                    return 1.0
-                                else:
-                                    return 0.0
-                        # targeted tests do not exist -> uncertain (0.5)
-                        return 0.5
-
-                    return 0.5
-
-                tests_required = [a for a in val_artifacts if ("::" in a) or (isinstance(a, str) and a.endswith(".py"))]
-                if tests_required:
-                    # aggregate: if any referenced test fails -> 0.0, if all pass ->1.0, if some missing ->0.5
-                    vals = [artifact_tests_kpi(a) for a in tests_required]
-                    if all(v == 1.0 for v in vals):
-                        tests_k = 1.0
-                    elif any(v == 0.0 for v in vals) and not all(v == 1.0 for v in vals):
-                        # if any explicit referenced test failed -> 0.0
-                        tests_k = 0.0
-                    else:
-                        tests_k = 0.5
-                else:
-                    tests_k = 0.5
+        tests_required = [a for a in val_artifacts if ("::" in a) or (isinstance(a, str) and a.endswith(".py"))]
+        if tests_required:
+            # aggregate: if any referenced test fails -> 0.0, if all pass ->1.0, if some missing ->0.5
+            vals = [artifact_tests_kpi(a) for a in tests_required]
+            if all(v == 1.0 for v in vals):
+                tests_k = 1.0
+            elif any(v == 0.0 for v in vals) and not all(v == 1.0 for v in vals):
+                # if any explicit referenced test failed -> 0.0
+                tests_k = 0.0
+            else:
+                tests_k = 0.5
+        else:
+            tests_k = 0.5
 
-                # SPEC_COVERAGE -> convert percent to [0.0..1.0]; missing metadata => neutral
-                spec_coverage = self.compute_spec_coverage(entry)
-                spec_k = max(0.0, min(1.0, float(spec_coverage) / 100.0))
+        # SPEC_COVERAGE -> convert percent to [0.0..1.0]; missing metadata => neutral
+        spec_coverage = self.compute_spec_coverage(entry)
+        spec_k = max(0.0, min(1.0, float(spec_coverage) / 100.0))
 
-                # COMPLEXITY_PROFILE -> replaced by implementation richness heuristic
-                # Allow complexity weights/thresholds to be configured via scoring_kpis.yml
-                complexity_cfg = {}
-                try:
-                    complexity_cfg = sk.get("complexity", {}) if isinstance(sk, dict) else {}
-                except Exception:
-                    complexity_cfg = {}
-
-                complexity_score, complexity_details = self.compute_complexity_profile(used_impl_files, complexity_cfg)
-                # New bucketization: thresholds configurable via complexity_cfg["thresholds"] or fall back to defaults
-                thresholds = (complexity_cfg or {}).get("thresholds", {})
-                high_t = int(thresholds.get("high", 70))
-                mid_t = int(thresholds.get("mid", 30))
-                if complexity_score >= high_t:
-                    comp_k = 1.0
-                elif complexity_score >= mid_t:
-                    comp_k = 0.5
-                else:
-                    comp_k = 0.0
+        # COMPLEXITY_PROFILE -> replaced by implementation richness heuristic
+        # Allow complexity weights/thresholds to be configured via scoring_kpis.yml
+        complexity_cfg = {}
+        try:
+            complexity_cfg = sk.get("complexity", {}) if isinstance(sk, dict) else {}
+        except Exception:
+            complexity_cfg = {}
+
+        with self._phase("task.complexity", len(used_impl_files)):
+            complexity_score, complexity_details = self.compute_complexity_profile(used_impl_files, complexity_cfg, repo_totals=ctx["repo_totals"])
+        # New bucketization: thresholds configurable via complexity_cfg["thresholds"] or fall back to defaults
+        thresholds = (complexity_cfg or {}).get("thresholds", {})
+        high_t = int(thresholds.get("high", 70))
+        mid_t = int(thresholds.get("mid", 30))
+        if complexity_score >= high_t:
+            comp_k = 1.0
+        elif complexity_score >= mid_t:
+            comp_k = 0.5
+        else:
+            comp_k = 0.0
 
-                # Implementation-first override: strong implementation signals
-                # (multiple functions or detected pipeline stages) should
-                # elevate complexity KPI to fully satisfied so progress
-                # reflects real implementation work rather than strict
-                # numeric thresholds alone.
-                try:
-                    if impl_signals.get("functions_found", 0) >= 2 or impl_signals.get("pipeline_stages_detected", 0) > 0:
-                        comp_k = 1.0
-                except Exception:
-                    pass
+        # Implementation-first override: strong implementation signals
+        # (multiple functions or detected pipeline stages) should
+        # elevate complexity KPI to fully satisfied so progress
+        # reflects real implementation work rather than strict
+        # numeric thresholds alone.
+        try:
+            if impl_signals.get("functions_found", 0) >= 2 or impl_signals.get("pipeline_stages_detected", 0) > 0:
+                comp_k = 1.0
+        except Exception:
+            pass
 
-                # DOCUMENTATION -> detect README, docs, or inline docstrings
+        # DOCUMENTATION -> detect README, docs, or inline docstrings
+        doc_k = 0.5
+        if (self.repo_path / "README.md").exists() or (self.repo_path / "docs").exists():
+            doc_k = 1.0
+        else:
+            # inspect implementation files for docstrings
+            try:
+                for p in self._repo_python_files():
+                    facts = index.facts(p)
+                    if facts is not None and facts["toplevel_docstring"]:
+                        doc_k = 1.0
+                        break
+            except Exception:
                 doc_k = 0.5
-                if (self.repo_path / "README.md").exists() or (self.repo_path / "docs").exists():
-                    doc_k = 1.0
-                else:
-                    # inspect implementation files for docstrings
-                    try:
-                        for p in self._gather_python_files():
-                            try:
-                                src = p.read_text(encoding="utf-8")
-                                tree = ast.parse(src)
-                                for node in tree.body:
-                                    if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
-                                        if ast.get_docstring(node):
-                                            doc_k = 1.0
-                                            break
-                                if doc_k == 1.0:
-                                    break
-                            except Exception:
-                                continue
-                    except Exception:
-                        doc_k = 0.5
-
-                # New KPIs (implementation-first): STRUCTURAL, IMPLEMENTATION, PIPELINE, VALIDATOR
-                struct_pct = structure_signals.get("percent_structure_complete", 0)
-                if struct_pct >= 80:
-                    struct_k = 1.0
-                elif struct_pct >= 50:
-                    struct_k = 0.5
-                else:
-                    struct_k = 0.0
-
-                # If declared implementation files are missing (empty list) but
-                # code exists (we have inferred or used impl files), ensure we
-                # do not drop STRUCTURAL_COMPLETENESS below neutral (0.5).
-                declared_missing = (len(declared_impl_files) == 0)
-                code_present = bool(used_impl_files)
-                if declared_missing and code_present and struct_k < 0.5:
-                    struct_k = 0.5
-
-                # IMPLEMENTATION_COMPLETENESS (task-level)
-                # Use combined signals from declared + inferred files.
-                detected_functions = impl_signals.get("functions_found", 0)
-                detected_classes = impl_signals.get("classes_found", 0)
-                detected_stages = impl_signals.get("pipeline_stages_detected", 0)
-                detected_validators = impl_signals.get("validators_detected", 0)
-
-                # Pipeline completeness relative to repo expected (use helper)
-                pipeline_score = self.compute_pipeline_stage_completeness(
-                    repo_expected_pipeline_stages,
-                    detected_stages,
-                    impl_signals,
-                    repo_median_combined,
-                    complexity_score,
-                )
-
-                # Validator completeness relative to repo expected (use helper)
-                validator_score = self.compute_validator_subscore(repo_expected_validators, detected_validators)
 
-                # Functions/classes completeness relative to median across repo
-                rich = self.compute_rich_implementation_signals(impl_signals, repo_median_combined, complexity_score)
-                fc_score = rich.get("fc_score", 0.5)
+        # New KPIs (implementation-first): STRUCTURAL, IMPLEMENTATION, PIPELINE, VALIDATOR
+        struct_pct = structure_signals.get("percent_structure_complete", 0)
+        if struct_pct >= 80:
+            struct_k = 1.0
+        elif struct_pct >= 50:
+            struct_k = 0.5
+        else:
+            struct_k = 0.0
+
+        # If declared implementation files are missing (empty list) but
+        # code exists (we have inferred or used impl files), ensure we
+        # do not drop STRUCTURAL_COMPLETENESS below neutral (0.5).
+        declared_missing = (len(declared_impl_files) == 0)
+        code_present = bool(used_impl_files)
+        if declared_missing and code_present and struct_k < 0.5:
+            struct_k = 0.5
+
+        # IMPLEMENTATION_COMPLETENESS (task-level)
+        # Use combined signals from declared + inferred files.
+        detected_functions = impl_signals.get("functions_found", 0)
+        detected_classes = impl_signals.get("classes_found", 0)
+        detected_stages = impl_signals.get("pipeline_stages_detected", 0)
+        detected_validators = impl_signals.get("validators_detected", 0)
+
+        # Pipeline completeness relative to repo expected (use helper)
+        pipeline_score = self.compute_pipeline_stage_completeness(
+            repo_expected_pipeline_stages,
+            detected_stages,
+            impl_signals,
+            repo_median_combined,
+            complexity_score,
+        )
 
-                # Combine sub-scores to form IMPLEMENTATION_COMPLETENESS.
-                # The KPI must be one of the canonical buckets {0.0, 0.5, 1.0}.
-                raw_impl = float((pipeline_score + validator_score + fc_score) / 3.0)
-                if raw_impl >= 0.75:
-                    impl_k = 1.0
-                elif raw_impl >= 0.25:
-                    impl_k = 0.5
-                else:
-                    impl_k = 0.0
+        # Validator completeness relative to repo expected (use helper)
+        validator_score = self.compute_validator_subscore(repo_expected_validators, detected_validators)
 
-                # PIPELINE_STAGE_COMPLETENESS
-                expected_pipeline_stages = sum(1 for t, e in (pm.items()) if isinstance(e, dict) and e.get("task_type") == "pipeline_stage")
-                detected_stages = impl_signals.get("pipeline_stages_detected", 0)
-                pipeline_k = self.compute_pipeline_stage_completeness(
-                    expected_pipeline_stages, detected_stages, impl_signals, repo_median_combined, complexity_score
-                )
+        # Functions/classes completeness relative to median across repo
+        rich = self.compute_rich_implementation_signals(impl_signals, repo_median_combined, complexity_score)
+        fc_score = rich.get("fc_score", 0.5)
 
-                # VALIDATOR_COMPLETENESS (task-level KPI)
-                validator_k = self.compute_validator_kpi(val_artifacts, impl_signals.get("validators_detected", 0))
-
-                # STATE_TRANSITION -> only detect/enforce when listed in done_contract or scored
-                # Determine done_contract entries per task
-                # NOTE: per canonical behavior, only honor `done_contract` when
-                # explicitly provided in the task's `project_map` entry. Do NOT
-                # inherit or fall back to repository-level `task_contract.yml`.
-                done_contract_entries = []
-                if isinstance(entry.get("done_contract"), list):
-                    done_contract_entries = entry.get("done_contract")
-
-                # compute state detection if the task explicitly requires it via
-                # `done_contract` OR if `STATE_TRANSITION` is present in the
-                # configured `score_weights`. This preserves compatibility with
-                # tests that assert detection when the KPI is being scored.
-                state_required = any(d == "state_transition_implemented" for d in (done_contract_entries or [])) or (isinstance(score_weights, dict) and ("STATE_TRANSITION" in score_weights))
-                if state_required:
-                    state_ok, state_details = self.check_state_transition_implemented(used_impl_files)
-                    state_k = 1.0 if state_ok else 0.0
-                else:
-                    state_k = None
-
-                # SANITY_GATE is guaranteed above to be healthy (we returned early otherwise), so set to 1.0
-                sanity_k = 1.0
-
-                # Build KPI map with None for not-applicable
-                metrics_k = {
-                    # Implementation-first KPIs
-                    "STRUCTURAL_COMPLETENESS": struct_k,
-                    "IMPLEMENTATION_COMPLETENESS": impl_k,
-                    "PIPELINE_STAGE_COMPLETENESS": pipeline_k,
-                    "VALIDATOR_COMPLETENESS": validator_k,
-
-                    # Code & tests
-                    "CODE_ARTIFACT_PRESENT": code_k,
-                    "TESTS_PASS": tests_k,
-                    "SPEC_COVERAGE": spec_k,
-                    "COMPLEXITY_PROFILE": comp_k,
-                    "DOCUMENTATION": doc_k,
-
-                    # Other
-                    "SANITY_GATE": sanity_k,
-                    "STATE_TRANSITION": state_k,
-                }
+        # Combine sub-scores to form IMPLEMENTATION_COMPLETENESS.
+        # The KPI must be one of the canonical buckets {0.0, 0.5, 1.0}.
+        raw_impl = float((pipeline_score + validator_score + fc_score) / 3.0)
+        if raw_impl >= 0.75:
+            impl_k = 1.0
+        elif raw_impl >= 0.25:
+            impl_k = 0.5
+        else:
+            impl_k = 0.0
 
-                # ------------------ done_contract enforcement (no hard zeros) ------------------
-                # Map done_contract names to KPI metric keys
-                done_to_kpi = {
-                    "implementation_files_present": "CODE_ARTIFACT_PRESENT",
-                    "tests_pass": "TESTS_PASS",
-                    "state_transition_implemented": "STATE_TRANSITION",
-                    "dependency_fulfilled": "DEPENDENCY_FULFILLED",
-                }
+        # PIPELINE_STAGE_COMPLETENESS
+        expected_pipeline_stages = sum(1 for t, e in (pm.items()) if isinstance(e, dict) and e.get("task_type") == "pipeline_stage")
+        detected_stages = impl_signals.get("pipeline_stages_detected", 0)
+        pipeline_k = self.compute_pipeline_stage_completeness(
+            expected_pipeline_stages, detected_stages, impl_signals, repo_median_combined, complexity_score
+        )
 
-                required_kpis: List[str] = []
-                for d in (done_contract_entries or []):
-                    if isinstance(d, str) and d in done_to_kpi:
-                        required_kpis.append(done_to_kpi[d])
+        # VALIDATOR_COMPLETENESS (task-level KPI)
+        validator_k = self.compute_validator_kpi(val_artifacts, impl_signals.get("validators_detected", 0))
+
+        # STATE_TRANSITION -> only detect/enforce when listed in done_contract or scored
+        # Determine done_contract entries per task
+        # NOTE: per canonical behavior, only honor `done_contract` when
+        # explicitly provided in the task's `project_map` entry. Do NOT
+        # inherit or fall back to repository-level `task_contract.yml`.
+        done_contract_entries = []
+        if isinstance(entry.get("done_contract"), list):
+            done_contract_entries = entry.get("done_contract")
+
+        # compute state detection if the task explicitly requires it via
+        # `done_contract` OR if `STATE_TRANSITION` is present in the
+        # configured `score_weights`. This preserves compatibility with
+        # tests that assert detection when the KPI is being scored.
+        state_required = any(d == "state_transition_implemented" for d in (done_contract_entries or [])) or (isinstance(score_weights, dict) and ("STATE_TRANSITION" in score_weights))
+        if state_required:
+            with self._phase("task.state_transition", len(used_impl_files)):
+                state_ok, state_details = self.check_state_transition_implemented(used_impl_files)
+            state_k = 1.0 if state_ok else 0.0
+        else:
+            state_k = None
+
+        # SANITY_GATE is guaranteed above to be healthy (we returned early otherwise), so set to 1.0
+        sanity_k = 1.0
+
+        # Build KPI map with None for not-applicable
+        metrics_k = {
+            # Implementation-first KPIs
+            "STRUCTURAL_COMPLETENESS": struct_k,
+            "IMPLEMENTATION_COMPLETENESS": impl_k,
+            "PIPELINE_STAGE_COMPLETENESS": pipeline_k,
+            "VALIDATOR_COMPLETENESS": validator_k,
+
+            # Code & tests
+            "CODE_ARTIFACT_PRESENT": code_k,
+            "TESTS_PASS": tests_k,
+            "SPEC_COVERAGE": spec_k,
+            "COMPLEXITY_PROFILE": comp_k,
+            "DOCUMENTATION": doc_k,
+
+            # Other
+            "SANITY_GATE": sanity_k,
+            "STATE_TRANSITION": state_k,
+        }
 
-                # compute pre-gate weighted score (weights are percentages)
-                total_weight = sum(float(v) for v in score_weights.values()) if score_weights else 100.0
-                weighted = 0.0
-                # iterate over configured score_weights only
-                for k, w in (score_weights.items() if score_weights else {}):
-                    try:
-                        wv = float(w)
-                    except Exception:
-                        wv = 0.0
-                    mv = metrics_k.get(k)
-                    if mv is None:
-                        # KPI not applicable for this task -> treat as neutral (0.5)
-                        mv_val = 0.5
-                    else:
-                        mv_val = float(mv)
-                    weighted += (wv * mv_val)
-
-                pre_gate_score = int(round((weighted / total_weight) * 100.0))
-
-                # --- Split scores: progress vs compliance ---
-                # Allow KPI grouping configuration via scoring_kpis.yml
-                # Progress KPIs are strictly implementation-focused. Per
-                # specification progress_score must be computed only from
-                # implementation signals and tests evidence.
-                default_progress = [
-                    "STRUCTURAL_COMPLETENESS",
-                    "IMPLEMENTATION_COMPLETENESS",
-                    "PIPELINE_STAGE_COMPLETENESS",
-                    "VALIDATOR_COMPLETENESS",
-                    "COMPLEXITY_PROFILE",
-                    "TESTS_PASS",
-                ]
-
-                # Compliance KPIs are policy/metadata oriented.
-                default_compliance = [
-                    "SPEC_COVERAGE",
-                    "DOCUMENTATION",
-                    "SANITY_GATE",
-                    "STATE_TRANSITION",
-                ]
-
-                kpi_groups = (sk or {}).get("kpi_groups", {}) if isinstance(sk, dict) else {}
-                progress_kpis = kpi_groups.get("progress", default_progress)
-                compliance_kpis = kpi_groups.get("compliance", default_compliance)
-
-                def compute_subset_score(kpi_list: List[str]) -> Tuple[int, float]:
-                    total = 0.0
-                    acc = 0.0
-                    for k in kpi_list:
-                        w = float(score_weights.get(k, 0.0))
-                        total += w
-                        mv = metrics_k.get(k)
-                        mv_val = 0.5 if mv is None else float(mv)
-                        acc += (w * mv_val)
-                    if total <= 0.0:
-                        return 0, 0.0
-                    return int(round((acc / total) * 100.0)), total
-
-                progress_pre, progress_total = compute_subset_score(progress_kpis)
-                compliance_pre, compliance_total = compute_subset_score(compliance_kpis)
-
-                # If both groups have zero configured weight (no KPIs in groups
-                # intersect configured score_weights), fall back to using the
-                # overall pre_gate_score for both to preserve expected legacy
-                # behavior where a single configured KPI drives the total.
-                if (progress_total <= 0.0) and (compliance_total <= 0.0):
-                    progress_pre = pre_gate_score
-                    compliance_pre = pre_gate_score
-
-                # apply gates as caps to compliance only. Progress is strictly
-                # derived from implementation signals and MUST NOT be reduced
-                # by gates or compliance enforcement (implementation-first rule).
-                progress_post = progress_pre
-                compliance_post = compliance_pre
-                for g, cap in gate_caps.items():
-                    k_val = metrics_k.get(g)
-                    if k_val is None:
-                        continue
-                    try:
-                        capv = int(cap)
-                    except Exception:
-                        capv = 50
-                    # Only apply caps to compliance group here
-                    if g in compliance_kpis and float(k_val) < 1.0:
-                        compliance_post = min(compliance_post, capv)
-
-                # apply gates as caps using gate_caps mapping (overall)
-                post_gate_score = pre_gate_score
-                for g, cap in gate_caps.items():
-                    # only evaluate gate if KPI is applicable
-                    k_val = metrics_k.get(g)
-                    if k_val is None:
-                        # not applicable -> do not impose gate
-                        continue
-                    # gate applies when KPI is not fully satisfied
-                    if float(k_val) < 1.0:
-                        try:
-                            capv = int(cap)
-                        except Exception:
-                            capv = 50
-                        post_gate_score = min(post_gate_score, capv)
-
-                # done_contract enforcement (metadata-neutral):
-                # - Missing metadata (None) is treated as neutral and does NOT
-                #   cause a hard failure.
-                # - Only an explicit failing KPI value (0.0) forces a hard zero
-                #   on the post_gate_score. Partial values (<1.0 but >0.0) will
-                #   impose a conservative cap (default 50) instead of zero.
-                required_failure_hard_zero = False
-                if required_kpis:
-                    for rk in required_kpis:
-                        rv = metrics_k.get(rk)
-                        try:
-                            # missing metadata -> neutral (do not fail)
-                            if rv is None:
-                                continue
-                            val = float(rv)
-                            # explicit failure -> hard zero for compliance/post gate
-                            if val == 0.0:
-                                post_gate_score = 0
-                                compliance_post = 0
-                                # record that a required KPI explicitly failed
-                                required_failure_hard_zero = True
-                                break
-                            # partial satisfaction -> conservative cap (50) on compliance and overall
-                            if val < 1.0:
-                                post_gate_score = min(post_gate_score, 50)
-                                if rk in compliance_kpis:
-                                    compliance_post = min(compliance_post, 50)
-                        except Exception:
-                            # parsing error -> treat as neutral
-                            continue
-
-                # finalize progress/compliance combined score
-                # allow weighting via scoring_kpis.yml: group_weights: {progress: n, compliance: m}
-                group_weights = (sk or {}).get("group_weights", {}) if isinstance(sk, dict) else {}
+        # ------------------ done_contract enforcement (no hard zeros) ------------------
+        # Map done_contract names to KPI metric keys
+        required_kpis: List[str] = []
+        for d in (done_contract_entries or []):
+            if isinstance(d, str) and d in DONE_CONTRACT_KPIS:
+                required_kpis.append(DONE_CONTRACT_KPIS[d])
+
+        # compute pre-gate weighted score (weights are percentages)
+        total_weight = sum(float(v) for v in score_weights.values()) if score_weights else 100.0
+        weighted = 0.0
+        # iterate over configured score_weights only
+        for k, w in (score_weights.items() if score_weights else {}):
+            try:
+                wv = float(w)
+            except Exception:
+                wv = 0.0
+            mv = metrics_k.get(k)
+            if mv is None:
+                # KPI not applicable for this task -> treat as neutral (0.5)
+                mv_val = 0.5
+            else:
+                mv_val = float(mv)
+            weighted += (wv * mv_val)
+
+        pre_gate_score = int(round((weighted / total_weight) * 100.0))
+
+        # --- Split scores: progress vs compliance ---
+        # Allow KPI grouping configuration via scoring_kpis.yml
+        progress_kpis, compliance_kpis = _kpi_groups(sk)
+
+        def compute_subset_score(kpi_list: List[str]) -> Tuple[int, float]:
+            total = 0.0
+            acc = 0.0
+            for k in kpi_list:
+                w = float(score_weights.get(k, 0.0))
+                total += w
+                mv = metrics_k.get(k)
+                mv_val = 0.5 if mv is None else float(mv)
+                acc += (w * mv_val)
+            if total <= 0.0:
+                return 0, 0.0
+            return int(round((acc / total) * 100.0)), total
+
+        progress_pre, progress_total = compute_subset_score(progress_kpis)
+        compliance_pre, compliance_total = compute_subset_score(compliance_kpis)
+
+        # If both groups have zero configured weight (no KPIs in groups
+        # intersect configured score_weights), fall back to using the
+        # overall pre_gate_score for both to preserve expected legacy
+        # behavior where a single configured KPI drives the total.
+        if (progress_total <= 0.0) and (compliance_total <= 0.0):
+            progress_pre = pre_gate_score
+            compliance_pre = pre_gate_score
+
+        # apply gates as caps to compliance only. Progress is strictly
+        # derived from implementation signals and MUST NOT be reduced
+        # by gates or compliance enforcement (implementation-first rule).
+        progress_post = progress_pre
+        compliance_post = compliance_pre
+        for g, cap in gate_caps.items():
+            k_val = metrics_k.get(g)
+            if k_val is None:
+                continue
+            try:
+                capv = int(cap)
+            except Exception:
+                capv = 50
+            # Only apply caps to compliance group here
+            if g in compliance_kpis and float(k_val) < 1.0:
+                compliance_post = min(compliance_post, capv)
+
+        # apply gates as caps using gate_caps mapping (overall)
+        post_gate_score = pre_gate_score
+        for g, cap in gate_caps.items():
+            # only evaluate gate if KPI is applicable
+            k_val = metrics_k.get(g)
+            if k_val is None:
+                # not applicable -> do not impose gate
+                continue
+            # gate applies when KPI is not fully satisfied
+            if float(k_val) < 1.0:
                 try:
-                    pw = float(group_weights.get("progress", 1.0))
+                    capv = int(cap)
                 except Exception:
-                    pw = 1.0
+                    capv = 50
+                post_gate_score = min(post_gate_score, capv)
+
+        # done_contract enforcement (metadata-neutral):
+        # - Missing metadata (None) is treated as neutral and does NOT
+        #   cause a hard failure.
+        # - Only an explicit failing KPI value (0.0) forces a hard zero
+        #   on the post_gate_score. Partial values (<1.0 but >0.0) will
+        #   impose a conservative cap (default 50) instead of zero.
+        required_failure_hard_zero = False
+        if required_kpis:
+            for rk in required_kpis:
+                rv = metrics_k.get(rk)
                 try:
-                    cw = float(group_weights.get("compliance", 1.0))
+                    # missing metadata -> neutral (do not fail)
+                    if rv is None:
+                        continue
+                    val = float(rv)
+                    # explicit failure -> hard zero for compliance/post gate
+                    if val == 0.0:
+                        post_gate_score = 0
+                        compliance_post = 0
+                        # record that a required KPI explicitly failed
+                        required_failure_hard_zero = True
+                        break
+                    # partial satisfaction -> conservative cap (50) on compliance and overall
+                    if val < 1.0:
+                        post_gate_score = min(post_gate_score, 50)
+                        if rk in compliance_kpis:
+                            compliance_post = min(compliance_post, 50)
                 except Exception:
-                    cw = 1.0
-                denom = pw + cw if (pw + cw) != 0 else 1.0
-                combined_post = int(round((float(progress_post) * pw + float(compliance_post) * cw) / denom))
-
-                # If any required KPI explicitly failed (hard zero), enforce
-                # a hard zero on the combined outcome as well while keeping
-                # the `progress_score` intact. This allows progress to reflect
-                # implementation signals while ensuring final outcomes respect
-                # done_contract enforcement.
-                if required_failure_hard_zero:
-                    combined_post = 0
-
-                # finalize task_type and final_score multiplier
-                task_type = "pipeline_stage"
-                if isinstance(entry.get("task_type"), str):
-                    task_type = entry.get("task_type")
-                else:
-                    if any(p.startswith("docs/") for p in entry.get("implementation_files", []) if isinstance(p, str)):
-                        task_type = "documentation"
-
-                type_mult = float(task_type_weights.get(task_type, 1.0))
-                final_score = int(round(combined_post * type_mult))
-
-                # prepare metrics for output. Map None -> neutral (0.5) so
-                # missing metadata or not-applicable KPIs do not penalize progress.
-                out_metrics = {}
-                for k, v in metrics_k.items():
-                    if v is None:
-                        out_metrics[k] = 0.5
-                    elif isinstance(v, float):
-                        # represent numeric KPI values as floats (0.0, 0.5, 1.0)
-                        out_metrics[k] = float(v)
-                    else:
-                        out_metrics[k] = v
-
-                results[task_id] = {
-                    "metrics": out_metrics,
-                    "pre_gate_score": pre_gate_score,
-                    "post_gate_score": post_gate_score,
-                    "progress_score": int(progress_post),
-                    "compliance_score": int(compliance_post),
-                    "combined_score": int(combined_post),
-                    "final_score": final_score,
-                    "task_type": task_type,
-                    "details": {
-                        "declared_impl_files": declared_impl_files,
-                        "inferred_impl_files": inferred_impl_files,
-                        "impl_files": used_impl_files,
-                        "validation_artifacts": val_artifacts,
-                        "implementation_signals": impl_signals,
-                        "percent_structure_complete": structure_signals.get("percent_structure_complete"),
-                        "complexity_details": complexity_details,
-                    },
-                }
+                    # parsing error -> treat as neutral
+                    continue
 
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.exception("scoring_loop failed: %s", exc)
+        # finalize progress/compliance combined score
+        # allow weighting via scoring_kpis.yml: group_weights: {progress: n, compliance: m}
+        pw, cw = _group_weights(sk)
+        denom = pw + cw if (pw + cw) != 0 else 1.0
+        combined_post = int(round((float(progress_post) * pw + float(compliance_post) * cw) / denom))
+
+        # If any required KPI explicitly failed (hard zero), enforce
+        # a hard zero on the combined outcome as well while keeping
+        # the `progress_score` intact. This allows progress to reflect
+        # implementation signals while ensuring final outcomes respect
+        # done_contract enforcement.
+        if required_failure_hard_zero:
+            combined_post = 0
+
+        # finalize task_type and final_score multiplier
+        task_type = "pipeline_stage"
+        if isinstance(entry.get("task_type"), str):
+            task_type = entry.get("task_type")
+        else:
+            if any(p.startswith("docs/") for p in entry.get("implementation_files", []) if isinstance(p, str)):
+                task_type = "documentation"
+
+        type_mult = float(task_type_weights.get(task_type, 1.0))
+        final_score = int(round(combined_post * type_mult))
+
+        # prepare metrics for output. Map None -> neutral (0.5) so
+        # missing metadata or not-applicable KPIs do not penalize progress.
+        out_metrics = {}
+        for k, v in metrics_k.items():
+            if v is None:
+                out_metrics[k] = 0.5
+            elif isinstance(v, float):
+                # represent numeric KPI values as floats (0.0, 0.5, 1.0)
+                out_metrics[k] = float(v)
+            else:
+                out_metrics[k] = v
 
-        return results
+        details = {
+            "declared_impl_files": declared_impl_files,
+            "inferred_impl_files": inferred_impl_files,
+            "impl_files": used_impl_files,
+            "validation_artifacts": val_artifacts,
+            "implementation_signals": impl_signals,
+            "percent_structure_complete": structure_signals.get("percent_structure_complete"),
+            "complexity_details": complexity_details,
+        }
+        # optional `required_signatures: {file: [signature, ...]}` contract;
+        # reported for review, not scored
+        if isinstance(entry.get("required_signatures"), dict):
+            details["signature_checks"] = self.ast_check_batch(entry["required_signatures"])
+
+        return {
+            "metrics": out_metrics,
+            "pre_gate_score": pre_gate_score,
+            "post_gate_score": post_gate_score,
+            "progress_score": int(progress_post),
+            "compliance_score": int(compliance_post),
+            "combined_score": int(combined_post),
+            "final_score": final_score,
+            "task_type": task_type,
+            "details": details,
+        }
+
+    def _score_tasks_parallel(self, task_items: List[Tuple[str, Any]], ctx: Dict[str, Any], results: Dict[str, Any]) -> None:
+        """Score `task_items` on a forked process pool, filling `results` in order.
+
+        The parent pre-parses every file the tasks will inspect so forked
+        workers inherit a warm `ModuleIndex` instead of re-parsing. Results
+        are merged in `task_items` order, which keeps the output identical to
+        the serial path; the first failing task aborts the merge just like an
+        exception in the serial loop would.
+        """
+        import concurrent.futures
+
+        index = self._index()
+        for p in self._repo_python_files():
+            index.facts(p)
+        for _, entry in task_items:
+            if isinstance(entry, dict):
+                for f in entry.get("implementation_files", []) or []:
+                    if isinstance(f, str):
+                        index.facts(self.repo_path / f)
+
+        workers = min(self.jobs, len(task_items))
+        chunksize = max(1, len(task_items) // (workers * 4))
+        _WORKER_STATE["scanner"] = self
+        _WORKER_STATE["tasks"] = dict(task_items)
+        _WORKER_STATE["ctx"] = ctx
+        try:
+            with _module_registered_for_pickling():
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=_fork_context()) as pool:
+                    for task_id, res, err, profile in pool.map(_score_task_in_worker, [t for t, _ in task_items], chunksize=chunksize):
+                        if err is not None:
+                            raise RuntimeError(f"scoring task {task_id!r} failed in worker: {err}")
+                        results[task_id] = res
+                        if self.profiler is not None:
+                            self.profiler.merge(profile)
+        finally:
+            _WORKER_STATE.clear()
 
     def compute_spec_coverage(self, entry: Dict[str, Any]) -> int:
         """Compute spec coverage percentage from a `project_map` task entry.
@@ -1431,7 +3001,12 @@ class PILScanner:
             return 50
         return int((covered / total) * 100)
 
-    def compute_complexity_profile(self, impl_files: List[str], config: Optional[Dict[str, Any]] = None) -> Tuple[int, Dict[str, Any]]:
+    def compute_complexity_profile(
+        self,
+        impl_files: List[str],
+        config: Optional[Dict[str, Any]] = None,
+        repo_totals: Optional[Dict[str, int]] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
         """Compute an implementation-richness heuristic and return (score, details).
 
         The heuristic is based on:
@@ -1441,28 +3016,29 @@ class PILScanner:
           - module_depth (max directory depth)
           - function/class count
 
+        Counts are normalized against repository-wide totals. Pass
+        `repo_totals` (as returned by `compute_repo_totals`) to reuse them;
+        otherwise they are computed (and memoized for the active scan).
+
         Returns (score 0..100, details dict).
         """
         # If specific implementation files were provided, limit analysis to them.
         py_files: List[Path] = []
+        index = self._index()
         if impl_files:
             seen = set()
             for f in impl_files:
                 try:
-                    p = Path(f)
-                    if not p.is_absolute():
-                        p = (self.repo_path / p).resolve()
-                    else:
-                        p = p.resolve()
+                    p = index.resolved_path(f if os.path.isabs(f) else self.repo_path / f)
                 except Exception:
                     # fallback: join with repo_path
                     p = (self.repo_path / Path(f)).resolve()
-                if p.exists() and p.suffix == ".py":
+                if p.suffix == ".py" and index.exists(p):
                     if str(p) not in seen:
                         seen.add(str(p))
                         py_files.append(p)
         else:
-            py_files = self._gather_python_files()
+            py_files = self._repo_python_files()
 
         # Aggregate raw counts for the provided impl_files
         func_count = 0
@@ -1473,108 +3049,26 @@ class PILScanner:
         max_depth = 0
 
         for p in py_files:
-            try:
-                rel = p.relative_to(self.repo_path)
-            except Exception:
-                rel = p
-            depth = len(rel.parts) - 1
+            depth = index.depth(p)
             if depth > max_depth:
                 max_depth = depth
-            try:
-                src = p.read_text(encoding="utf-8")
-                tree = ast.parse(src)
-            except Exception:
+            facts = index.facts(p)
+            if facts is None:
                 continue
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    func_count += 1
-                    name = node.name.lower()
-                    if "stage" in name or "pipeline" in name or any((isinstance(d, ast.Name) and "stage" in d.id.lower()) or (isinstance(d, ast.Attribute) and "stage" in getattr(d, "attr", "").lower()) for d in node.decorator_list):
-                        pipeline_stage_count += 1
-                    # validator by name
-                    if "validate" in name:
-                        validator_count += 1
-                if isinstance(node, ast.ClassDef):
-                    class_count += 1
-                    name = node.name.lower()
-                    if "validator" in name or "validate" in name:
-                        validator_count += 1
-                    if "adapter" in name:
-                        adapter_count += 1
-                if isinstance(node, ast.Call):
-                    fn = node.func
-                    fname = None
-                    if isinstance(fn, ast.Name):
-                        fname = fn.id.lower()
-                    elif isinstance(fn, ast.Attribute):
-                        fname = getattr(fn, "attr", "").lower()
-                    if fname and ("validate" in fname or "schema" in fname):
-                        validator_count += 1
+            func_count += facts["functions"]
+            class_count += facts["classes"]
+            pipeline_stage_count += facts["stage_functions"]
+            validator_count += facts["validate_functions"] + facts["validator_classes"] + facts["validator_calls"]
+            adapter_count += facts["adapter_classes"]
 
             # file-level module name based validators detection
-            try:
-                if p.name.lower() == "validators.py" or p.name.lower().endswith("_validators.py"):
-                    validator_count += 1
-            except Exception:
-                pass
+            if p.name.lower() == "validators.py" or p.name.lower().endswith("_validators.py"):
+                validator_count += 1
 
-        # Repo-level totals for normalization (min-max scaling across repository)
-        repo_py = self._gather_python_files()
-        repo_totals = {
-            "functions": 0,
-            "classes": 0,
-            "pipeline_stages": 0,
-            "validators": 0,
-            "adapters": 0,
-            "module_depth": 0,
-        }
-        for rp in repo_py:
-            try:
-                rsrc = rp.read_text(encoding="utf-8")
-                rtree = ast.parse(rsrc)
-            except Exception:
-                continue
-            rfunc = 0
-            rclass = 0
-            rpipe = 0
-            rval = 0
-            radapt = 0
-            try:
-                rrel = rp.relative_to(self.repo_path)
-                rdepth = len(rrel.parts) - 1
-            except Exception:
-                rdepth = 0
-            if rdepth > repo_totals["module_depth"]:
-                repo_totals["module_depth"] = rdepth
-            for node in ast.walk(rtree):
-                if isinstance(node, ast.FunctionDef):
-                    rfunc += 1
-                    rname = node.name.lower()
-                    if "stage" in rname or "pipeline" in rname or any((isinstance(d, ast.Name) and "stage" in d.id.lower()) or (isinstance(d, ast.Attribute) and "stage" in getattr(d, "attr", "").lower()) for d in node.decorator_list):
-                        rpipe += 1
-                    if "validate" in rname:
-                        rval += 1
-                if isinstance(node, ast.ClassDef):
-                    rclass += 1
-                    rname = node.name.lower()
-                    if "validator" in rname or "validate" in rname:
-                        rval += 1
-                    if "adapter" in rname:
-                        radapt += 1
-                if isinstance(node, ast.Call):
-                    rf = node.func
-                    rfname = None
-                    if isinstance(rf, ast.Name):
-                        rfname = rf.id.lower()
-                    elif isinstance(rf, ast.Attribute):
-                        rfname = getattr(rf, "attr", "").lower()
-                    if rfname and ("validate" in rfname or "schema" in rfname):
-                        rval += 1
-            repo_totals["functions"] += rfunc
-            repo_totals["classes"] += rclass
-            repo_totals["pipeline_stages"] += rpipe
-            repo_totals["validators"] += rval
-            repo_totals["adapters"] += radapt
+        # Repo-level totals for normalization (min-max scaling across repository);
+        # computed once per scan unless the caller supplies them
+        if repo_totals is None:
+            repo_totals = self.compute_repo_totals()
 
         # Prevent division by zero: use 1 as denominator if totals are zero
         denom_funcs = repo_totals["functions"] or 1
@@ -1636,10 +3130,50 @@ class PILScanner:
                 "classes": scaled_classes,
                 "module_depth": scaled_depth,
             },
-            "repo_totals": repo_totals,
+            "repo_totals": dict(repo_totals),
         }
         return score, details
 
+    def compute_repo_totals(self) -> Dict[str, int]:
+        """Return repository-wide complexity totals used for normalization.
+
+        Keys: functions, classes, pipeline_stages, validators, adapters and
+        module_depth (max directory depth of a parseable module). The result
+        is memoized for the duration of a scan.
+        """
+        if self._module_index is not None and self._module_index.repo_totals is not None:
+            return dict(self._module_index.repo_totals)
+        index = self._index()
+        repo_totals = {
+            "functions": 0,
+            "classes": 0,
+            "pipeline_stages": 0,
+            "validators": 0,
+            "adapters": 0,
+            "module_depth": 0,
+        }
+        python_files = self._repo_python_files()
+        with self._phase("repo_totals", len(python_files)):
+            for rp in python_files:
+                rfacts = index.facts(rp)
+                if rfacts is None:
+                    continue
+                try:
+                    rrel = rp.relative_to(self.repo_path)
+                    rdepth = len(rrel.parts) - 1
+                except Exception:
+                    rdepth = 0
+                if rdepth > repo_totals["module_depth"]:
+                    repo_totals["module_depth"] = rdepth
+                repo_totals["functions"] += rfacts["functions"]
+                repo_totals["classes"] += rfacts["classes"]
+                repo_totals["pipeline_stages"] += rfacts["stage_functions"]
+                repo_totals["validators"] += rfacts["validate_functions"] + rfacts["validator_classes"] + rfacts["validator_calls"]
+                repo_totals["adapters"] += rfacts["adapter_classes"]
+        if self._module_index is not None:
+            self._module_index.repo_totals = dict(repo_totals)
+        return repo_totals
+
     # ------------------------ Heuristic helper functions ------------------
     def compute_rich_implementation_signals(self, impl_signals: Dict[str, int], repo_median_combined: int, complexity_score: int) -> Dict[str, Any]:
         """Derive higher-level implementation signals from raw counts.
@@ -1722,12 +3256,176 @@ class PILScanner:
             return 1.0 if detected_validators > 0 else 0.0
         return 0.5
 
-if __name__ == "__main__":
-    # Simple smoke exercise when executed directly (no side effects)
-    scanner = PILScanner(repo_path=".")
-    sanity = scanner.run_sanity_gate()
-    print(json.dumps(sanity, indent=2))
-def aggregate_all_repos(repo_list: List[str], include_timestamps: bool = False) -> Dict[str, Any]:
+
+def _load_project_map(repo_path: str) -> Dict[str, Any]:
+    """Return the parsed `project_map.yml` of `repo_path`, or `{}`."""
+    try:
+        import yaml
+
+        p = Path(repo_path) / "project_map.yml"
+        if p.exists():
+            pm = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+            return pm if isinstance(pm, dict) else {}
+    except Exception as exc:
+        logger.warning("could not read project_map for %s: %s", repo_path, exc)
+    return {}
+
+
+def _repo_dependency_waves(project_maps: List[Dict[str, Any]]) -> List[List[int]]:
+    """Group repo positions into waves that can be scanned concurrently.
+
+    A repo depends on every other repo whose `project_map` defines a task
+    named in one of its `dependencies` lists. Each wave holds the repos whose
+    dependencies all sit in earlier waves; repos caught in a dependency cycle
+    share the final wave. Positions keep their `repo_list` order in a wave.
+    """
+    owners: Dict[str, List[int]] = {}
+    for pos, pm in enumerate(project_maps):
+        for task_id in pm:
+            owners.setdefault(str(task_id), []).append(pos)
+    requires: List[set] = []
+    for pos, pm in enumerate(project_maps):
+        needed = set()
+        for entry in pm.values():
+            if not isinstance(entry, dict):
+                continue
+            for dep in entry.get("dependencies", []) or []:
+                needed.update(o for o in owners.get(str(dep), []) if o != pos)
+        requires.append(needed)
+
+    waves: List[List[int]] = []
+    done: set = set()
+    remaining = list(range(len(project_maps)))
+    while remaining:
+        wave = [pos for pos in remaining if requires[pos] <= done]
+        if not wave:
+            # dependency cycle: nothing can go first, scan the rest together
+            wave = remaining
+        waves.append(wave)
+        done.update(wave)
+        remaining = [pos for pos in remaining if pos not in done]
+    return waves
+
+
+def _scan_repo(
+    repo_path: str,
+    include_timestamps: bool,
+    use_cache: bool,
+    jobs: int,
+    previous_index: Optional[Dict[str, Any]],
+    dependency_index: Dict[str, Any],
+    profiler: Optional[PhaseProfiler] = None,
+) -> Dict[str, Any]:
+    """Scan one repository and return its `repos_index` entry.
+
+    `dependencies` is left empty; `aggregate_all_repos` fills it once the
+    whole index is known. `dependency_index` only feeds the incremental task
+    fingerprints.
+    """
+    scanner = PILScanner(repo_path, use_cache=use_cache, jobs=jobs, profiler=profiler)
+    repo_name = str(Path(repo_path).resolve().name)
+    incremental = previous_index is not None
+    previous: Optional[Dict[str, Any]] = None
+    last_hashes: Optional[Dict[str, str]] = None
+    fingerprint_store: Optional[TaskFingerprintStore] = None
+    if incremental:
+        previous = (previous_index or {}).get(repo_name)
+        previous = previous if isinstance(previous, dict) else {}
+        fingerprint_store = TaskFingerprintStore(Path(repo_path))
+        prev_scoring = previous.get("scoring")
+        previous = dict(
+            previous,
+            task_fingerprints=fingerprint_store.matching(prev_scoring if isinstance(prev_scoring, dict) else {}),
+        )
+        prev_details = (previous.get("deltas") or {}).get("details") or {}
+        last_hashes = {f: d.get("current") for f, d in prev_details.items() if isinstance(d, dict)}
+    # one parse per file and one set of repo-wide totals for every phase
+    with scanner.scan_scope():
+        repo_totals = scanner.compute_repo_totals()
+        scoring = scanner.scoring_loop(repo_totals=repo_totals, previous=previous, dependency_index=dependency_index)
+        with scanner._phase("drift_detection"):
+            deltas = scanner.version_and_drift_detection(last_hashes)
+    # handle UNABLE_TO_SCORE sentinel returned by scoring_loop
+    if isinstance(scoring, dict) and scoring.get("status") == "UNABLE_TO_SCORE":
+        # record sanity details and skip task-level scoring
+        return {
+            "repo_path": str(Path(repo_path).resolve()),
+            "status": scoring.get("status"),
+            "explanation": scoring.get("explanation"),
+            "sanity": scoring.get("sanity"),
+            "scoring": {},
+            "deltas": deltas,
+            "dependencies": {},
+        }
+
+    # compute task status summary for normal scoring results
+    tasks_summary: Dict[str, Any] = {}
+    for tid, res in scoring.items():
+        final = int(res.get("final_score", 0))
+        status = "done" if final >= 80 else "pending"
+        tasks_summary[tid] = {"final_score": final, "status": status}
+
+    repo_entry: Dict[str, Any] = {
+        "repo_path": str(Path(repo_path).resolve()),
+        "tasks": tasks_summary,
+        "scoring": scoring,
+        "deltas": deltas,
+        "dependencies": {},
+    }
+    if fingerprint_store is not None:
+        state = scanner.incremental_state or {}
+        fingerprint_store.save(state.get("fingerprints") or {}, scoring)
+        repo_entry["rescored"] = state.get("rescored") or []
+    # optional timestamps: derive last-mod times for implementation files and test reports
+    if include_timestamps:
+        try:
+            all_times = []
+            for tid, res in scoring.items():
+                for f in res.get("details", {}).get("impl_files", []) or []:
+                    try:
+                        t = Path(f).stat().st_mtime
+                        all_times.append(float(t))
+                    except Exception:
+                        continue
+            # include test-reports modification times
+            tr = Path(repo_path) / "test-reports"
+            if tr.exists():
+                for p in tr.glob("*.xml"):
+                    try:
+                        all_times.append(float(p.stat().st_mtime))
+                    except Exception:
+                        continue
+            if all_times:
+                repo_entry["artifact_age"] = {"last_mod_epoch": int(max(all_times)), "source": "mtime"}
+            else:
+                repo_entry["artifact_age"] = {"last_mod_epoch": None, "source": None}
+        except Exception:
+            repo_entry["artifact_age"] = {"last_mod_epoch": None, "source": "error"}
+    return repo_entry
+
+
+def _scan_repo_in_worker(pos: int) -> Tuple[int, Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]:
+    """Pool entry point: scan repo `pos` using the inherited `_WORKER_STATE`.
+
+    When profiling, the worker's phase timings are returned for merging.
+    """
+    state = _WORKER_STATE
+    profiler = PhaseProfiler() if state["profile"] else None
+    try:
+        entry = _scan_repo(state["repos"][pos], dependency_index=state["dependency_index"], profiler=profiler, **state["options"])
+        return pos, entry, None, profiler.snapshot() if profiler is not None else None
+    except Exception as exc:
+        return pos, None, f"{type(exc).__name__}: {exc}", None
+
+
+def aggregate_all_repos(
+    repo_list: List[str],
+    include_timestamps: bool = False,
+    use_cache: bool = False,
+    jobs: int = 1,
+    previous_index: Optional[Dict[str, Any]] = None,
+    profiler: Optional[PhaseProfiler] = None,
+) -> Dict[str, Any]:
     """Aggregate results from multiple repositories into a master `repos_index`.
 
     The returned mapping uses the repository directory name as the top-level key.
@@ -1737,94 +3435,150 @@ def aggregate_all_repos(repo_list: List[str], include_timestamps: bool = False)
 
     Deterministic rules:
       - A task is considered `done` if `final_score >= 80`, otherwise `pending`.
-      - Dependencies are checked against the aggregated `repos_index` built so far
-        which allows inter-repo references to be resolved deterministically.
+      - Dependencies are checked in a final pass against the complete
+        `repos_index`, so the order of `repo_list` does not matter.
+
+    Repos are scheduled in waves derived from the repo-level dependency DAG
+    (see `_repo_dependency_waves`). With `jobs > 1` the repos of a wave are
+    scanned concurrently on a process pool; a wave holding a single repo
+    instead forwards `jobs` to its `PILScanner` to score tasks in parallel.
+
+    With `use_cache=True` each repo's AST-derived signals are persisted under
+    its `.pil_cache/` directory and reused by later runs.
+
+    Passing `previous_index` (an earlier `repos_index`, e.g. from
+    `load_repos_index`) enables incremental mode: drift is measured against
+    the previous artifact hashes and only tasks whose implementation files,
+    validation artifacts, JUnit results, dependency statuses or repo-level
+    inputs changed are re-scored; the rest carry their previous results
+    forward. Task fingerprints for the next run are kept in each repo's
+    `.pil_cache/` (see `TaskFingerprintStore`) and each repo entry lists the
+    `rescored` task ids, which `save_repos_index` leaves out. Dependency
+    statuses in the fingerprints are resolved against the repos of earlier
+    waves.
+
+    A `PhaseProfiler` passed as `profiler` collects phase timings from every
+    repo scan (including pool workers) and the dependency pass.
     """
+    jobs = max(1, int(jobs or 1))
+    project_maps = [_load_project_map(repo_path) for repo_path in repo_list]
+    names = [str(Path(repo_path).resolve().name) for repo_path in repo_list]
+    options = {"include_timestamps": include_timestamps, "use_cache": use_cache, "previous_index": previous_index}
+    entries: Dict[int, Dict[str, Any]] = {}
+
+    def completed_index() -> Dict[str, Any]:
+        index: Dict[str, Any] = {}
+        for pos in sorted(entries):
+            index[names[pos]] = entries[pos]
+        return index
+
+    for wave in _repo_dependency_waves(project_maps):
+        dependency_index = completed_index()
+        if jobs > 1 and len(wave) > 1 and _fork_context() is not None:
+            import concurrent.futures
+
+            _WORKER_STATE["repos"] = repo_list
+            _WORKER_STATE["options"] = dict(options, jobs=1)
+            _WORKER_STATE["dependency_index"] = dependency_index
+            _WORKER_STATE["profile"] = profiler is not None
+            try:
+                with _module_registered_for_pickling():
+                    with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(wave)), mp_context=_fork_context()) as pool:
+                        for pos, entry, err, profile in pool.map(_scan_repo_in_worker, wave):
+                            if err is not None:
+                                raise RuntimeError(f"scanning repo {repo_list[pos]!r} failed in worker: {err}")
+                            entries[pos] = entry
+                            if profiler is not None:
+                                profiler.merge(profile)
+            finally:
+                _WORKER_STATE.clear()
+        else:
+            for pos in wave:
+                entries[pos] = _scan_repo(repo_list[pos], dependency_index=dependency_index, jobs=jobs, profiler=profiler, **options)
+
     aggregated: Dict[str, Any] = {}
-    # Build incrementally so dependencies can resolve previously-seen repos
-    for repo_path in repo_list:
-        scanner = PILScanner(repo_path)
-        repo_name = str(Path(repo_path).resolve().name)
-        scoring = scanner.scoring_loop()
-        deltas = scanner.version_and_drift_detection()
-        # handle UNABLE_TO_SCORE sentinel returned by scoring_loop
-        tasks_summary: Dict[str, Any] = {}
-        deps_results: Dict[str, Any] = {}
-        if isinstance(scoring, dict) and scoring.get("status") == "UNABLE_TO_SCORE":
-            # record sanity details and skip task-level scoring
-            aggregated[repo_name] = {
-                "repo_path": str(Path(repo_path).resolve()),
-                "status": scoring.get("status"),
-                "explanation": scoring.get("explanation"),
-                "sanity": scoring.get("sanity"),
-                "scoring": {},
-                "deltas": deltas,
-                "dependencies": {},
-            }
-            # continue to next repo (no task-level dependency checks possible)
+    for pos in range(len(repo_list)):
+        aggregated[names[pos]] = entries[pos]
+
+    # final resolution pass: every dependency sees the complete index
+    with (profiler.phase("dependency_index") if profiler is not None else _NULL_PHASE):
+        status_index = TaskStatusIndex(aggregated)
+    for task_id, repos in sorted(status_index.ambiguous().items()):
+        logger.warning("task id %r is defined in several repos: %s", task_id, ", ".join(repos))
+    for pos, repo_path in enumerate(repo_list):
+        entry = aggregated[names[pos]]
+        if entry is not entries[pos] or entry.get("status") == "UNABLE_TO_SCORE":
             continue
+        scanner = PILScanner(repo_path, profiler=profiler)
+        with scanner._phase("dependency_checks"):
+            entry["dependencies"] = {
+                tid: scanner.check_dependencies(tid, aggregated, project_maps[pos], status_index)
+                for tid in entry["scoring"].keys()
+            }
 
-        # compute task status summary for normal scoring results
-        for tid, res in scoring.items():
-            final = int(res.get("final_score", 0))
-            status = "done" if final >= 80 else "pending"
-            tasks_summary[tid] = {"final_score": final, "status": status}
+    return aggregated
 
-        # check dependencies for each task against current aggregated index
-        for tid in scoring.keys():
-            deps_results[tid] = scanner.check_dependencies(tid, aggregated)
 
-        aggregated[repo_name] = {
-            "repo_path": str(Path(repo_path).resolve()),
-            "tasks": tasks_summary,
-            "scoring": scoring,
-            "deltas": deltas,
-            "dependencies": deps_results,
-        }
-        # optional timestamps: derive last-mod times for implementation files and test reports
-        if include_timestamps:
-            try:
-                all_times = []
-                for tid, res in scoring.items():
-                    for f in res.get("details", {}).get("impl_files", []) or []:
-                        try:
-                            t = Path(f).stat().st_mtime
-                            all_times.append(float(t))
-                        except Exception:
-                            continue
-                # include test-reports modification times
-                tr = Path(repo_path) / "test-reports"
-                if tr.exists():
-                    for p in tr.glob("*.xml"):
-                        try:
-                            all_times.append(float(p.stat().st_mtime))
-                        except Exception:
-                            continue
-                if all_times:
-                    aggregated[repo_name]["artifact_age"] = {"last_mod_epoch": int(max(all_times)), "source": "mtime"}
-                else:
-                    aggregated[repo_name]["artifact_age"] = {"last_mod_epoch": None, "source": None}
-            except Exception:
-                aggregated[repo_name]["artifact_age"] = {"last_mod_epoch": None, "source": "error"}
+def _yaml_codec(name: str):
+    """Return `(yaml, Loader/Dumper)` preferring the libyaml C class; `(None, None)` without PyYAML."""
+    try:
+        import yaml
+    except ImportError:
+        return None, None
+    return yaml, getattr(yaml, "C" + name, None) or getattr(yaml, name)
 
-    return aggregated
+
+# per-run diagnostics on repo entries that are not written to the index file
+RUN_ONLY_REPO_KEYS = ("rescored",)
 
 
 def save_repos_index(repos_index: Dict[str, Any], out_path: str) -> None:
     """Serialize `repos_index` to YAML at `out_path` using deterministic ordering.
 
-    If `yaml` is not available the function writes JSON as a fallback.
+    A `.json` path, or a missing `yaml`, writes JSON instead. YAML goes
+    through libyaml's `CSafeDumper` when PyYAML was built with it. The
+    `RUN_ONLY_REPO_KEYS` of each repo entry are left out.
     """
-    try:
-        import yaml
+    repos_index = {
+        name: {k: v for k, v in entry.items() if k not in RUN_ONLY_REPO_KEYS} if isinstance(entry, dict) else entry
+        for name, entry in repos_index.items()
+    }
+    yaml, dumper = _yaml_codec("SafeDumper")
+    if yaml is not None and not out_path.endswith(".json"):
+        try:
+            with open(out_path, "w", encoding="utf-8") as fh:
+                # sort keys for deterministic output
+                yaml.dump(repos_index, fh, Dumper=dumper, sort_keys=True)
+            return
+        except Exception:
+            pass
+    # fallback to JSON
+    with open(out_path, "w", encoding="utf-8") as fh:
+        json.dump(repos_index, fh, sort_keys=True, indent=2)
 
-        with open(out_path, "w", encoding="utf-8") as fh:
-            # sort keys for deterministic output
-            yaml.safe_dump(repos_index, fh, sort_keys=True)
+
+def load_repos_index(path: str) -> Dict[str, Any]:
+    """Load a `repos_index` written by `save_repos_index`; `{}` if unreadable."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            text = fh.read()
     except Exception:
-        # fallback to JSON
-        with open(out_path, "w", encoding="utf-8") as fh:
-            json.dump(repos_index, fh, sort_keys=True, indent=2)
+        return {}
+    data = None
+    yaml, loader = _yaml_codec("SafeLoader")
+    if yaml is not None and not path.endswith(".json"):
+        try:
+            data = yaml.load(text, Loader=loader)
+        except Exception:
+            data = None
+    if data is None:
+        try:
+            data = json.loads(text)
+        except Exception:
+            data = None
+    return data if isinstance(data, dict) else {}
 
 
 def _make_sparkline(values: List[float]) -> str:
@@ -1844,35 +3598,133 @@ def _make_sparkline(values: List[float]) -> str:
     return "".join(out)
 
 
-def save_repos_index_with_history(repos_index: Dict[str, Any], out_path: str, history_len: int = 20) -> None:
-    """Save `repos_index` while preserving and updating per-repo progress history.
+class ProgressHistoryStore:
+    """Append-only JSON-lines log of per-repo progress values.
 
-    Behavior:
-      - If `out_path` exists and is YAML/JSON, attempts to load previous history per repo.
-      - Appends the current average final_score for each repo to its history (capped by `history_len`).
-      - Adds `progress_history_values` (list) and `progress_history` (sparkline) to each repo entry.
+    Each line is `{"repo": name, "value": avg_final_score}`. `tail()` reads
+    the file backwards, so the cost of fetching the last few values does not
+    grow with the length of the history.
     """
-    prev = {}
-    try:
-        import yaml
 
-        if os.path.exists(out_path):
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @staticmethod
+    def path_for(index_path: str) -> str:
+        """Store location next to `index_path` (`repos_index.yml` -> `repos_index.history.jsonl`)."""
+        root, _ = os.path.splitext(index_path)
+        return root + ".history.jsonl"
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def append(self, values: Dict[str, float]) -> None:
+        with open(self.path, "a", encoding="utf-8") as fh:
+            for repo_name in sorted(values):
+                fh.write(json.dumps({"repo": repo_name, "value": float(values[repo_name])}, sort_keys=True) + "\n")
+
+    def _reversed_lines(self):
+        with open(self.path, "rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            pos = fh.tell()
+            pending = b""
+            while pos > 0:
+                step = min(self.BLOCK_SIZE, pos)
+                pos -= step
+                fh.seek(pos)
+                lines = (fh.read(step) + pending).split(b"\n")
+                # the first piece may be cut mid-line; finish it with the next block
+                pending = lines.pop(0)
+                for line in reversed(lines):
+                    yield line
+            yield pending
+
+    def tail(self, repos: List[str], n: int) -> Dict[str, List[float]]:
+        """Return up to the last `n` values per repo in `repos`, oldest first."""
+        out: Dict[str, List[float]] = {name: [] for name in repos}
+        if n <= 0 or not out or not self.exists():
+            return out
+        remaining = set(out)
+        for line in self._reversed_lines():
+            if not line.strip():
+                continue
             try:
-                with open(out_path, "r", encoding="utf-8") as fh:
-                    prev = yaml.safe_load(fh) or {}
+                entry = json.loads(line)
+                name, value = entry["repo"], float(entry["value"])
             except Exception:
-                prev = {}
-    except Exception:
-        # attempt JSON load
-        if os.path.exists(out_path):
+                continue
+            values = out.get(name)
+            if values is None or len(values) >= n:
+                continue
+            values.append(value)
+            if len(values) >= n:
+                remaining.discard(name)
+                if not remaining:
+                    break
+        return {name: values[::-1] for name, values in out.items()}
+
+
+def save_repos_index_with_history(
+    repos_index: Dict[str, Any],
+    out_path: str,
+    history_len: int = 20,
+    profiler: Optional[PhaseProfiler] = None,
+) -> None:
+    """Save `repos_index` while preserving and updating per-repo progress history.
+
+    Behavior:
+      - Appends the current average final_score for each repo to a
+        `ProgressHistoryStore` next to `out_path` (`*.history.jsonl`).
+      - Adds `progress_history_values` (the last `history_len` values) and
+        `progress_history` (sparkline) to each repo entry.
+      - Writes the index via `save_repos_index`.
+
+    The previous index is only parsed once, to seed a missing store from its
+    `progress_history_values`. With a `profiler` the whole save is recorded as
+    one phase.
+    """
+    if profiler is None:
+        _save_repos_index_with_history(repos_index, out_path, history_len)
+        return
+    with profiler.phase("save_repos_index_with_history", files=1):
+        _save_repos_index_with_history(repos_index, out_path, history_len)
+
+
+def _seed_history_store(store: ProgressHistoryStore, out_path: str) -> None:
+    """Carry history kept inside an older index over into a new store."""
+    prev = load_repos_index(out_path)
+    seeded: List[Dict[str, float]] = []
+    for repo_name, repo_data in sorted(prev.items()):
+        vals = repo_data.get("progress_history_values") if isinstance(repo_data, dict) else None
+        if not isinstance(vals, list):
+            continue
+        for i, value in enumerate(vals):
             try:
-                with open(out_path, "r", encoding="utf-8") as fh:
-                    prev = json.load(fh) or {}
+                value = float(value)
             except Exception:
-                prev = {}
-
-    # compute current averages and merge
+                continue
+            while len(seeded) <= i:
+                seeded.append({})
+            seeded[i][repo_name] = value
+    # an empty append still creates the file, so seeding happens only once
+    with open(store.path, "a", encoding="utf-8"):
+        pass
+    for values in seeded:
+        store.append(values)
+
+
+def _save_repos_index_with_history(repos_index: Dict[str, Any], out_path: str, history_len: int) -> None:
+    store = ProgressHistoryStore(ProgressHistoryStore.path_for(out_path))
+    if not store.exists() and os.path.exists(out_path):
+        _seed_history_store(store, out_path)
+
+    # compute current averages; reserved "_" keys are not repos
+    averages: Dict[str, float] = {}
     for repo_name, repo_data in repos_index.items():
+        if str(repo_name).startswith("_") or not isinstance(repo_data, dict):
+            continue
         scoring = repo_data.get("scoring", {}) or {}
         # average final_score across tasks
         scores = []
@@ -1881,27 +3733,20 @@ def save_repos_index_with_history(repos_index: Dict[str, Any], out_path: str, hi
                 scores.append(float(res.get("final_score", 0)))
             except Exception:
                 scores.append(0.0)
-        avg = float(sum(scores) / len(scores)) if scores else 0.0
-
-        prev_repo = prev.get(repo_name, {}) if isinstance(prev, dict) else {}
-        prev_vals = prev_repo.get("progress_history_values") if isinstance(prev_repo, dict) else None
-        if not isinstance(prev_vals, list):
-            prev_vals = []
-        new_vals = prev_vals + [avg]
-        # cap length
-        if len(new_vals) > history_len:
-            new_vals = new_vals[-history_len:]
-
-        # attach to repo_data
-        repo_data["progress_history_values"] = [float(x) for x in new_vals]
-        repo_data["progress_history"] = _make_sparkline(repo_data["progress_history_values"])
-
-    # finally persist using existing save function (yaml preferred)
-    try:
-        import yaml
+        averages[repo_name] = float(sum(scores) / len(scores)) if scores else 0.0
 
-        with open(out_path, "w", encoding="utf-8") as fh:
-            yaml.safe_dump(repos_index, fh, sort_keys=True)
-    except Exception:
-        with open(out_path, "w", encoding="utf-8") as fh:
-            json.dump(repos_index, fh, sort_keys=True, indent=2)
+    store.append(averages)
+    history = store.tail(list(averages), history_len)
+    for repo_name in averages:
+        repo_data = repos_index[repo_name]
+        repo_data["progress_history_values"] = history[repo_name]
+        repo_data["progress_history"] = _make_sparkline(history[repo_name])
+
+    save_repos_index(repos_index, out_path)
+
+
+if __name__ == "__main__":
+    # Simple smoke exercise when executed directly (no side effects)
+    scanner = PILScanner(repo_path=".")
+    sanity = scanner.run_sanity_gate()
+    print(json.dumps(sanity, indent=2))
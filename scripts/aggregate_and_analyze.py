@@ -2,7 +2,7 @@
 """Aggregate repositories and run AI consumer end-to-end.
 
 Usage:
-  python3 scripts/aggregate_and_analyze.py --repos . --out-repos repos_index.yml --out-ai ai_analysis.yml [--prev prev_repos_index.yml] [--llm]
+  python3 scripts/aggregate_and_analyze.py --repos . --out-repos repos_index.yml --out-ai ai_analysis.yml [--prev prev_repos_index.yml] [--llm] [--no-cache] [--jobs N] [--incremental] [--profile]
 
 This script calls into `repo-scanner.py` and `scripts/ai_consumer.py` without
 performing network actions. LLM mode is opt-in and requires environment variables.
@@ -11,6 +11,7 @@ performing network actions. LLM mode is opt-in and requires environment variable
 from __future__ import annotations
 
 import argparse
+import json
 import runpy
 import sys
 from pathlib import Path
@@ -23,19 +24,36 @@ def main(argv=None):
     p.add_argument("--out-ai", default="ai_analysis.yml")
     p.add_argument("--prev", default=None, help="Optional previous repos_index to compute deltas")
     p.add_argument("--llm", action="store_true", help="Enable optional LLM enrichment if environment is configured")
+    p.add_argument("--no-cache", action="store_true", help="Ignore and do not update each repo's .pil_cache/ signal cache")
+    p.add_argument("--jobs", type=int, default=1, help="Number of worker processes used to scan repos and score tasks (default: 1)")
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-score only tasks whose inputs changed since the existing --out-repos index",
+    )
+    p.add_argument("--profile", action="store_true", help="Record scanner phase timings")
+    p.add_argument("--profile-out", default="pil_profile.json", help="Where --profile writes its JSON report")
     args = p.parse_args(argv)
 
     # load repo-scanner functions
     ns = runpy.run_path(str(Path(__file__).resolve().parents[0] / "../repo-scanner.py"))
     aggregate_all_repos = ns.get("aggregate_all_repos")
     save_repos_index_with_history = ns.get("save_repos_index_with_history")
+    load_repos_index = ns.get("load_repos_index")
+    profiler = ns["PhaseProfiler"]() if args.profile else None
 
     if not aggregate_all_repos or not save_repos_index_with_history:
         print("repo-scanner functions not available", file=sys.stderr)
         raise SystemExit(2)
 
-    repos_index = aggregate_all_repos(args.repos)
-    save_repos_index_with_history(repos_index, args.out_repos)
+    previous_index = load_repos_index(args.out_repos) if args.incremental and load_repos_index else None
+    repos_index = aggregate_all_repos(
+        args.repos, use_cache=not args.no_cache, jobs=args.jobs, previous_index=previous_index, profiler=profiler
+    )
+    save_repos_index_with_history(repos_index, args.out_repos, profiler=profiler)
+    if profiler is not None:
+        Path(args.profile_out).write_text(json.dumps(profiler.report(), indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Wrote phase profile to {args.profile_out}")
 
     # run AI consumer
     ns2 = runpy.run_path(str(Path(__file__).resolve().parents[0] / "ai_consumer.py"))
@@ -46,7 +64,7 @@ def main(argv=None):
     if compute_delta and args.prev:
         prev = None
         try:
-            import yaml, json
+            import yaml
             pp = Path(args.prev)
             if pp.exists():
                 if yaml:
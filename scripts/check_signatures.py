@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Check required function signatures with the scanner's batch AST API (CI helper).
+
+Signatures come from `required_signatures: {file: [signature, ...]}` entries of
+the tasks in `project_map.yml`, or from a `--spec` YAML/JSON file holding such a
+mapping. A signature is a function name or `{"function", "params", "decorator"}`
+as accepted by `PILScanner.ast_check`. Each file is parsed once however many
+signatures reference it.
+
+Usage:
+  python3 scripts/check_signatures.py [--repo .] [--spec signatures.yml]
+
+Exits 0 when every signature is satisfied and 2 otherwise.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+def load_scanner(repo_root: Path):
+    scanner_file = repo_root / "repo-scanner.py"
+    if not scanner_file.exists():
+        scanner_file = Path(__file__).resolve().parents[1] / "repo-scanner.py"
+    spec = importlib.util.spec_from_file_location("repo_scanner", str(scanner_file))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def collect_checks(repo_root: Path, spec_path: str = None) -> Dict[str, List[Any]]:
+    """Merge the signature mapping from `spec_path` or from every project_map task."""
+    import yaml
+
+    if spec_path:
+        text = Path(spec_path).read_text(encoding="utf-8")
+        data = json.loads(text) if spec_path.endswith(".json") else yaml.safe_load(text)
+        sources = [data or {}]
+    else:
+        pm_path = repo_root / "project_map.yml"
+        pm = yaml.safe_load(pm_path.read_text(encoding="utf-8")) if pm_path.exists() else {}
+        sources = [e.get("required_signatures") or {} for e in (pm or {}).values() if isinstance(e, dict)]
+
+    checks: Dict[str, List[Any]] = {}
+    for mapping in sources:
+        if not isinstance(mapping, dict):
+            continue
+        for file_path, signatures in mapping.items():
+            if isinstance(signatures, (str, dict)):
+                signatures = [signatures]
+            bucket = checks.setdefault(str(file_path), [])
+            for sig in signatures or []:
+                if sig not in bucket:
+                    bucket.append(sig)
+    return checks
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser()
+    p.add_argument("--repo", default=".", help="Repository root (default: .)")
+    p.add_argument("--spec", help="YAML/JSON mapping of file -> required signatures")
+    args = p.parse_args(argv)
+
+    repo_root = Path(args.repo).resolve()
+    checks = collect_checks(repo_root, args.spec)
+    if not checks:
+        print("OK: no required signatures declared")
+        return 0
+
+    scanner = load_scanner(repo_root).PILScanner(str(repo_root))
+    verdicts = scanner.ast_check_batch(checks)
+    failed = [(f, v) for f in sorted(verdicts) for v in verdicts[f] if not v["compliant"]]
+    total = sum(len(v) for v in verdicts.values())
+    for file_path, verdict in failed:
+        print(f" - {file_path}: {verdict['diagnostic']}")
+    if failed:
+        print(f"FAIL: {len(failed)} of {total} required signatures not satisfied.")
+        return 2
+    print(f"OK: {total} required signatures satisfied across {len(verdicts)} files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,17 +7,24 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import json
 import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import List
 
 import yaml
 from jinja2 import Environment, FileSystemLoader
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from validation.canonical_schema import CANONICAL_STATUS_OK, check_canonical_schema
+from validation.spec_repository import SpecRepository, spec_repository
+
 PRODUCTS = ROOT / "products"
 TEMPLATES = ROOT / "templates"
 OUTDIR = ROOT / "ai_snapshots"
@@ -61,24 +68,20 @@ def get_git_commit() -> str:
         return "unknown"
 
 
-def load_yaml(path: Path) -> dict:
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+def _specs() -> SpecRepository:
+    return spec_repository(ROOT)
 
 
 def list_product_ids() -> List[str]:
-    return sorted(
-        p.stem
-        for p in PRODUCTS.glob("*.yml")
-        if not p.name.endswith("_worksheet.yml")
-        and p.name != "guardsuite_master_spec.yml"
-    )
+    ids = _specs().product_ids()
+    # the registry itself is exported as a snapshot alongside the products
+    if PRODUCT_INDEX_PATH.exists():
+        ids.append(PRODUCT_INDEX_PATH.stem)
+    return sorted(ids)
 
 
 def load_product_index() -> List[dict]:
-    if not PRODUCT_INDEX_PATH.exists():
-        return []
-    data = load_yaml(PRODUCT_INDEX_PATH) or {}
-    return data.get("products", [])
+    return _specs().index_entries()
 
 
 def resolve_targets(product: str | None, export_all: bool) -> List[str]:
@@ -110,7 +113,7 @@ def export(
     product_file = spec_path or (PRODUCTS / f"{product_id}.yml")
     if not product_file.exists():
         raise FileNotFoundError(f"{product_file} missing")
-    product = load_yaml(product_file)
+    product = _specs().load(product_file)
     tpl = env.get_template("spec_snapshot.md.j2")
     ts = datetime.now(timezone.utc)
     iso_timestamp = ts.isoformat().replace("+00:00", "Z")
@@ -159,16 +162,12 @@ def _export_pillar_template(
     )
 
 
-def _index_map(entries: List[dict]) -> Dict[str, dict]:
-    return {entry.get("product_id"): entry for entry in entries}
-
-
 def export_product_index_snapshot(outdir: Path, canonical_status: str) -> Path:
     if not PRODUCT_INDEX_PATH.exists():
         raise FileNotFoundError("products/product_index.yml missing")
     ts = datetime.now(timezone.utc)
     iso_timestamp = ts.isoformat().replace("+00:00", "Z")
-    registry_manifest = load_yaml(PRODUCT_INDEX_PATH) or {}
+    registry_manifest = copy.deepcopy(_specs().index_document())
     registry_metadata = registry_manifest.get("metadata")
     if isinstance(registry_metadata, dict):
         registry_metadata["canonical_schema_status"] = canonical_status
@@ -191,41 +190,32 @@ def export_product_index_snapshot(outdir: Path, canonical_status: str) -> Path:
 def export_products_bundle(
     product_ids: List[str],
     outdir: Path,
-    index_entries: List[dict],
     canonical_status: str,
 ) -> Path:
-    index_lookup = _index_map(index_entries)
+    specs = _specs()
     ts = datetime.now(timezone.utc)
     iso_timestamp = ts.isoformat().replace("+00:00", "Z")
     bundle: List[dict] = []
     for pid in product_ids:
+        # any products/<id>.yml is bundled, the product index included
         spec_path = PRODUCTS / f"{pid}.yml"
         if not spec_path.exists():
             continue
-        spec = load_yaml(spec_path)
-        entry = index_lookup.get(pid, {})
-        schema_path = entry.get("schema_path")
-        schema = None
-        if schema_path:
-            schema_file = ROOT / schema_path
-            if schema_file.exists():
-                schema = load_yaml(schema_file)
-        contract_ref = entry.get("contract_ref")
-        contract = None
-        if contract_ref:
-            contract_file = ROOT / contract_ref
-            if contract_file.exists():
-                contract = load_yaml(contract_file)
+        entry = specs.index_entry(pid) or {}
+        # documents are shared between products (e.g. one schema for several);
+        # copy them so the dump does not turn repeats into YAML aliases
         bundle.append(
-            {
-                "product_id": pid,
-                "category": entry.get("category"),
-                "spec": spec,
-                "schema_path": schema_path,
-                "schema": schema,
-                "contract_ref": contract_ref,
-                "contract": contract,
-            }
+            copy.deepcopy(
+                {
+                    "product_id": pid,
+                    "category": entry.get("category"),
+                    "spec": specs.load(spec_path.relative_to(ROOT)),
+                    "schema_path": entry.get("schema_path"),
+                    "schema": specs.schema(pid),
+                    "contract_ref": entry.get("contract_ref"),
+                    "contract": specs.contract(pid),
+                }
+            )
         )
     payload = {
         "meta": {
@@ -258,7 +248,7 @@ def export_contracts_bundle(
             {
                 "product_id": entry.get("product_id"),
                 "contract_ref": ref,
-                "contract": load_yaml(target),
+                "contract": copy.deepcopy(_specs().load(ref)),
             }
         )
     if not contracts:
@@ -304,11 +294,11 @@ def _export_crossmap_product(
     canonical_excerpt: dict | None,
 ) -> Path:
     spec_path = PRODUCTS / f"{product_id}.yml"
-    if not spec_path.exists():
+    if product_id not in _specs().spec_paths():
         raise FileNotFoundError(
             f"{spec_path} missing; crossmap export requires every product spec on disk"
         )
-    spec = load_yaml(spec_path) or {}
+    spec = _specs().spec(product_id) or {}
     ts = datetime.now(timezone.utc)
     iso_timestamp = ts.isoformat().replace("+00:00", "Z")
     meta = {
@@ -351,8 +341,7 @@ def _resolve_crossmap_targets(index_entries: List[dict]) -> List[str]:
     for product_id in sorted(CROSSMAP_PRODUCT_SET):
         if product_id not in index_ids:
             continue
-        spec_path = PRODUCTS / f"{product_id}.yml"
-        if not spec_path.exists():
+        if product_id not in _specs().spec_paths():
             continue
         available.append(product_id)
     return available
@@ -384,7 +373,7 @@ def export_playground_contract(
     contract_path = ROOT / "contracts" / "playground_contract.yml"
     if not contract_path.exists():
         raise FileNotFoundError(f"{contract_path} missing")
-    contract = load_yaml(contract_path)
+    contract = _specs().load(contract_path)
     ts = datetime.now(timezone.utc)
     iso_timestamp = ts.isoformat().replace("+00:00", "Z")
     meta = {
@@ -461,17 +450,16 @@ def load_canonical_schema_or_die() -> dict:
 
 
 def _run_canonical_validator(failure_prefix: str) -> str:
-    validator = ROOT / "scripts" / "validate_products.py"
-    cmd = [sys.executable, str(validator), "--check-canonical"]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if result.returncode != 0:
-        detail = (result.stderr or "").strip() or (result.stdout or "").strip()
-        if not detail:
-            detail = "validator reported an unknown failure"
-        print(f"{failure_prefix}{detail}", file=sys.stderr)
-        sys.exit(result.returncode)
-    status_line = (result.stdout or "").strip() or "canonical_schema: OK"
-    return status_line
+    """In-process `validate_products.py --check-canonical`; return its status line."""
+    try:
+        check_canonical_schema(ROOT)
+    except (FileNotFoundError, ValueError) as exc:
+        print(
+            f"{failure_prefix}Canonical schema CI check failed: {exc}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return CANONICAL_STATUS_OK
 
 
 def _write_canonical_status(outdir: Path, status_line: str) -> None:
@@ -526,6 +514,7 @@ def main() -> None:
         "--out", default=str(OUTDIR), help="output directory for snapshots"
     )
     args = parser.parse_args()
+    _specs().reload()
 
     needs_registry_guard = bool(args.all)
     needs_crossmap_guard = (
@@ -562,7 +551,7 @@ def main() -> None:
                 pid, outdir, canonical_excerpt, canonical_status_line, rollup_reference
             )
     if args.all:
-        export_products_bundle(targets, outdir, index_entries, canonical_status_line)
+        export_products_bundle(targets, outdir, canonical_status_line)
         export_product_index_snapshot(outdir, canonical_status_line)
         export_contracts_bundle(index_entries, outdir, canonical_status_line)
         export_crossmap_products(
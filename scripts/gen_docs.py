@@ -2,29 +2,45 @@
 # COPILOT: Maintain strict YAML → Markdown determinism. Never reorder fields arbitrarily.
 # COPILOT: When adding validation rules, ensure backward-compatibility with all product YAML.
 # scripts/gen_docs.py
-"""Generate Markdown docs from products/*.yml using templates/*.j2."""
+"""Generate Markdown docs from products/*.yml using templates/*.j2.
+
+Rendering is incremental: each product page records the content hashes of
+its inputs (spec, snippets, template and partials, contract, compliance
+matrix, canonical schema) and its related products' names in a render
+manifest under `.pil_cache/`, and is only re-rendered when one of them, the
+page itself or this script changed. Pages without timestamps are rewritten
+only when their content differs, so unchanged outputs stay byte-identical.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 import yaml
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from jinja2 import meta as jinja_meta
 
 ROOT = Path(__file__).resolve().parents[1]
-PRODUCTS = ROOT / "products"
-PRODUCT_SPECS = ROOT / "product_specs"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from validation import validation_manifest
+from validation.canonical_schema import check_canonical_schema
+from validation.process_pool import fork_context, fork_pool
+from validation.spec_repository import SpecRepository, spec_repository
+
 TEMPLATES = ROOT / "templates"
 OUTDIR = ROOT / "docs" / "products"
-PRODUCT_INDEX = PRODUCTS / "product_index.yml"
 PRODUCTS_DOC_DIR = ROOT / "docs" / "products"
 CANONICAL_SCHEMA_PATH = ROOT / "guardsuite-core" / "canonical_schema.json"
+SNIPPETS_REL = "snippets/marketing.yml"
 SCHEMA_DOC_DIR = ROOT / "docs" / "schema"
 
 DEFAULT_TEMPLATE = "product_page.md.j2"
@@ -32,15 +48,29 @@ PRODUCT_TEMPLATE_OVERRIDES = {
     "playground": "spec_page.md.j2",
 }
 LEGACY_PRODUCT_IDS = {"pillar-template"}
+BYTECODE_CACHE_DIR = ROOT / ".pil_cache" / "jinja"
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
 
 env = Environment(loader=FileSystemLoader(str(TEMPLATES)), autoescape=False)
 _CANONICAL_SCHEMA_CACHE: dict | None = None
 _CANONICAL_SCHEMA_TEXT: str | None = None
+_TEMPLATE_DEPENDENCIES: Dict[str, List[Path]] = {}
 
 
-def load_yaml(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh)
+def _enable_bytecode_cache() -> None:
+    """Persist compiled templates across runs under `BYTECODE_CACHE_DIR`.
+
+    Called from `main` rather than at import, so loading this module (tests,
+    mkdocs hooks) never creates the cache dir. Left off if it is unwritable.
+    """
+    if env.bytecode_cache is not None:
+        return
+    try:
+        BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return
+    env.bytecode_cache = FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR))
 
 
 def get_git_commit() -> str:
@@ -56,44 +86,17 @@ def get_git_commit() -> str:
         return "unknown"
 
 
-def _product_candidate_paths(product_id: str) -> List[Path]:
-    return [
-        PRODUCTS / f"{product_id}.yml",
-        PRODUCT_SPECS / f"{product_id}.yml",
-    ]
-
-
-def resolve_product_spec(product_id: str) -> Path:
-    for path in _product_candidate_paths(product_id):
-        if path.exists():
-            return path
-    raise FileNotFoundError(
-        f"Product '{product_id}' spec missing under products/ or product_specs/."
-    )
-
-
-def find_product_spec(product_id: str) -> Path | None:
-    for path in _product_candidate_paths(product_id):
-        if path.exists():
-            return path
-    return None
+def _specs() -> SpecRepository:
+    return spec_repository(ROOT)
 
 
 def iter_product_files() -> List[Path]:
-    files = [
-        p
-        for p in PRODUCTS.glob("*.yml")
-        if not p.name.endswith("_worksheet.yml")
-        and p.name not in {"guardsuite_master_spec.yml", "product_index.yml"}
-    ]
-    seen_ids = {p.stem for p in files}
-    for legacy_id in sorted(LEGACY_PRODUCT_IDS):
-        if legacy_id in seen_ids:
-            continue
-        legacy_path = PRODUCT_SPECS / f"{legacy_id}.yml"
-        if legacy_path.exists():
+    specs = _specs()
+    files = list(specs.spec_paths().values())
+    for legacy_id in sorted(LEGACY_PRODUCT_IDS - set(specs.spec_paths())):
+        legacy_path = specs.spec_path(legacy_id)
+        if legacy_path:
             files.append(legacy_path)
-            seen_ids.add(legacy_id)
     return sorted(files, key=lambda path: path.stem)
 
 
@@ -107,7 +110,7 @@ def load_optional_yaml(relative_path: str | None) -> dict | None:
     target = ROOT / relative_path
     if not target.exists():
         raise FileNotFoundError(f"Referenced snippet {relative_path} missing")
-    return load_yaml(target)
+    return _specs().load(relative_path)
 
 
 def _load_canonical_schema() -> dict:
@@ -129,9 +132,13 @@ def _canonical_schema_text() -> str:
     return _CANONICAL_SCHEMA_TEXT or "{}"
 
 
-def _canonical_schema_context(product: dict) -> dict | None:
+def _canonical_schema_context_required(product: dict) -> bool:
     schema_source = (product.get("architecture") or {}).get("schema_source")
-    if schema_source != "guardsuite-core/canonical_schema.json":
+    return schema_source == "guardsuite-core/canonical_schema.json"
+
+
+def _canonical_schema_context(product: dict) -> dict | None:
+    if not _canonical_schema_context_required(product):
         return None
     payload = _load_canonical_schema()
     pretty = _canonical_schema_text()
@@ -151,59 +158,26 @@ def _canonical_schema_context(product: dict) -> dict | None:
 
 
 def _run_canonical_validator(failure_prefix: str) -> None:
-    validator = ROOT / "scripts" / "validate_products.py"
-    cmd = [sys.executable, str(validator), "--check-canonical"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        detail = (result.stderr or "").strip() or (result.stdout or "").strip()
-        if not detail:
-            detail = "validator reported an unknown failure"
-        print(f"{failure_prefix}{detail}", file=sys.stderr)
-        raise SystemExit(result.returncode)
+    """In-process equivalent of `validate_products.py --check-canonical`."""
+    try:
+        check_canonical_schema(ROOT)
+    except (FileNotFoundError, ValueError) as exc:
+        print(
+            f"{failure_prefix}Canonical schema CI check failed: {exc}",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
 
 
 def _canonical_preflight() -> None:
     _run_canonical_validator("Canonical schema docs build failed: ")
 
 
-def resolve_related_products(product_ids: List[str]) -> List[dict]:
-    related: List[dict] = []
-    for pid in product_ids:
-        display_name = pid
-        spec_path = find_product_spec(pid)
-        if spec_path:
-            try:
-                display_name = load_yaml(spec_path).get("name", pid)
-            except Exception:
-                display_name = pid
-        related.append(
-            {
-                "id": pid,
-                "name": display_name,
-                "doc_path": f"{pid}.md",
-            }
-        )
-    return related
-
-
 def load_product_index_entries() -> List[dict]:
-    if not PRODUCT_INDEX.exists():
-        return []
-    data = load_yaml(PRODUCT_INDEX) or {}
-    entries = data.get("products", [])
+    entries = _specs().index_entries()
     return sorted(entries, key=lambda entry: entry.get("product_id", ""))
 
 
-def _product_display_name(product_id: str) -> str:
-    spec_path = find_product_spec(product_id)
-    if not spec_path:
-        return product_id
-    try:
-        return load_yaml(spec_path).get("name", product_id)
-    except Exception:
-        return product_id
-
-
 def validate_product(product: dict, product_id: str) -> None:
     required_keys = ("id", "name", "version", "features")
     for key in required_keys:
@@ -219,38 +193,205 @@ def _template_for_product(product_id: str) -> str:
     return PRODUCT_TEMPLATE_OVERRIDES.get(product_id, DEFAULT_TEMPLATE)
 
 
-def render_product(product_id: str, outdir: Path, snippets: dict) -> Path:
-    product_file = resolve_product_spec(product_id)
-    product = load_yaml(product_file)
-    validate_product(product, product_id)
-    tpl_name = _template_for_product(product_id)
-    tpl = env.get_template(tpl_name)
-    iso_timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    meta = {"commit": get_git_commit(), "timestamp": iso_timestamp}
-    compliance_matrix = load_optional_yaml(
-        product.get("compliance", {}).get("matrix_snippet")
-    )
-    contract_spec = load_optional_yaml(product.get("contract_ref"))
-    contract_yaml = (
-        yaml.safe_dump(contract_spec, sort_keys=False) if contract_spec else None
-    )
-    related_links = resolve_related_products(product.get("related_products", []))
-    canonical_schema = _canonical_schema_context(product)
-    rendered = tpl.render(
-        product=product,
-        snippets=snippets,
-        meta=meta,
-        product_raw=yaml.safe_dump(product, sort_keys=False),
-        compliance_matrix=compliance_matrix,
-        contract_spec=contract_spec,
-        contract_yaml=contract_yaml,
-        related_product_links=related_links,
-        canonical_schema=canonical_schema,
-    )
-    outdir.mkdir(parents=True, exist_ok=True)
-    outpath = outdir / f"{product_id}.md"
-    outpath.write_text(rendered, encoding="utf-8")
-    return outpath
+def template_dependencies(name: str) -> List[Path]:
+    """Return `name` and every template it includes, extends or imports."""
+    if name not in _TEMPLATE_DEPENDENCIES:
+        seen: List[str] = []
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.append(current)
+            source = env.loader.get_source(env, current)[0]
+            refs = jinja_meta.find_referenced_templates(env.parse(source))
+            pending.extend(ref for ref in refs if ref)
+        _TEMPLATE_DEPENDENCIES[name] = [TEMPLATES / ref for ref in sorted(seen)]
+    return _TEMPLATE_DEPENDENCIES[name]
+
+
+def product_page_inputs(product_id: str, product: dict) -> List[Path]:
+    """Files whose content decides the rendered page for `product_id`."""
+    inputs = [_specs().spec_path(product_id), ROOT / SNIPPETS_REL]
+    inputs.extend(template_dependencies(_template_for_product(product_id)))
+    referenced = [
+        product.get("contract_ref"),
+        (product.get("compliance") or {}).get("matrix_snippet"),
+    ]
+    inputs.extend(ROOT / ref for ref in referenced if ref)
+    if _canonical_schema_context_required(product):
+        inputs.append(CANONICAL_SCHEMA_PATH)
+    return inputs
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write `text` to `path` unless it already holds exactly that content."""
+    data = text.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+class RenderSession:
+    """Run-wide rendering context shared by every product page.
+
+    The commit, timestamp, snippets, product display names, canonical schema
+    excerpt and dumped contracts are computed once per run instead of once
+    per page; `warm` resolves them up front so forked workers inherit them.
+    """
+
+    def __init__(
+        self, snippets: dict, commit: str | None = None, timestamp: str | None = None
+    ):
+        self.snippets = snippets
+        self.meta = {
+            "commit": get_git_commit() if commit is None else commit,
+            "timestamp": timestamp
+            or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        }
+        self.names: Dict[str, str] = {}
+        self._contract_yaml: Dict[str | None, str | None] = {}
+        self._canonical_schema: dict | None = None
+
+    def product_name(self, product_id: str) -> str:
+        if product_id not in self.names:
+            self.names[product_id] = _specs().display_name(product_id)
+        return self.names[product_id]
+
+    def related_links(self, product_ids: List[str]) -> List[dict]:
+        return [
+            {"id": pid, "name": self.product_name(pid), "doc_path": f"{pid}.md"}
+            for pid in product_ids
+        ]
+
+    def contract_yaml(self, contract_ref: str | None) -> str | None:
+        """Dump a contract for display once, however many products share it."""
+        if contract_ref not in self._contract_yaml:
+            contract_spec = load_optional_yaml(contract_ref)
+            self._contract_yaml[contract_ref] = (
+                yaml.safe_dump(contract_spec, sort_keys=False)
+                if contract_spec
+                else None
+            )
+        return self._contract_yaml[contract_ref]
+
+    def canonical_schema(self, product: dict) -> dict | None:
+        if not _canonical_schema_context_required(product):
+            return None
+        if self._canonical_schema is None:
+            self._canonical_schema = _canonical_schema_context(product)
+        return self._canonical_schema
+
+    def warm(self, product_ids: List[str]) -> None:
+        """Parse specs and references and compile templates for `product_ids`."""
+        for pid in product_ids:
+            product = _specs().spec(pid)
+            env.get_template(_template_for_product(pid))
+            self.related_links(product.get("related_products", []))
+            self.contract_yaml(product.get("contract_ref"))
+            load_optional_yaml(product.get("compliance", {}).get("matrix_snippet"))
+            self.canonical_schema(product)
+
+    def render(self, product_id: str, outdir: Path) -> Path:
+        product = _specs().spec(product_id)
+        validate_product(product, product_id)
+        tpl = env.get_template(_template_for_product(product_id))
+        contract_ref = product.get("contract_ref")
+        rendered = tpl.render(
+            product=product,
+            snippets=self.snippets,
+            meta=self.meta,
+            product_raw=yaml.safe_dump(product, sort_keys=False),
+            compliance_matrix=load_optional_yaml(
+                product.get("compliance", {}).get("matrix_snippet")
+            ),
+            contract_spec=load_optional_yaml(contract_ref),
+            contract_yaml=self.contract_yaml(contract_ref),
+            related_product_links=self.related_links(
+                product.get("related_products", [])
+            ),
+            canonical_schema=self.canonical_schema(product),
+        )
+        outdir.mkdir(parents=True, exist_ok=True)
+        outpath = outdir / f"{product_id}.md"
+        outpath.write_text(rendered, encoding="utf-8")
+        return outpath
+
+
+def render_product(
+    product_id: str,
+    outdir: Path,
+    snippets: dict,
+    session: RenderSession | None = None,
+) -> Path:
+    return (session or RenderSession(snippets)).render(product_id, outdir)
+
+
+# State handed to forked render workers; populated only while a pool is alive.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _render_in_worker(product_id: str) -> Path:
+    """Pool entry point: render one page with the inherited `_WORKER_STATE`."""
+    return _WORKER_STATE["session"].render(product_id, _WORKER_STATE["outdir"])
+
+
+def _render_all(
+    product_ids: List[str], outdir: Path, session: RenderSession, jobs: int | None
+) -> Iterator[Path]:
+    """Yield rendered page paths in `product_ids` order, on a forked pool."""
+    workers = max(1, min(jobs or DEFAULT_WORKERS, len(product_ids)))
+    if workers == 1 or fork_context() is None:
+        for pid in product_ids:
+            yield session.render(pid, outdir)
+        return
+    session.warm(product_ids)
+    _WORKER_STATE.update(session=session, outdir=outdir)
+    try:
+        with fork_pool(workers, _render_in_worker) as pool:
+            yield from pool.map(_render_in_worker, product_ids)
+    finally:
+        _WORKER_STATE.clear()
+
+
+def render_pages(
+    product_ids: List[str],
+    outdir: Path,
+    session: RenderSession,
+    manifest,
+    jobs: int | None = None,
+) -> Tuple[List[Path], int]:
+    """Render pages whose inputs changed; return (written pages, unchanged count).
+
+    Manifest lookups and records stay in this process, in `product_ids`
+    order, so a page that fails to render leaves earlier ones recorded.
+    """
+    pending = []
+    for pid in product_ids:
+        product = _specs().spec(pid)
+        outpath = outdir / f"{pid}.md"
+        key = f"page:{_display_path(outpath)}"
+        context = [
+            session.product_name(ref) for ref in product.get("related_products", [])
+        ]
+        if manifest.lookup(key, context=context) is None:
+            inputs = [*product_page_inputs(pid, product), outpath]
+            pending.append((pid, key, inputs, context))
+    written: List[Path] = []
+    rendered = _render_all([page[0] for page in pending], outdir, session, jobs)
+    for (_, key, inputs, context), outpath in zip(pending, rendered):
+        manifest.invalidate(outpath)
+        manifest.record(key, inputs, context=context)
+        written.append(outpath)
+    return written, len(product_ids) - len(pending)
 
 
 def render_ecosystem_overview(entries: List[dict]) -> Path:
@@ -266,14 +407,14 @@ def render_ecosystem_overview(entries: List[dict]) -> Path:
     ]
     for entry in entries:
         product_id = entry.get("product_id", "unknown")
-        name = _product_display_name(product_id)
+        name = _specs().display_name(product_id)
         contract = entry.get("contract_ref") or "none"
         related = ", ".join(entry.get("related_products", [])) or "none"
         lines.append(
             f"| [{name}]({product_id}.md) | {entry.get('version', 'n/a')} | {entry.get('category', 'n/a')} "
             f"| `{contract}` | {related} |"
         )
-    doc_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _write_if_changed(doc_path, "\n".join(lines) + "\n")
     return doc_path
 
 
@@ -300,7 +441,7 @@ def render_canonical_schema_doc() -> Path:
         pretty,
         "```",
     ]
-    doc_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _write_if_changed(doc_path, "\n".join(lines) + "\n")
     return doc_path
 
 
@@ -332,16 +473,46 @@ def main() -> None:
     parser.add_argument(
         "--out", default=str(OUTDIR), help="output directory for generated docs"
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-render every page, ignoring the render manifest",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=f"Worker processes for rendering pages (default: {DEFAULT_WORKERS})",
+    )
     args = parser.parse_args()
 
+    _specs().reload()
     _canonical_preflight()
 
     targets = resolve_targets(args.product, args.all)
-    snippets = load_yaml(ROOT / "snippets" / "marketing.yml")
+    snippets = _specs().load(SNIPPETS_REL)
     outdir = Path(args.out)
-    for pid in targets:
-        outpath = render_product(pid, outdir, snippets)
+    manifest = validation_manifest.ValidationManifest.for_validator(
+        ROOT,
+        "gen_docs",
+        [Path(__file__), *validation_manifest.SHARED_SOURCES],
+        full=args.full,
+    )
+    _enable_bytecode_cache()
+    session = RenderSession(snippets)
+    try:
+        written, unchanged = render_pages(
+            targets, outdir, session, manifest, jobs=args.jobs
+        )
+    finally:
+        manifest.save()
+    for outpath in written:
         print(f"Wrote {outpath}")
+    if unchanged:
+        print(
+            f"{unchanged} page(s) with unchanged inputs were left as-is "
+            "(use --full to re-render)."
+        )
     overview_entries = load_product_index_entries()
     if overview_entries:
         overview_path = render_ecosystem_overview(overview_entries)
@@ -355,4 +526,5 @@ if __name__ == "__main__":
 
 
 def on_pre_build(config, **kwargs):  # pragma: no cover - invoked via mkdocs hooks
+    _specs().reload()
     _run_canonical_validator("Canonical schema mkdocs build failed: ")
@@ -6,9 +6,19 @@ Drop this file into a repo root (alongside `repo-scanner.py` and `scripts/pil_bo
 
 It will perform safe, non-destructive bootstrapping (create missing templates/placeholders),
 then run the scanner and print YAML results. Designed to be minimal and portable.
+
+AST-derived signals are cached under `.pil_cache/` so re-runs only re-parse files
+that changed; pass `--no-cache` to force a cold scan. `--profile` records per-phase
+wall time, call counts and files touched and writes them to `--profile-out`.
+
+`--watch` keeps the scanner resident after the first run: it polls the repo every
+`--interval` seconds, waits `--debounce` seconds for a burst of edits to settle,
+re-scores only the tasks whose inputs changed and prints the score deltas.
 """
 from __future__ import annotations
 
+import argparse
+import json
 import sys
 from pathlib import Path
 
@@ -23,7 +33,44 @@ def ensure_pyyaml():
         return False
 
 
-def main() -> int:
+def watch(scanner, interval: float, debounce: float) -> None:
+    """Print the first full scan, then one line per settled change plus its score deltas."""
+    import yaml
+
+    updates = scanner.watch(interval=interval, debounce=debounce)
+    try:
+        for i, update in enumerate(updates):
+            if i == 0:
+                print(yaml.safe_dump(update["results"]))
+                print(f"Scored {len(update['rescored'])} tasks in {update['elapsed_s']:.2f}s; watching for changes (Ctrl-C to stop)")
+                continue
+            changed = update["changed"]
+            shown = ", ".join(changed[:5]) + (f" (+{len(changed) - 5} more)" if len(changed) > 5 else "")
+            print(f"{shown}: re-scored {len(update['rescored'])} task(s) in {update['elapsed_s']:.2f}s")
+            for task_id, delta in update["deltas"].items():
+                before, after = delta["before"], delta["after"]
+                if before is None or after is None:
+                    print(f"  {task_id}: {before} -> {after}")
+                else:
+                    print(f"  {task_id}: {before} -> {after} ({after - before:+})")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        updates.close()
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser()
+    p.add_argument("--no-cache", action="store_true", help="Ignore and do not update the .pil_cache/ signal cache")
+    p.add_argument("--jobs", type=int, default=1, help="Number of worker processes used to score tasks (default: 1)")
+    p.add_argument("--profile", action="store_true", help="Record scanner phase timings")
+    p.add_argument("--profile-out", default="pil_profile.json", help="Where --profile writes its JSON report")
+    p.add_argument("--watch", action="store_true", help="Keep running and re-score on file changes (Ctrl-C to stop)")
+    p.add_argument("--interval", type=float, default=1.0, help="Seconds between --watch polls (default: 1.0)")
+    p.add_argument("--debounce", type=float, default=0.3, help="Seconds a change must settle before re-scoring (default: 0.3)")
+    args = p.parse_args(argv)
+
     repo_root = Path.cwd()
 
     if not ensure_pyyaml():
@@ -63,9 +110,16 @@ def main() -> int:
             return 3
         mod = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(mod)
-        scanner = mod.PILScanner(str(repo_root))
-        results = scanner.scoring_loop()
-        print(yaml.safe_dump(results))
+        profiler = mod.PhaseProfiler() if args.profile else None
+        scanner = mod.PILScanner(str(repo_root), use_cache=not args.no_cache, jobs=args.jobs, profiler=profiler)
+        if args.watch:
+            watch(scanner, args.interval, args.debounce)
+        else:
+            results = scanner.scoring_loop()
+            print(yaml.safe_dump(results))
+        if profiler is not None:
+            Path(args.profile_out).write_text(json.dumps(profiler.report(), indent=2, sort_keys=True), encoding="utf-8")
+            print(f"Wrote phase profile to {args.profile_out}", file=sys.stderr)
         return 0
     except Exception as exc:  # pragma: no cover - runtime
         print("Failed to run repo-scanner:", exc, file=sys.stderr)
@@ -5,26 +5,36 @@
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
+import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from jsonschema import Draft202012Validator
+from jsonschema import Draft202012Validator, SchemaError
 import yaml
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from validation import validation_manifest
+from validation.canonical_schema import (
+    CANONICAL_SCHEMA_REL,
+    CANONICAL_STATUS_OK,
+    check_canonical_schema,
+)
+from validation.process_pool import fork_context, fork_pool
+from validation.schema_cache import compiled_validator
+from validation.spec_repository import spec_repository
+from validation.yaml_loader import load_yaml
+
 PRODUCTS = ROOT / "products"
 PRODUCT_INDEX_PATH = PRODUCTS / "product_index.yml"
-CANONICAL_SCHEMA_REL = "guardsuite-core/canonical_schema.json"
 CANONICAL_SCHEMA_PATH = ROOT / CANONICAL_SCHEMA_REL
-CANONICAL_REQUIRED_TOP_LEVEL = {
-    "plan_id",
-    "schema_version",
-    "resources",
-    "metadata",
-}
 
 REQUIRED_FIELDS = [
     "id",
@@ -49,141 +59,13 @@ PRODUCT_TYPE_CATEGORY = {
 PRODUCT_VALIDATION_EXCLUSIONS = {"pillar-template", "guardsuite-template"}
 
 SEMANTIC_DIR = ROOT / "semantic"
-SEMANTIC_RULES_PATH = SEMANTIC_DIR / "semantic_rules.yml"
-SEMANTIC_RULES_SCHEMA = SEMANTIC_DIR / "semantic_rules.schema.yml"
-SEMANTIC_RULES_PREFIX = "Semantic rules schema failed: "
-SEMANTIC_CATEGORIES_PATH = SEMANTIC_DIR / "semantic_categories.yml"
-SEMANTIC_CATEGORIES_SCHEMA = SEMANTIC_DIR / "semantic_categories.schema.yml"
-SEMANTIC_CATEGORIES_PREFIX = "Semantic categories schema failed: "
-SEMANTIC_ENTITIES_PATH = SEMANTIC_DIR / "semantic_entities.yml"
-SEMANTIC_ENTITIES_SCHEMA = SEMANTIC_DIR / "semantic_entities.schema.yml"
-SEMANTIC_ENTITIES_PREFIX = "Semantic entities schema failed: "
-SEMANTIC_CROSSREF_PATH = SEMANTIC_DIR / "semantic_crossref.yml"
-SEMANTIC_CROSSREF_SCHEMA = SEMANTIC_DIR / "semantic_crossref.schema.yml"
-SEMANTIC_CROSSREF_PREFIX = "Semantic crossref schema failed: "
-SEMANTIC_REGISTRY_PATH = SEMANTIC_DIR / "semantic_registry.yml"
-SEMANTIC_REGISTRY_SCHEMA = SEMANTIC_DIR / "semantic_registry.schema.yml"
-SEMANTIC_REGISTRY_PREFIX = "Semantic registry schema failed: "
-SEMANTIC_RULE_TEMPLATE_PATH = SEMANTIC_DIR / "semantic_rule_template.yml"
-SEMANTIC_RULE_TEMPLATE_SCHEMA = SEMANTIC_DIR / "semantic_rule_template.schema.yml"
-SEMANTIC_RULE_TEMPLATE_PREFIX = "Semantic rule template schema failed: "
-SEMANTIC_RULE_MANIFEST_PATH = SEMANTIC_DIR / "semantic_rules_manifest.yml"
-SEMANTIC_RULE_MANIFEST_SCHEMA = SEMANTIC_DIR / "semantic_rules_manifest.schema.yml"
-SEMANTIC_RULE_MANIFEST_PREFIX = "Semantic rule manifest schema failed: "
-SEMANTIC_INTEGRITY_PATH = SEMANTIC_DIR / "semantic_integrity.yml"
-SEMANTIC_INTEGRITY_SCHEMA = SEMANTIC_DIR / "semantic_integrity.schema.yml"
-SEMANTIC_INTEGRITY_PREFIX = "Semantic integrity schema failed: "
-SEMANTIC_COVERAGE_PATH = SEMANTIC_DIR / "semantic_coverage.yml"
-SEMANTIC_COVERAGE_SCHEMA = SEMANTIC_DIR / "semantic_coverage.schema.yml"
-SEMANTIC_COVERAGE_PREFIX = "Semantic coverage schema failed: "
-SEMANTIC_POLICY_PATH = SEMANTIC_DIR / "semantic_policy.yml"
-SEMANTIC_POLICY_SCHEMA = SEMANTIC_DIR / "semantic_policy.schema.yml"
-SEMANTIC_POLICY_PREFIX = "Semantic policy schema failed: "
-SEMANTIC_SURFACE_INDEX_PATH = SEMANTIC_DIR / "semantic_surface_index.yml"
-SEMANTIC_SURFACE_INDEX_SCHEMA = SEMANTIC_DIR / "semantic_surface_index.schema.yml"
-SEMANTIC_SURFACE_INDEX_PREFIX = "Semantic surface index schema failed: "
-SEMANTIC_SURFACE_GROUPS_PATH = SEMANTIC_DIR / "semantic_surface_groups.yml"
-SEMANTIC_SURFACE_GROUPS_SCHEMA = SEMANTIC_DIR / "semantic_surface_groups.schema.yml"
-SEMANTIC_SURFACE_GROUPS_PREFIX = "Semantic surface groups schema failed: "
-SEMANTIC_SURFACE_MAP_PATH = SEMANTIC_DIR / "semantic_surface_map.yml"
-SEMANTIC_SURFACE_MAP_SCHEMA = SEMANTIC_DIR / "semantic_surface_map.schema.yml"
-SEMANTIC_SURFACE_MAP_PREFIX = "Semantic surface map schema failed: "
-SEMANTIC_SURFACE_MATRIX_PATH = SEMANTIC_DIR / "semantic_surface_matrix.yml"
-SEMANTIC_SURFACE_MATRIX_SCHEMA = SEMANTIC_DIR / "semantic_surface_matrix.schema.yml"
-SEMANTIC_SURFACE_MATRIX_PREFIX = "Semantic surface matrix schema failed: "
-SEMANTIC_SURFACE_MANIFEST_PATH = SEMANTIC_DIR / "semantic_surface_manifest.yml"
-SEMANTIC_SURFACE_MANIFEST_SCHEMA = SEMANTIC_DIR / "semantic_surface_manifest.schema.yml"
-SEMANTIC_SURFACE_MANIFEST_PREFIX = "Semantic surface manifest schema failed: "
-SEMANTIC_GOVERNANCE_INDEX_PATH = SEMANTIC_DIR / "semantic_governance_index.yml"
-SEMANTIC_GOVERNANCE_INDEX_SCHEMA = SEMANTIC_DIR / "semantic_governance_index.schema.yml"
-SEMANTIC_GOVERNANCE_INDEX_PREFIX = "Semantic governance index schema failed: "
-SEMANTIC_PROVENANCE_PATH = SEMANTIC_DIR / "semantic_provenance.yml"
-SEMANTIC_PROVENANCE_SCHEMA = SEMANTIC_DIR / "semantic_provenance.schema.yml"
-SEMANTIC_PROVENANCE_PREFIX = "Semantic provenance schema failed: "
-SEMANTIC_CONFIGURATION_PATH = SEMANTIC_DIR / "semantic_configuration.yml"
-SEMANTIC_CONFIGURATION_SCHEMA = SEMANTIC_DIR / "semantic_configuration.schema.yml"
-SEMANTIC_CONFIGURATION_PREFIX = "Semantic configuration schema failed: "
-SEMANTIC_RUNTIME_PATH = SEMANTIC_DIR / "semantic_runtime.yml"
-SEMANTIC_RUNTIME_SCHEMA = SEMANTIC_DIR / "semantic_runtime.schema.yml"
-SEMANTIC_RUNTIME_PREFIX = "Semantic runtime schema failed: "
-SEMANTIC_RUNTIME_ENVIRONMENT_PATH = SEMANTIC_DIR / "semantic_runtime_environment.yml"
-SEMANTIC_RUNTIME_ENVIRONMENT_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_environment.schema.yml"
-)
-SEMANTIC_RUNTIME_ENVIRONMENT_PREFIX = "Semantic runtime environment schema failed: "
-SEMANTIC_RUNTIME_CAPABILITIES_PATH = SEMANTIC_DIR / "semantic_runtime_capabilities.yml"
-SEMANTIC_RUNTIME_CAPABILITIES_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_capabilities.schema.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITIES_PREFIX = "Semantic runtime capabilities schema failed: "
-SEMANTIC_RUNTIME_CAPABILITIES_REGISTRY_PATH = (
-    SEMANTIC_DIR / "semantic_runtime_capabilities_registry.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITIES_REGISTRY_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_capabilities_registry.schema.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITIES_REGISTRY_PREFIX = (
-    "Semantic runtime capabilities registry schema failed: "
-)
-SEMANTIC_RUNTIME_CAPABILITY_MATRIX_PATH = (
-    SEMANTIC_DIR / "semantic_runtime_capability_matrix.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_MATRIX_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_capability_matrix.schema.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_MATRIX_PREFIX = (
-    "Semantic runtime capability matrix schema failed: "
-)
-SEMANTIC_RUNTIME_CAPABILITY_MANIFEST_PATH = (
-    SEMANTIC_DIR / "semantic_runtime_capability_manifest.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_MANIFEST_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_capability_manifest.schema.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_MANIFEST_PREFIX = (
-    "Semantic runtime capability manifest schema failed: "
-)
-SEMANTIC_RUNTIME_CAPABILITY_INDEX_PATH = (
-    SEMANTIC_DIR / "semantic_runtime_capability_index.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_INDEX_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_capability_index.schema.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_INDEX_PREFIX = (
-    "Semantic runtime capability index schema failed: "
-)
-SEMANTIC_RUNTIME_CAPABILITY_MAP_PATH = (
-    SEMANTIC_DIR / "semantic_runtime_capability_map.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_MAP_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_capability_map.schema.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_MAP_PREFIX = (
-    "Semantic runtime capability map schema failed: "
-)
-SEMANTIC_RUNTIME_CAPABILITY_GROUPS_PATH = (
-    SEMANTIC_DIR / "semantic_runtime_capability_groups.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_GROUPS_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_capability_groups.schema.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_GROUPS_PREFIX = (
-    "Semantic runtime capability groups schema failed: "
-)
-SEMANTIC_RUNTIME_CAPABILITY_TOPOLOGY_PATH = (
-    SEMANTIC_DIR / "semantic_runtime_capability_topology.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_TOPOLOGY_SCHEMA = (
-    SEMANTIC_DIR / "semantic_runtime_capability_topology.schema.yml"
-)
-SEMANTIC_RUNTIME_CAPABILITY_TOPOLOGY_PREFIX = (
-    "Semantic runtime capability topology schema failed: "
-)
 PILLAR_TEMPLATE_SPEC_PATH = PRODUCTS / "pillar-template.yml"
 PILLAR_TEMPLATE_SCHEMA_PATH = (
     ROOT / "products" / "schema" / "pillar-template.schema.yml"
 )
 PILLAR_TEMPLATE_SCHEMA_PREFIX = "Pillar template schema failed: "
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+LAST_REVIEWED_RE = re.compile(r"^20\d{2}-\d{2}-\d{2}$")
 
 ISSUEDICT_REQUIRED_FIELDS = (
     "id",
@@ -195,589 +77,232 @@ ISSUEDICT_REQUIRED_FIELDS = (
 )
 
 
-def load_yaml(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
+# (file stem under semantic/, failure prefix, bootstrap hint) per semantic
+# document; the document and its schema are `<stem>.yml` / `<stem>.schema.yml`.
+SEMANTIC_DOCUMENTS: Tuple[Tuple[str, str, str], ...] = (
+    ("semantic_rules", "Semantic rules schema failed: ", "semantic governance"),
+    ("semantic_categories", "Semantic categories schema failed: ", "semantic taxonomy"),
+    ("semantic_entities", "Semantic entities schema failed: ", "semantic entities"),
+    ("semantic_crossref", "Semantic crossref schema failed: ", "semantic crossref"),
+    ("semantic_registry", "Semantic registry schema failed: ", "semantic registry"),
+    (
+        "semantic_rule_template",
+        "Semantic rule template schema failed: ",
+        "semantic rule template",
+    ),
+    (
+        "semantic_rules_manifest",
+        "Semantic rule manifest schema failed: ",
+        "semantic rule manifest",
+    ),
+    ("semantic_integrity", "Semantic integrity schema failed: ", "semantic integrity"),
+    ("semantic_coverage", "Semantic coverage schema failed: ", "semantic coverage"),
+    ("semantic_policy", "Semantic policy schema failed: ", "semantic policy"),
+    (
+        "semantic_surface_index",
+        "Semantic surface index schema failed: ",
+        "semantic surface index",
+    ),
+    (
+        "semantic_surface_groups",
+        "Semantic surface groups schema failed: ",
+        "semantic surface groups",
+    ),
+    (
+        "semantic_surface_map",
+        "Semantic surface map schema failed: ",
+        "semantic surface map",
+    ),
+    (
+        "semantic_surface_matrix",
+        "Semantic surface matrix schema failed: ",
+        "semantic surface matrix",
+    ),
+    (
+        "semantic_surface_manifest",
+        "Semantic surface manifest schema failed: ",
+        "semantic surface manifest",
+    ),
+    (
+        "semantic_governance_index",
+        "Semantic governance index schema failed: ",
+        "semantic governance index",
+    ),
+    (
+        "semantic_provenance",
+        "Semantic provenance schema failed: ",
+        "semantic provenance",
+    ),
+    (
+        "semantic_configuration",
+        "Semantic configuration schema failed: ",
+        "semantic configuration",
+    ),
+    ("semantic_runtime", "Semantic runtime schema failed: ", "semantic runtime"),
+    (
+        "semantic_runtime_environment",
+        "Semantic runtime environment schema failed: ",
+        "semantic runtime environment",
+    ),
+    (
+        "semantic_runtime_capabilities",
+        "Semantic runtime capabilities schema failed: ",
+        "semantic runtime capabilities",
+    ),
+    (
+        "semantic_runtime_capabilities_registry",
+        "Semantic runtime capabilities registry schema failed: ",
+        "semantic runtime capabilities registry",
+    ),
+    (
+        "semantic_runtime_capability_matrix",
+        "Semantic runtime capability matrix schema failed: ",
+        "semantic runtime capability matrix",
+    ),
+    (
+        "semantic_runtime_capability_manifest",
+        "Semantic runtime capability manifest schema failed: ",
+        "semantic runtime capability manifest",
+    ),
+    (
+        "semantic_runtime_capability_index",
+        "Semantic runtime capability index schema failed: ",
+        "semantic runtime capability index",
+    ),
+    (
+        "semantic_runtime_capability_map",
+        "Semantic runtime capability map schema failed: ",
+        "semantic runtime capability map",
+    ),
+    (
+        "semantic_runtime_capability_groups",
+        "Semantic runtime capability groups schema failed: ",
+        "semantic runtime capability groups",
+    ),
+    (
+        "semantic_runtime_capability_topology",
+        "Semantic runtime capability topology schema failed: ",
+        "semantic runtime capability topology",
+    ),
+)
 
+# (document, schema, failure prefix, bootstrap hint for a missing document,
+# bootstrap hint for a missing schema) per check. Results are reported in
+# registry order regardless of completion order.
+SemanticCheck = Tuple[Path, Path, str, str, str]
+SEMANTIC_CHECKS: List[SemanticCheck] = [
+    *(
+        (
+            SEMANTIC_DIR / f"{stem}.yml",
+            SEMANTIC_DIR / f"{stem}.schema.yml",
+            prefix,
+            hint,
+            hint,
+        )
+        for stem, prefix, hint in SEMANTIC_DOCUMENTS
+    ),
+    (
+        PILLAR_TEMPLATE_SPEC_PATH,
+        PILLAR_TEMPLATE_SCHEMA_PATH,
+        PILLAR_TEMPLATE_SCHEMA_PREFIX,
+        "pillar template spec",
+        "pillar template schema",
+    ),
+]
 
-def _load_semantic_rules() -> None:
-    if not SEMANTIC_RULES_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_rules.yml missing; bootstrap semantic governance"
-        )
-    if not SEMANTIC_RULES_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_rules.schema.yml missing; bootstrap semantic governance"
-        )
-    rules_payload = load_yaml(SEMANTIC_RULES_PATH)
-    schema_payload = load_yaml(SEMANTIC_RULES_SCHEMA)
-    validator = Draft202012Validator(schema_payload)
-    errors = sorted(validator.iter_errors(rules_payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_categories() -> None:
-    if not SEMANTIC_CATEGORIES_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_categories.yml missing; bootstrap semantic taxonomy"
-        )
-    if not SEMANTIC_CATEGORIES_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_categories.schema.yml missing; bootstrap semantic taxonomy"
-        )
-    payload = load_yaml(SEMANTIC_CATEGORIES_PATH)
-    schema = load_yaml(SEMANTIC_CATEGORIES_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_entities() -> None:
-    if not SEMANTIC_ENTITIES_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_entities.yml missing; bootstrap semantic entities"
-        )
-    if not SEMANTIC_ENTITIES_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_entities.schema.yml missing; bootstrap semantic entities"
-        )
-    payload = load_yaml(SEMANTIC_ENTITIES_PATH)
-    schema = load_yaml(SEMANTIC_ENTITIES_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_crossref() -> None:
-    if not SEMANTIC_CROSSREF_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_crossref.yml missing; bootstrap semantic crossref"
-        )
-    if not SEMANTIC_CROSSREF_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_crossref.schema.yml missing; bootstrap semantic crossref"
-        )
-    payload = load_yaml(SEMANTIC_CROSSREF_PATH)
-    schema = load_yaml(SEMANTIC_CROSSREF_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_registry() -> None:
-    if not SEMANTIC_REGISTRY_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_registry.yml missing; bootstrap semantic registry"
-        )
-    if not SEMANTIC_REGISTRY_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_registry.schema.yml missing; bootstrap semantic registry"
-        )
-    payload = load_yaml(SEMANTIC_REGISTRY_PATH)
-    schema = load_yaml(SEMANTIC_REGISTRY_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_rule_template() -> None:
-    if not SEMANTIC_RULE_TEMPLATE_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_rule_template.yml missing; bootstrap semantic rule template"
-        )
-    if not SEMANTIC_RULE_TEMPLATE_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_rule_template.schema.yml missing; bootstrap semantic rule template"
-        )
-    payload = load_yaml(SEMANTIC_RULE_TEMPLATE_PATH)
-    schema = load_yaml(SEMANTIC_RULE_TEMPLATE_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_rule_manifest() -> None:
-    if not SEMANTIC_RULE_MANIFEST_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_rules_manifest.yml missing; bootstrap semantic rule manifest"
-        )
-    if not SEMANTIC_RULE_MANIFEST_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_rules_manifest.schema.yml missing; bootstrap semantic rule manifest"
-        )
-    payload = load_yaml(SEMANTIC_RULE_MANIFEST_PATH)
-    schema = load_yaml(SEMANTIC_RULE_MANIFEST_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_integrity() -> None:
-    if not SEMANTIC_INTEGRITY_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_integrity.yml missing; bootstrap semantic integrity"
-        )
-    if not SEMANTIC_INTEGRITY_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_integrity.schema.yml missing; bootstrap semantic integrity"
-        )
-    payload = load_yaml(SEMANTIC_INTEGRITY_PATH)
-    schema = load_yaml(SEMANTIC_INTEGRITY_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_coverage() -> None:
-    if not SEMANTIC_COVERAGE_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_coverage.yml missing; bootstrap semantic coverage"
-        )
-    if not SEMANTIC_COVERAGE_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_coverage.schema.yml missing; bootstrap semantic coverage"
-        )
-    payload = load_yaml(SEMANTIC_COVERAGE_PATH)
-    schema = load_yaml(SEMANTIC_COVERAGE_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_policy() -> None:
-    if not SEMANTIC_POLICY_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_policy.yml missing; bootstrap semantic policy"
-        )
-    if not SEMANTIC_POLICY_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_policy.schema.yml missing; bootstrap semantic policy"
-        )
-    payload = load_yaml(SEMANTIC_POLICY_PATH)
-    schema = load_yaml(SEMANTIC_POLICY_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_surface_index() -> None:
-    if not SEMANTIC_SURFACE_INDEX_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_surface_index.yml missing; bootstrap semantic surface index"
-        )
-    if not SEMANTIC_SURFACE_INDEX_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_surface_index.schema.yml missing; bootstrap semantic surface index"
-        )
-    payload = load_yaml(SEMANTIC_SURFACE_INDEX_PATH)
-    schema = load_yaml(SEMANTIC_SURFACE_INDEX_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_surface_groups() -> None:
-    if not SEMANTIC_SURFACE_GROUPS_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_surface_groups.yml missing; bootstrap semantic surface groups"
-        )
-    if not SEMANTIC_SURFACE_GROUPS_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_surface_groups.schema.yml missing; bootstrap semantic surface groups"
-        )
-    payload = load_yaml(SEMANTIC_SURFACE_GROUPS_PATH)
-    schema = load_yaml(SEMANTIC_SURFACE_GROUPS_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_surface_map() -> None:
-    if not SEMANTIC_SURFACE_MAP_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_surface_map.yml missing; bootstrap semantic surface map"
-        )
-    if not SEMANTIC_SURFACE_MAP_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_surface_map.schema.yml missing; bootstrap semantic surface map"
-        )
-    payload = load_yaml(SEMANTIC_SURFACE_MAP_PATH)
-    schema = load_yaml(SEMANTIC_SURFACE_MAP_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_surface_matrix() -> None:
-    if not SEMANTIC_SURFACE_MATRIX_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_surface_matrix.yml missing; bootstrap semantic surface matrix"
-        )
-    if not SEMANTIC_SURFACE_MATRIX_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_surface_matrix.schema.yml missing; bootstrap semantic surface matrix"
-        )
-    payload = load_yaml(SEMANTIC_SURFACE_MATRIX_PATH)
-    schema = load_yaml(SEMANTIC_SURFACE_MATRIX_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_surface_manifest() -> None:
-    if not SEMANTIC_SURFACE_MANIFEST_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_surface_manifest.yml missing; bootstrap semantic surface manifest"
-        )
-    if not SEMANTIC_SURFACE_MANIFEST_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_surface_manifest.schema.yml missing; bootstrap semantic surface manifest"
-        )
-    payload = load_yaml(SEMANTIC_SURFACE_MANIFEST_PATH)
-    schema = load_yaml(SEMANTIC_SURFACE_MANIFEST_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_governance_index() -> None:
-    if not SEMANTIC_GOVERNANCE_INDEX_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_governance_index.yml missing; bootstrap semantic governance index"
-        )
-    if not SEMANTIC_GOVERNANCE_INDEX_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_governance_index.schema.yml missing; bootstrap semantic governance index"
-        )
-    payload = load_yaml(SEMANTIC_GOVERNANCE_INDEX_PATH)
-    schema = load_yaml(SEMANTIC_GOVERNANCE_INDEX_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_provenance() -> None:
-    if not SEMANTIC_PROVENANCE_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_provenance.yml missing; bootstrap semantic provenance"
-        )
-    if not SEMANTIC_PROVENANCE_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_provenance.schema.yml missing; bootstrap semantic provenance"
-        )
-    payload = load_yaml(SEMANTIC_PROVENANCE_PATH)
-    schema = load_yaml(SEMANTIC_PROVENANCE_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_configuration() -> None:
-    if not SEMANTIC_CONFIGURATION_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_configuration.yml missing; bootstrap semantic configuration"
-        )
-    if not SEMANTIC_CONFIGURATION_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_configuration.schema.yml missing; bootstrap semantic configuration"
-        )
-    payload = load_yaml(SEMANTIC_CONFIGURATION_PATH)
-    schema = load_yaml(SEMANTIC_CONFIGURATION_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime() -> None:
-    if not SEMANTIC_RUNTIME_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime.yml missing; bootstrap semantic runtime"
-        )
-    if not SEMANTIC_RUNTIME_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime.schema.yml missing; bootstrap semantic runtime"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_environment() -> None:
-    if not SEMANTIC_RUNTIME_ENVIRONMENT_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_environment.yml missing; bootstrap semantic runtime environment"
-        )
-    if not SEMANTIC_RUNTIME_ENVIRONMENT_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_environment.schema.yml missing; bootstrap semantic runtime environment"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_ENVIRONMENT_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_ENVIRONMENT_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_capabilities() -> None:
-    if not SEMANTIC_RUNTIME_CAPABILITIES_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capabilities.yml missing; bootstrap semantic runtime capabilities"
-        )
-    if not SEMANTIC_RUNTIME_CAPABILITIES_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capabilities.schema.yml missing; bootstrap semantic runtime capabilities"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_CAPABILITIES_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_CAPABILITIES_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_capabilities_registry() -> None:
-    if not SEMANTIC_RUNTIME_CAPABILITIES_REGISTRY_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capabilities_registry.yml missing; bootstrap semantic runtime capabilities registry"
-        )
-    if not SEMANTIC_RUNTIME_CAPABILITIES_REGISTRY_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capabilities_registry.schema.yml missing; bootstrap semantic runtime capabilities registry"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_CAPABILITIES_REGISTRY_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_CAPABILITIES_REGISTRY_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_capability_matrix() -> None:
-    if not SEMANTIC_RUNTIME_CAPABILITY_MATRIX_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_matrix.yml missing; bootstrap semantic runtime capability matrix"
-        )
-    if not SEMANTIC_RUNTIME_CAPABILITY_MATRIX_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_matrix.schema.yml missing; bootstrap semantic runtime capability matrix"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_MATRIX_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_MATRIX_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_capability_manifest() -> None:
-    if not SEMANTIC_RUNTIME_CAPABILITY_MANIFEST_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_manifest.yml missing; bootstrap semantic runtime capability manifest"
-        )
-    if not SEMANTIC_RUNTIME_CAPABILITY_MANIFEST_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_manifest.schema.yml missing; bootstrap semantic runtime capability manifest"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_MANIFEST_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_MANIFEST_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_capability_index() -> None:
-    if not SEMANTIC_RUNTIME_CAPABILITY_INDEX_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_index.yml missing; bootstrap semantic runtime capability index"
-        )
-    if not SEMANTIC_RUNTIME_CAPABILITY_INDEX_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_index.schema.yml missing; bootstrap semantic runtime capability index"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_INDEX_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_INDEX_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_capability_map() -> None:
-    if not SEMANTIC_RUNTIME_CAPABILITY_MAP_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_map.yml missing; bootstrap semantic runtime capability map"
-        )
-    if not SEMANTIC_RUNTIME_CAPABILITY_MAP_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_map.schema.yml missing; bootstrap semantic runtime capability map"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_MAP_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_MAP_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_capability_groups() -> None:
-    if not SEMANTIC_RUNTIME_CAPABILITY_GROUPS_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_groups.yml missing; bootstrap semantic runtime capability groups"
-        )
-    if not SEMANTIC_RUNTIME_CAPABILITY_GROUPS_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_groups.schema.yml missing; bootstrap semantic runtime capability groups"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_GROUPS_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_GROUPS_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_semantic_runtime_capability_topology() -> None:
-    if not SEMANTIC_RUNTIME_CAPABILITY_TOPOLOGY_PATH.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_topology.yml missing; bootstrap semantic runtime capability topology"
-        )
-    if not SEMANTIC_RUNTIME_CAPABILITY_TOPOLOGY_SCHEMA.exists():
-        raise FileNotFoundError(
-            "semantic_runtime_capability_topology.schema.yml missing; bootstrap semantic runtime capability topology"
-        )
-    payload = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_TOPOLOGY_PATH)
-    schema = load_yaml(SEMANTIC_RUNTIME_CAPABILITY_TOPOLOGY_SCHEMA)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
-
-
-def _load_pillar_template() -> None:
-    if not PILLAR_TEMPLATE_SPEC_PATH.exists():
-        raise FileNotFoundError(
-            "products/pillar-template.yml missing; bootstrap pillar template spec"
-        )
-    if not PILLAR_TEMPLATE_SCHEMA_PATH.exists():
-        raise FileNotFoundError(
-            "products/schema/pillar-template.schema.yml missing; bootstrap pillar template schema"
+
+def _display_path(path: Path) -> str:
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _semantic_key(document: Path) -> str:
+    return f"semantic:{_display_path(document)}"
+
+
+def _bootstrap_name(path: Path) -> str:
+    """Name a missing registry file: semantic documents by file name."""
+    try:
+        return path.relative_to(SEMANTIC_DIR).as_posix()
+    except ValueError:
+        return _display_path(path)
+
+
+def _check_semantic_document(
+    document: Path,
+    schema: Path,
+    prefix: str,
+    document_bootstrap: str,
+    schema_bootstrap: str,
+) -> List[str]:
+    """Validate one registry entry; return prefixed failures (all schema errors)."""
+    for target, bootstrap in (
+        (document, document_bootstrap),
+        (schema, schema_bootstrap),
+    ):
+        if not target.exists():
+            return [f"{prefix}{_bootstrap_name(target)} missing; bootstrap {bootstrap}"]
+    try:
+        payload = load_yaml(document, copy=False)
+        schema_payload = load_yaml(schema, copy=False)
+    except yaml.YAMLError as exc:
+        return [f"{prefix}YAML invalid: {exc}"]
+    except (OSError, UnicodeDecodeError) as exc:
+        return [f"{prefix}unreadable: {exc}"]
+    for target, loaded in ((document, payload), (schema, schema_payload)):
+        if not isinstance(loaded, dict):
+            return [f"{prefix}{_display_path(target)} root must be a mapping"]
+    try:
+        validator = compiled_validator(schema_payload, Draft202012Validator)
+    except SchemaError as exc:
+        return [f"{prefix}schema {_display_path(schema)} invalid: {exc.message}"]
+    errors = sorted(
+        validator.iter_errors(payload),
+        key=lambda e: ([str(part) for part in e.path], e.message),
+    )
+    failures: List[str] = []
+    for error in errors:
+        location = ".".join(str(part) for part in error.path)
+        detail = error.message
+        failures.append(
+            f"{prefix}{location}: {detail}" if location else f"{prefix}{detail}"
         )
-    payload = load_yaml(PILLAR_TEMPLATE_SPEC_PATH)
-    schema = load_yaml(PILLAR_TEMPLATE_SCHEMA_PATH)
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        first = errors[0]
-        location = ".".join(str(part) for part in first.path)
-        detail = first.message
-        raise ValueError(f"{location}: {detail}" if location else detail)
+    return failures
+
+
+def validate_semantic_documents(
+    checks: Sequence[SemanticCheck] = SEMANTIC_CHECKS,
+    jobs: Optional[int] = None,
+    manifest=None,
+) -> List[str]:
+    """Validate every registry entry on a thread pool; failures in registry order.
+
+    With a `manifest`, entries whose document and schema are unchanged since
+    their last pass are skipped, and new passes are recorded.
+    """
+    pending = [
+        entry
+        for entry in checks
+        if manifest is None
+        or manifest.lookup(_semantic_key(entry[0])) is None
+    ]
+    if not pending:
+        return []
+    workers = max(1, min(jobs or DEFAULT_WORKERS, len(pending)))
+    if workers == 1:
+        results = [_check_semantic_document(*entry) for entry in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(lambda entry: _check_semantic_document(*entry), pending)
+            )
+    if manifest is not None:
+        for (document, schema, *_), failures in zip(pending, results):
+            if not failures:
+                manifest.record(_semantic_key(document), [document, schema])
+    return [failure for failures in results for failure in failures]
 
 
 def load_product_index() -> Dict[str, dict]:
@@ -785,15 +310,7 @@ def load_product_index() -> Dict[str, dict]:
         raise FileNotFoundError(
             "products/product_index.yml missing; run index alignment."
         )
-    index_doc = load_yaml(PRODUCT_INDEX_PATH) or {}
-    entries = index_doc.get("products", [])
-    mapping: Dict[str, dict] = {}
-    for entry in entries:
-        pid = entry.get("product_id")
-        if not pid:
-            continue
-        mapping[pid] = entry
-    return mapping
+    return spec_repository(ROOT).index_by_id()
 
 
 def _expected_category(product_type: str | None) -> str:
@@ -801,41 +318,7 @@ def _expected_category(product_type: str | None) -> str:
 
 
 def _load_canonical_schema() -> dict:
-    if not CANONICAL_SCHEMA_PATH.exists():
-        raise FileNotFoundError(
-            f"Canonical schema missing at {CANONICAL_SCHEMA_REL}; run canonical schema scaffolding"
-        )
-    try:
-        payload = json.loads(CANONICAL_SCHEMA_PATH.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ValueError(
-            f"Canonical schema JSON invalid at {CANONICAL_SCHEMA_REL}: {exc}"
-        ) from exc
-    if payload.get("type") != "object":
-        raise ValueError(
-            "Canonical schema sanity check failed: top-level type must be 'object'"
-        )
-    if not isinstance(payload.get("properties"), dict):
-        raise ValueError(
-            "Canonical schema sanity check failed: missing properties object"
-        )
-    if not isinstance(payload.get("required"), list):
-        raise ValueError("Canonical schema sanity check failed: missing required list")
-    missing_required = CANONICAL_REQUIRED_TOP_LEVEL - set(payload.get("required", []))
-    if missing_required:
-        raise ValueError(
-            "Canonical schema sanity check failed: required list missing keys "
-            + ", ".join(sorted(missing_required))
-        )
-    missing_properties = CANONICAL_REQUIRED_TOP_LEVEL - set(
-        payload.get("properties", {}).keys()
-    )
-    if missing_properties:
-        raise ValueError(
-            "Canonical schema sanity check failed: properties block missing keys "
-            + ", ".join(sorted(missing_properties))
-        )
-    return payload
+    return check_canonical_schema(ROOT)
 
 
 def _uses_canonical_schema(product: dict) -> bool:
@@ -883,6 +366,25 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Validate only the specified product id (can be passed multiple times)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "Workers for semantic schema checks and product specs "
+            f"(default: {DEFAULT_WORKERS})"
+        ),
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-validate every document, ignoring the validation manifest",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report per-product validation time, slowest first",
+    )
     return parser.parse_args()
 
 
@@ -892,10 +394,33 @@ def _run_canonical_check_only() -> None:
     except (FileNotFoundError, ValueError) as exc:
         print(f"Canonical schema CI check failed: {exc}", file=sys.stderr)
         sys.exit(1)
-    print("canonical_schema: OK")
+    print(CANONICAL_STATUS_OK)
     sys.exit(0)
 
 
+_REFERENCED: Dict[Tuple[str, bool], Tuple[bool, Optional[str]]] = {}
+
+
+def _referenced_file(ref: str, parse: bool = False) -> Tuple[bool, Optional[str]]:
+    """Return (exists, YAML error) for a repo-relative reference, once per run.
+
+    Products share contracts and schemas; `validate_product_files` resolves
+    the ones named in the index before forking so workers inherit them.
+    """
+    key = (ref, parse)
+    if key not in _REFERENCED:
+        target = ROOT / ref
+        exists = target.exists()
+        error = None
+        if exists and parse:
+            try:
+                load_yaml(target, copy=False)
+            except yaml.YAMLError as exc:
+                error = str(exc)
+        _REFERENCED[key] = (exists, error)
+    return _REFERENCED[key]
+
+
 def validate_product(
     product: dict,
     path: Path,
@@ -943,7 +468,7 @@ def validate_product(
             if not governance.get(key):
                 errors.append(f"{path}: governance.{key} missing or empty")
         last_reviewed = governance.get("last_reviewed", "")
-        if last_reviewed and not re.match(r"^20\d{2}-\d{2}-\d{2}$", last_reviewed):
+        if last_reviewed and not LAST_REVIEWED_RE.match(last_reviewed):
             errors.append(
                 f"{path}: governance.last_reviewed must be YYYY-MM-DD in 2000s"
             )
@@ -972,14 +497,11 @@ def validate_product(
     if contract_ref is not None and not isinstance(contract_ref, str):
         errors.append(f"{path}: contract_ref must be a string or null")
     elif isinstance(contract_ref, str):
-        target = ROOT / contract_ref
-        if not target.exists():
+        exists, yaml_error = _referenced_file(contract_ref, parse=True)
+        if not exists:
             errors.append(f"{path}: contract_ref file {contract_ref} missing on disk")
-        else:
-            try:
-                load_yaml(target)
-            except yaml.YAMLError as exc:  # pragma: no cover
-                errors.append(f"{path}: contract_ref YAML invalid: {exc}")
+        elif yaml_error is not None:  # pragma: no cover
+            errors.append(f"{path}: contract_ref YAML invalid: {yaml_error}")
 
     architecture = product.get("architecture") or {}
     references = product.get("references") or {}
@@ -1004,8 +526,7 @@ def validate_product(
             )
         schema_path = index_entry.get("schema_path")
         if schema_path:
-            schema_target = ROOT / schema_path
-            if not schema_target.exists():
+            if not _referenced_file(schema_path)[0]:
                 errors.append(f"{path}: schema_path {schema_path} missing on disk")
         entry_contract = index_entry.get("contract_ref")
         if (entry_contract or None) != (contract_ref or None):
@@ -1048,206 +569,118 @@ def validate_product(
                 f"{path}: compliance.matrix_snippet must point to traceability data"
             )
         else:
-            matrix_path = ROOT / matrix_snippet
-            if not matrix_path.exists():
+            if not _referenced_file(matrix_snippet)[0]:
                 errors.append(
                     f"{path}: compliance matrix snippet {matrix_snippet} missing on disk"
                 )
     return errors
 
 
-def main() -> None:
-    args = _parse_args()
-    if args.check_canonical:
-        _run_canonical_check_only()
-
-    try:
-        _load_canonical_schema()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"Canonical schema load failed: {exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_rules()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RULES_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_categories()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_CATEGORIES_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_entities()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_ENTITIES_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_crossref()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_CROSSREF_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_registry()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_REGISTRY_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_rule_template()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RULE_TEMPLATE_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_rule_manifest()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RULE_MANIFEST_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_integrity()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_INTEGRITY_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_coverage()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_COVERAGE_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_policy()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_POLICY_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_surface_index()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_SURFACE_INDEX_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_surface_groups()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_SURFACE_GROUPS_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_surface_map()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_SURFACE_MAP_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_surface_matrix()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_SURFACE_MATRIX_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
+def _product_inputs(
+    path: Path, product: dict, index_entry: dict | None
+) -> List[Path]:
+    """Files whose content or presence decided `validate_product` for `path`."""
+    inputs = [path, PRODUCT_INDEX_PATH]
+    referenced = [
+        product.get("contract_ref"),
+        (index_entry or {}).get("schema_path"),
+        (product.get("compliance") or {}).get("matrix_snippet"),
+    ]
+    inputs.extend(ROOT / ref for ref in referenced if isinstance(ref, str) and ref)
+    return inputs
 
-    try:
-        _load_semantic_surface_manifest()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_SURFACE_MANIFEST_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
 
-    try:
-        _load_semantic_governance_index()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_GOVERNANCE_INDEX_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_provenance()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_PROVENANCE_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
+# State handed to forked product workers; populated only while a pool is alive.
+_WORKER_STATE: Dict[str, Any] = {}
 
-    try:
-        _load_semantic_configuration()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_CONFIGURATION_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
+ProductResult = Tuple[Path, Optional[str], List[str], Optional[List[Path]], float]
 
-    try:
-        _load_semantic_runtime()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_runtime_environment()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_ENVIRONMENT_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_runtime_capabilities()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_CAPABILITIES_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_runtime_capabilities_registry()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_CAPABILITIES_REGISTRY_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_runtime_capability_matrix()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_CAPABILITY_MATRIX_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        _load_semantic_runtime_capability_manifest()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_CAPABILITY_MANIFEST_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
 
-    try:
-        _load_semantic_runtime_capability_index()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_CAPABILITY_INDEX_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
+def _validate_product_file(
+    path: Path, index: Dict[str, dict], known_products: set[str]
+) -> ProductResult:
+    """Validate one spec: (path, id, errors, manifest inputs if passing, seconds)."""
+    start = time.perf_counter()
+    product = spec_repository(ROOT).spec(path.stem)
+    product_id = product.get("id")
+    errors = validate_product(product, path, index, known_products)
+    inputs = None if errors else _product_inputs(path, product, index.get(product_id))
+    return path, product_id, errors, inputs, time.perf_counter() - start
 
-    try:
-        _load_semantic_runtime_capability_map()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_CAPABILITY_MAP_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
 
-    try:
-        _load_semantic_runtime_capability_groups()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_CAPABILITY_GROUPS_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
+def _validate_product_in_worker(path: Path) -> ProductResult:
+    """Pool entry point: validate one spec using the inherited `_WORKER_STATE`."""
+    return _validate_product_file(
+        path, _WORKER_STATE["index"], _WORKER_STATE["known_products"]
+    )
 
-    try:
-        _load_semantic_runtime_capability_topology()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{SEMANTIC_RUNTIME_CAPABILITY_TOPOLOGY_PREFIX}{exc}", file=sys.stderr)
-        sys.exit(1)
 
-    try:
-        _load_pillar_template()
-    except (FileNotFoundError, ValueError) as exc:
-        print(f"{PILLAR_TEMPLATE_SCHEMA_PREFIX}{exc}", file=sys.stderr)
+def validate_product_files(
+    product_files: Sequence[Path],
+    index: Dict[str, dict],
+    known_products: set[str],
+    jobs: Optional[int] = None,
+) -> List[ProductResult]:
+    """Validate specs on a forked process pool; results in `product_files` order.
+
+    Contracts, schema paths and matrix snippets named by the index, and the
+    specs themselves, are resolved in the parent first so every worker
+    inherits them instead of re-reading shared files.
+    """
+    _REFERENCED.clear()
+    specs = spec_repository(ROOT)
+    for entry in index.values():
+        for field in ("contract_ref", "schema_path"):
+            ref = entry.get(field)
+            if isinstance(ref, str) and ref:
+                _referenced_file(ref, parse=field == "contract_ref")
+    workers = max(1, min(jobs or DEFAULT_WORKERS, len(product_files)))
+    if workers == 1 or fork_context() is None:
+        return [
+            _validate_product_file(path, index, known_products)
+            for path in product_files
+        ]
+    for path in product_files:
+        specs.spec(path.stem)
+    _WORKER_STATE.update(index=index, known_products=known_products)
+    try:
+        with fork_pool(workers, _validate_product_in_worker) as pool:
+            return list(pool.map(_validate_product_in_worker, product_files))
+    finally:
+        _WORKER_STATE.clear()
+
+
+def _print_timings(results: Sequence[ProductResult], cached: int) -> None:
+    print("Per-product validation timings (slowest first):")
+    ordered = sorted(results, key=lambda result: (-result[4], result[0].as_posix()))
+    for path, _, errors, _, elapsed in ordered:
+        status = "FAIL" if errors else "ok"
+        print(f"  {elapsed * 1000:8.1f} ms  {status:4}  {_display_path(path)}")
+    total = sum(result[4] for result in results)
+    print(f"  {total * 1000:8.1f} ms  total for {len(results)} spec(s)")
+    if cached:
+        print(f"  {cached} unchanged spec(s) skipped via the validation manifest")
+
+
+def _product_key(path: Path) -> str:
+    return f"product:{_display_path(path)}"
+
+
+def _validate_documents(args: argparse.Namespace, manifest) -> None:
+    semantic_failures = validate_semantic_documents(
+        jobs=args.jobs, manifest=manifest
+    )
+    if semantic_failures:
+        for failure in semantic_failures:
+            print(failure, file=sys.stderr)
         sys.exit(1)
 
-    product_files = sorted(
-        p
-        for p in PRODUCTS.glob("*.yml")
-        if not p.name.endswith("_worksheet.yml")
-        and p.name not in {"guardsuite_master_spec.yml", "product_index.yml"}
-        and p.stem not in PRODUCT_VALIDATION_EXCLUSIONS
-    )
+    specs = spec_repository(ROOT)
+    product_files = [
+        path
+        for pid, path in specs.spec_paths().items()
+        if pid not in PRODUCT_VALIDATION_EXCLUSIONS
+    ]
     if not product_files:
         print("No product specs found under products/", file=sys.stderr)
         sys.exit(1)
@@ -1275,15 +708,34 @@ def main() -> None:
         print(str(exc), file=sys.stderr)
         sys.exit(1)
     known_products = all_product_ids
+    # related_products checks depend on the set of specs on disk
+    context = hashlib.sha256(
+        "\n".join(sorted(known_products)).encode("utf-8")
+    ).hexdigest()
     problems: List[str] = []
     seen_ids: set[str] = set()
+    pending: List[Path] = []
     for file_path in product_files:
-        product = load_yaml(file_path)
-        product_id = product.get("id")
+        cached = manifest.lookup(_product_key(file_path), context=context)
+        if cached is not None:
+            seen_ids.add(cached.get("product_id"))
+        else:
+            pending.append(file_path)
+    results = validate_product_files(
+        pending, product_index, known_products, jobs=args.jobs
+    )
+    for file_path, product_id, errors, inputs, _ in results:
         seen_ids.add(product_id)
-        problems.extend(
-            validate_product(product, file_path, product_index, known_products)
-        )
+        if inputs is not None:
+            manifest.record(
+                _product_key(file_path),
+                inputs,
+                {"product_id": product_id},
+                context=context,
+            )
+        problems.extend(errors)
+    if args.timings:
+        _print_timings(results, len(product_files) - len(pending))
     missing_in_specs = (
         set(product_index.keys()) - seen_ids - PRODUCT_VALIDATION_EXCLUSIONS
     )
@@ -1302,6 +754,35 @@ def main() -> None:
     print(
         f"Validated {len(product_files)} product spec(s) against index and metadata requirements."
     )
+    if manifest.hits:
+        print(
+            f"{manifest.hits} document(s) unchanged since their last passing run "
+            "were not re-validated (use --full to force)."
+        )
+
+
+def main() -> None:
+    args = _parse_args()
+    spec_repository(ROOT).reload()
+    if args.check_canonical:
+        _run_canonical_check_only()
+
+    try:
+        _load_canonical_schema()
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"Canonical schema load failed: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    manifest = validation_manifest.ValidationManifest.for_validator(
+        ROOT,
+        "validate_products",
+        [Path(__file__), *validation_manifest.SHARED_SOURCES],
+        full=args.full,
+    )
+    try:
+        _validate_documents(args, manifest)
+    finally:
+        manifest.save()
 
 
 if __name__ == "__main__":
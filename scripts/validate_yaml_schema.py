@@ -3,16 +3,23 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import sys
 from pathlib import Path
 
-import yaml
 from jsonschema import Draft202012Validator
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from validation import validation_manifest
+from validation.schema_cache import compiled_validator
+from validation.spec_repository import spec_repository
+from validation.yaml_loader import load_yaml
+
 PRODUCTS = ROOT / "products"
-PRODUCT_SPECS = ROOT / "product_specs"
 SCHEMA_DIR = PRODUCTS / "schema"
 SCHEMA_PATH = SCHEMA_DIR / "product.schema.json"
 CANONICAL_SCHEMA_REL = "guardsuite-core/canonical_schema.json"
@@ -21,10 +28,6 @@ SCHEMA_EXTENSIONS = {".yml", ".yaml", ".json"}
 PILLAR_TEMPLATE_ID = "pillar-template"
 PILLAR_TEMPLATE_SCHEMA_PATH = SCHEMA_DIR / f"{PILLAR_TEMPLATE_ID}.schema.yml"
 PILLAR_TEMPLATE_SCHEMA_PREFIX = "Pillar template YAML schema failed: "
-PILLAR_TEMPLATE_SPEC_CANDIDATES = [
-    PRODUCTS / f"{PILLAR_TEMPLATE_ID}.yml",
-    PRODUCT_SPECS / f"{PILLAR_TEMPLATE_ID}.yml",
-]
 
 
 def load_schema() -> dict:
@@ -32,11 +35,6 @@ def load_schema() -> dict:
         return json.load(handle)
 
 
-def load_yaml_file(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
-
-
 def load_canonical_schema() -> dict:
     if not CANONICAL_SCHEMA_PATH.exists():
         raise FileNotFoundError(
@@ -60,21 +58,10 @@ def iter_schema_files() -> list[Path]:
     )
 
 
-def _resolve_pillar_template_spec() -> Path | None:
-    for candidate in PILLAR_TEMPLATE_SPEC_CANDIDATES:
-        if candidate.exists():
-            return candidate
-    return None
-
-
 def iter_product_files() -> list[Path]:
-    files = [
-        p
-        for p in PRODUCTS.glob("*.yml")
-        if not p.name.endswith("_worksheet.yml")
-        and p.name not in {"guardsuite_master_spec.yml", "product_index.yml"}
-    ]
-    pillar_template = _resolve_pillar_template_spec()
+    specs = spec_repository(ROOT)
+    files = list(specs.spec_paths().values())
+    pillar_template = specs.spec_path(PILLAR_TEMPLATE_ID)
     if pillar_template and pillar_template not in files:
         files.append(pillar_template)
     return sorted(files, key=lambda path: path.name)
@@ -83,46 +70,69 @@ def iter_product_files() -> list[Path]:
 def load_schema_document(path: Path) -> dict:
     if path.suffix.lower() == ".json":
         return json.loads(path.read_text(encoding="utf-8"))
-    return load_yaml_file(path)
+    return load_yaml(path)
 
 
-def validate_schema_canonical_references() -> list[str]:
+def _schema_canonical_reference_errors(schema_path: Path) -> list[str]:
+    errors: list[str] = []
+    document = load_schema_document(schema_path) or {}
+    properties = document.get("properties")
+    if not isinstance(properties, dict):
+        return errors
+    references_block = properties.get("references")
+    if not isinstance(references_block, dict):
+        return errors
+    ref_properties = references_block.get("properties")
+    if not isinstance(ref_properties, dict):
+        errors.append(
+            f"{schema_path}: references block must define properties for canonical schema checks"
+        )
+        return errors
+    canonical_prop = ref_properties.get("canonical_schema")
+    if not canonical_prop:
+        return errors
+    if canonical_prop.get("type") != "string":
+        errors.append(
+            f"{schema_path}: references.canonical_schema.type must be 'string'"
+        )
+    const_value = canonical_prop.get("const")
+    if const_value != CANONICAL_SCHEMA_REL:
+        errors.append(
+            f"{schema_path}: references.canonical_schema.const must equal {CANONICAL_SCHEMA_REL}"
+        )
+    if "enum" in canonical_prop:
+        errors.append(
+            f"{schema_path}: references.canonical_schema must use const, not enum"
+        )
+    required_refs = references_block.get("required", []) or []
+    if "canonical_schema" not in required_refs:
+        errors.append(
+            f"{schema_path}: references block must require canonical_schema"
+        )
+    return errors
+
+
+def _cached_errors(manifest, key: str, inputs: list[Path], check) -> list[str]:
+    """Run `check()` unless `manifest` holds a pass for unchanged `inputs`."""
+    if manifest is not None and manifest.lookup(key) is not None:
+        return []
+    errors = check()
+    if manifest is not None and not errors:
+        manifest.record(key, inputs)
+    return errors
+
+
+def validate_schema_canonical_references(manifest=None) -> list[str]:
     errors: list[str] = []
     for schema_path in iter_schema_files():
-        document = load_schema_document(schema_path) or {}
-        properties = document.get("properties")
-        if not isinstance(properties, dict):
-            continue
-        references_block = properties.get("references")
-        if not isinstance(references_block, dict):
-            continue
-        ref_properties = references_block.get("properties")
-        if not isinstance(ref_properties, dict):
-            errors.append(
-                f"{schema_path}: references block must define properties for canonical schema checks"
-            )
-            continue
-        canonical_prop = ref_properties.get("canonical_schema")
-        if not canonical_prop:
-            continue
-        if canonical_prop.get("type") != "string":
-            errors.append(
-                f"{schema_path}: references.canonical_schema.type must be 'string'"
-            )
-        const_value = canonical_prop.get("const")
-        if const_value != CANONICAL_SCHEMA_REL:
-            errors.append(
-                f"{schema_path}: references.canonical_schema.const must equal {CANONICAL_SCHEMA_REL}"
-            )
-        if "enum" in canonical_prop:
-            errors.append(
-                f"{schema_path}: references.canonical_schema must use const, not enum"
-            )
-        required_refs = references_block.get("required", []) or []
-        if "canonical_schema" not in required_refs:
-            errors.append(
-                f"{schema_path}: references block must require canonical_schema"
+        errors.extend(
+            _cached_errors(
+                manifest,
+                f"schema:{schema_path.relative_to(ROOT).as_posix()}",
+                [schema_path],
+                lambda: _schema_canonical_reference_errors(schema_path),
             )
+        )
     return errors
 
 
@@ -137,7 +147,7 @@ def _pillar_template_schema_errors() -> list[str]:
         errors.append(f"unable to load schema: {exc}")
         return errors
     try:
-        Draft202012Validator.check_schema(document)
+        compiled_validator(document, Draft202012Validator)
     except Exception as exc:  # pragma: no cover - jsonschema internals
         errors.append(f"invalid Draft 2020-12 document: {exc}")
     properties = document.get("properties")
@@ -169,35 +179,74 @@ def _pillar_template_schema_errors() -> list[str]:
     return errors
 
 
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="GuardSuite product schema validator")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-validate every document, ignoring the validation manifest",
+    )
+    return parser.parse_args()
+
+
+def _product_schema_errors(
+    product_file: Path, validator: Draft202012Validator
+) -> list[str]:
+    data = load_yaml(product_file, copy=False)
+    return [f"{product_file}: {error.message}" for error in validator.iter_errors(data)]
+
+
 def main() -> None:
+    args = _parse_args()
+    spec_repository(ROOT).reload()
     try:
         load_canonical_schema()
     except (FileNotFoundError, ValueError) as exc:
         print(f"Canonical schema load failed: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    schema = load_schema()
-    validator = Draft202012Validator(schema)
+    manifest = validation_manifest.ValidationManifest.for_validator(
+        ROOT,
+        "validate_yaml_schema",
+        [Path(__file__), *validation_manifest.SHARED_SOURCES],
+        full=args.full,
+    )
+    validator = compiled_validator(load_schema(), Draft202012Validator)
     product_files = iter_product_files()
     failures = []
     for product_file in product_files:
-        data = load_yaml_file(product_file)
-        errors = list(validator.iter_errors(data))
-        for error in errors:
-            failures.append(f"{product_file}: {error.message}")
-    canonical_reference_errors = validate_schema_canonical_references()
+        failures.extend(
+            _cached_errors(
+                manifest,
+                f"product:{product_file.relative_to(ROOT).as_posix()}",
+                [product_file, SCHEMA_PATH],
+                lambda: _product_schema_errors(product_file, validator),
+            )
+        )
+    canonical_reference_errors = validate_schema_canonical_references(manifest)
     failures.extend(canonical_reference_errors)
-    pillar_template_schema_errors = _pillar_template_schema_errors()
+    pillar_template_schema_errors = _cached_errors(
+        manifest,
+        "pillar-template-schema",
+        [PILLAR_TEMPLATE_SCHEMA_PATH],
+        _pillar_template_schema_errors,
+    )
     failures.extend(
         f"{PILLAR_TEMPLATE_SCHEMA_PREFIX}{detail}"
         for detail in pillar_template_schema_errors
     )
+    manifest.save()
     if failures:
         print("Schema validation failed:")
         for message in failures:
             print(f" - {message}")
         sys.exit(1)
     print(f"Schema validation passed for {len(product_files)} product spec(s).")
+    if manifest.hits:
+        print(
+            f"{manifest.hits} document(s) unchanged since their last passing run "
+            "were not re-validated (use --full to force)."
+        )
 
 
 if __name__ == "__main__":
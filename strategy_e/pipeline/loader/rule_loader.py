@@ -1,6 +1,7 @@
-import yaml
 from pathlib import Path
 
+from validation.yaml_loader import load_yaml
+
 
 def load_rule_specs(base_path: Path):
     """
@@ -13,6 +14,5 @@ def load_rule_specs(base_path: Path):
     rule_files = sorted(base_path.rglob("*.yml"))
     specs = []
     for file in rule_files:
-        with file.open("r", encoding="utf-8") as f:
-            specs.append((str(file), yaml.safe_load(f)))
+        specs.append((str(file), load_yaml(file)))
     return specs
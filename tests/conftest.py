@@ -0,0 +1,15 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+REPO_SCANNER = Path(__file__).resolve().parents[1] / "repo-scanner.py"
+
+
+@pytest.fixture
+def scanner_module():
+    """A freshly loaded `repo-scanner.py` (the hyphenated name is not importable)."""
+    spec = importlib.util.spec_from_file_location("repo_scanner", str(REPO_SCANNER))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+
+import yaml
+
+
+def _make_repo(repo: Path, pm):
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "stages.py").write_text("def stage_one(x):\n    return x > 1\n", encoding="utf-8")
+    (repo / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (repo / "scoring_kpis.yml").write_text(yaml.safe_dump({}), encoding="utf-8")
+
+
+def test_dependency_waves_follow_task_owners(scanner_module):
+    maps = [
+        {"a1": {"dependencies": ["b1"]}},
+        {"b1": {}},
+        {"c1": {"dependencies": ["d1"]}},
+        {"d1": {"dependencies": ["c1"]}},
+        {"e1": {"dependencies": ["e1", "missing"]}},
+    ]
+    # b and e have no cross-repo dependencies, a waits for b, c and d form a cycle
+    assert scanner_module._repo_dependency_waves(maps) == [[1, 4], [0], [2, 3]]
+
+
+def test_dependencies_resolve_regardless_of_repo_order(tmp_path, scanner_module):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    _make_repo(first, {"x": {"implementation_files": ["src/stages.py"], "dependencies": ["y"]}})
+    _make_repo(second, {"y": {"implementation_files": ["src/stages.py"]}})
+
+    index = scanner_module.aggregate_all_repos([str(first), str(second)])
+
+    assert list(index) == ["first", "second"]
+    dep = index["first"]["dependencies"]["x"]["details"]["y"]
+    assert dep["found"] is True
+    assert dep["repo"] == "second"
+    assert dep["status"] == index["second"]["tasks"]["y"]["status"]
+
+
+def test_parallel_aggregate_matches_serial(tmp_path, scanner_module):
+    repos = []
+    for name in ("r1", "r2", "r3"):
+        _make_repo(tmp_path / name, {f"{name}_t": {"implementation_files": ["src/stages.py"]}})
+        repos.append(str(tmp_path / name))
+
+    serial = scanner_module.aggregate_all_repos(repos)
+    parallel = scanner_module.aggregate_all_repos(repos, jobs=3)
+
+    assert list(parallel) == list(serial)
+    assert json.dumps(parallel, sort_keys=True) == json.dumps(serial, sort_keys=True)
+
+
+def test_task_status_index_lookups_and_ambiguity(scanner_module):
+    repos_index = {
+        "done-task": "done",
+        "repo-a": {"tasks": {"t1": {"final_score": 90, "status": "done"}, "bad": {"final_score": 1}}},
+        "repo-b": {"task_details": {"t1": "pending", "t2": {"status": "pending"}, "bad": "done"}},
+    }
+    index = scanner_module.TaskStatusIndex(repos_index)
+
+    assert index.lookup("done-task") == (True, "done", None)
+    assert index.lookup("t1") == (True, "done", "repo-a")
+    assert index.lookup("t2") == (True, "pending", "repo-b")
+    # entries without a status are skipped in favour of a later repo
+    assert index.lookup("bad") == (True, "done", "repo-b")
+    assert index.lookup("nope") == (False, None, None)
+    assert index.ambiguous() == {"t1": ["repo-a", "repo-b"]}
+
+
+def test_check_dependencies_reports_ambiguous_ids(tmp_path, scanner_module):
+    _make_repo(tmp_path / "app", {"x": {"implementation_files": ["src/stages.py"], "dependencies": ["shared"]}})
+    scanner = scanner_module.PILScanner(str(tmp_path / "app"))
+    repos_index = {
+        "lib-a": {"tasks": {"shared": {"status": "done"}}},
+        "lib-b": {"tasks": {"shared": {"status": "pending"}}},
+    }
+
+    result = scanner.check_dependencies("x", repos_index)
+
+    assert result["ok"] is True
+    detail = result["details"]["shared"]
+    assert detail["repo"] == "lib-a"
+    assert detail["ambiguous"] == ["lib-a", "lib-b"]
@@ -0,0 +1,99 @@
+import runpy
+from pathlib import Path
+
+import yaml
+
+SOURCE = '''
+import functools
+
+
+@functools.lru_cache
+def load(path, mode):
+    return path
+
+
+class Stage:
+    @staticmethod
+    def run(state):
+        return state
+
+    def apply(self, state, event):
+        def inner():
+            return event
+        return inner
+'''
+
+
+def test_batch_verdicts_match_single_checks(tmp_path, scanner_module):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "mod.py").write_text(SOURCE, encoding="utf-8")
+    (tmp_path / "src" / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+    signatures = [
+        "load",
+        {"function": "load", "params": ["path", "mode"], "decorator": "lru_cache"},
+        {"function": "apply", "params": ["state", "event"]},
+        {"function": "run", "decorator": "classmethod"},
+        "inner",
+        "missing_fn",
+        42,
+    ]
+    scanner = scanner_module.PILScanner(str(tmp_path))
+    checks = {"src/mod.py": signatures, "src/broken.py": ["broken"], "src/nope.py": ["x"]}
+    batch = scanner.ast_check_batch(checks)
+
+    assert list(batch) == list(checks)
+    for sig, verdict in zip(signatures, batch["src/mod.py"]):
+        assert verdict["signature"] == sig
+        expected = scanner.ast_check(str(tmp_path / "src" / "mod.py"), sig)
+        assert (verdict["compliant"], verdict["diagnostic"]) == (
+            expected[0],
+            expected[1].replace(str(tmp_path / "src" / "mod.py"), "src/mod.py"),
+        )
+    assert [v["compliant"] for v in batch["src/mod.py"]] == [True, True, True, False, True, False, False]
+    assert batch["src/broken.py"][0]["diagnostic"].startswith("AST parse error")
+    assert batch["src/nope.py"][0]["diagnostic"] == "File not found: src/nope.py"
+
+
+def test_batch_parses_each_file_once_per_scan(tmp_path, monkeypatch, scanner_module):
+    (tmp_path / "mod.py").write_text(SOURCE, encoding="utf-8")
+    parses = []
+    real_parse = scanner_module.ast.parse
+    monkeypatch.setattr(scanner_module.ast, "parse", lambda src, *a, **k: parses.append(1) or real_parse(src, *a, **k))
+    scanner = scanner_module.PILScanner(str(tmp_path))
+    with scanner.scan_scope():
+        scanner.ast_check_batch({"mod.py": ["load", "run", "apply"]})
+        scanner.ast_check_batch({"mod.py": ["inner"]})
+    assert len(parses) == 1
+
+
+def test_scoring_loop_reports_required_signatures(tmp_path, scanner_module):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "mod.py").write_text(SOURCE, encoding="utf-8")
+    pm = {
+        "a": {"implementation_files": ["src/mod.py"], "required_signatures": {"src/mod.py": ["load", "gone"]}},
+        "b": {"implementation_files": ["src/mod.py"]},
+    }
+    (tmp_path / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (tmp_path / "scoring_kpis.yml").write_text(yaml.safe_dump({"weights": {}}), encoding="utf-8")
+
+    results = scanner_module.PILScanner(str(tmp_path)).scoring_loop()
+    checks = results["a"]["details"]["signature_checks"]["src/mod.py"]
+    assert [v["compliant"] for v in checks] == [True, False]
+    assert "signature_checks" not in results["b"]["details"]
+
+
+def test_check_signatures_script_exit_codes(tmp_path):
+    script = Path(__file__).resolve().parents[1] / "scripts" / "check_signatures.py"
+    ns = runpy.run_path(str(script))
+    (tmp_path / "mod.py").write_text(SOURCE, encoding="utf-8")
+    pm = {
+        "a": {"required_signatures": {"mod.py": ["load"]}},
+        "b": {"required_signatures": {"mod.py": ["load", {"function": "apply", "params": ["state", "event"]}]}},
+    }
+    (tmp_path / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    assert ns["collect_checks"](tmp_path)["mod.py"] == ["load", {"function": "apply", "params": ["state", "event"]}]
+    assert ns["main"](["--repo", str(tmp_path)]) == 0
+
+    spec = tmp_path / "sigs.yml"
+    spec.write_text(yaml.safe_dump({"mod.py": ["missing_fn"]}), encoding="utf-8")
+    assert ns["main"](["--repo", str(tmp_path), "--spec", str(spec)]) == 2
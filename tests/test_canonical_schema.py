@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from validation import canonical_schema
+
+VALID = {
+    "type": "object",
+    "required": ["plan_id", "schema_version", "resources", "metadata"],
+    "properties": {
+        key: {"type": "string"}
+        for key in ("plan_id", "schema_version", "resources", "metadata")
+    },
+}
+
+
+def _write(root, payload):
+    path = root / canonical_schema.CANONICAL_SCHEMA_REL
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_verdict_is_memoized_until_the_schema_bytes_change(tmp_path, monkeypatch):
+    _write(tmp_path, VALID)
+    loads = []
+    real_loads = json.loads
+    monkeypatch.setattr(
+        canonical_schema.json, "loads", lambda *a: loads.append(1) or real_loads(*a)
+    )
+    first = canonical_schema.check_canonical_schema(tmp_path)
+    assert canonical_schema.check_canonical_schema(tmp_path) is first
+    assert loads == [1]
+
+    _write(tmp_path, {**VALID, "required": ["plan_id"]})
+    for _ in range(2):
+        with pytest.raises(ValueError, match="required list missing keys"):
+            canonical_schema.check_canonical_schema(tmp_path)
+    assert loads == [1, 1]
+
+
+def test_missing_and_malformed_schemas_raise(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Canonical schema missing"):
+        canonical_schema.check_canonical_schema(tmp_path)
+    path = tmp_path / canonical_schema.CANONICAL_SCHEMA_REL
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ValueError, match="JSON invalid"):
+        canonical_schema.check_canonical_schema(tmp_path)
@@ -0,0 +1,18 @@
+from api import ci_integration
+
+
+def test_structural_check_covers_index_and_worksheets(tmp_path, monkeypatch):
+    products = tmp_path / "products"
+    products.mkdir()
+    (products / "alpha.yml").write_text("id: alpha\n", encoding="utf-8")
+    (products / "alpha_worksheet.yml").write_text("- note\n", encoding="utf-8")
+    (products / "product_index.yml").write_text("products: [\n", encoding="utf-8")
+    (products / "guardsuite_master_spec.yml").write_text("- skipped\n", encoding="utf-8")
+    monkeypatch.setattr(ci_integration, "PRODUCTS_DIR", products)
+
+    problems = ci_integration.ci_structural_check()["problems"]
+    assert [p["file"] for p in problems] == [
+        str(products / "alpha_worksheet.yml"),
+        str(products / "product_index.yml"),
+    ]
+    assert problems[0]["error"] == "root is not a mapping"
@@ -106,3 +106,31 @@ def test_scoring_loop_complexity_bucket_mapping(tmp_path):
         expected = 0.0
 
     assert metrics["COMPLEXITY_PROFILE"] == expected
+
+
+def test_repo_totals_computed_once_and_reusable(tmp_path):
+    repo_dir = tmp_path / "totals_repo"
+    module_file = repo_dir / "src" / "m.py"
+    make_module_with_counts(module_file, func_count=4, validator_count=2, stage_count=1, adapter_count=1)
+    other = repo_dir / "src" / "other.py"
+    make_module_with_counts(other, func_count=6, validator_count=0, stage_count=0, adapter_count=0)
+
+    module = load_scanner_module(repo_dir)
+    scanner = module.PILScanner(str(repo_dir))
+
+    totals = scanner.compute_repo_totals()
+    assert totals["functions"] == 13
+    assert totals["adapters"] == 1
+
+    baseline = scanner.compute_complexity_profile([str(module_file)])
+    supplied = scanner.compute_complexity_profile([str(module_file)], repo_totals=totals)
+    assert supplied == baseline
+
+    # inside a scan scope the totals are memoized on the shared index
+    with scanner.scan_scope() as index:
+        scanner.compute_repo_totals()
+        parsed = index.parse_count
+        scanner.compute_complexity_profile([str(module_file)])
+        scanner.compute_repo_totals()
+        assert index.parse_count == parsed == 2
+        assert index.repo_totals == totals
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import yaml
+
+
+def _touch(path: Path, text: str = "x = 1\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_inventory_prunes_and_categorizes(tmp_path, scanner_module):
+    _touch(tmp_path / "src" / "pkg" / "core.py")
+    _touch(tmp_path / "src" / "pkg" / "test_core.py")
+    _touch(tmp_path / "src" / "tests" / "helper.py")
+    _touch(tmp_path / "schemas" / "task_schema.json", "{}")
+    _touch(tmp_path / "node_modules" / "lib" / "x.py")
+    _touch(tmp_path / ".hidden" / "y.py")
+    _touch(tmp_path / "build" / "out" / "z.py")
+    _touch(tmp_path / "vendor" / "keep.py")
+
+    inv = scanner_module.FileInventory(tmp_path, ["build/out", "vendor/"])
+
+    rel = lambda paths: [p.relative_to(tmp_path).as_posix() for p in paths]
+    assert rel(inv.suffix(".py")) == ["src/pkg/core.py", "src/pkg/test_core.py", "src/tests/helper.py"]
+    assert rel(inv.role("impl")) == ["src/pkg/core.py"]
+    assert rel(inv.role("test")) == ["src/pkg/test_core.py", "src/tests/helper.py"]
+    assert rel(inv.role("schema")) == ["schemas/task_schema.json"]
+
+
+def test_scan_ignore_from_repo_contract(tmp_path, scanner_module):
+    _touch(tmp_path / "src" / "a.py")
+    _touch(tmp_path / "generated" / "b.py")
+    (tmp_path / "repo_contract.yml").write_text(yaml.safe_dump({"scan_ignore": ["generated"]}), encoding="utf-8")
+
+    scanner = scanner_module.PILScanner(str(tmp_path))
+    assert [p.name for p in scanner._gather_python_files()] == ["a.py"]
+    assert scanner.discover_impl_files() == [str((tmp_path / "src" / "a.py").resolve())]
+
+
+def test_inventory_walked_once_per_scan(tmp_path, monkeypatch, scanner_module):
+    _touch(tmp_path / "src" / "a.py", "def stage_a(x):\n    return x\n")
+    pm = {f"t{i}": {"implementation_files": ["src/a.py"]} for i in range(3)}
+    (tmp_path / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (tmp_path / "scoring_kpis.yml").write_text(yaml.safe_dump({}), encoding="utf-8")
+
+    walks = []
+    original = scanner_module.FileInventory._walk
+
+    def counting_walk(self):
+        walks.append(self.root)
+        original(self)
+
+    monkeypatch.setattr(scanner_module.FileInventory, "_walk", counting_walk)
+    results = scanner_module.PILScanner(str(tmp_path)).scoring_loop()
+    assert sorted(results) == ["t0", "t1", "t2"]
+    assert len(walks) == 1
@@ -0,0 +1,100 @@
+import importlib.util
+from pathlib import Path
+
+import yaml
+from jinja2 import Environment, FileSystemLoader
+
+
+def load_gen_docs_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    target = repo_root / "scripts" / "gen_docs.py"
+    spec = importlib.util.spec_from_file_location("gen_docs", str(target))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _product(pid, name, related=()):
+    return yaml.safe_dump(
+        {
+            "id": pid,
+            "name": name,
+            "version": "1.0.0",
+            "features": [],
+            "related_products": list(related),
+        }
+    )
+
+
+def test_pages_rerender_only_when_their_inputs_change(tmp_path, monkeypatch):
+    gd = load_gen_docs_module()
+    templates = tmp_path / "templates"
+    _write(
+        templates / "product_page.md.j2",
+        '{% include "partials/header.md" %}{{ product.name }} {{ meta.timestamp }}\n'
+        "{% for r in related_product_links %}{{ r.name }}{% endfor %}\n",
+    )
+    _write(templates / "partials" / "header.md", "# Header\n")
+    _write(tmp_path / "snippets" / "marketing.yml", "tagline: t\n")
+    _write(tmp_path / "products" / "alpha.yml", _product("alpha", "Alpha", ["beta"]))
+    _write(tmp_path / "products" / "beta.yml", _product("beta", "Beta"))
+    monkeypatch.setattr(gd, "ROOT", tmp_path)
+    monkeypatch.setattr(gd, "TEMPLATES", templates)
+    monkeypatch.setattr(
+        gd, "env", Environment(loader=FileSystemLoader(str(templates)), autoescape=False)
+    )
+    monkeypatch.setattr(gd, "_TEMPLATE_DEPENDENCIES", {})
+    outdir = tmp_path / "out"
+
+    def run(jobs=1):
+        manifest = gd.validation_manifest.ValidationManifest(
+            tmp_path / "render.json", "code", tmp_path
+        )
+        session = gd.RenderSession({}, commit="abc", timestamp="T")
+        written, unchanged = gd.render_pages(
+            ["alpha", "beta"], outdir, session, manifest, jobs=jobs
+        )
+        manifest.save()
+        assert len(written) + unchanged == 2
+        return [path.stem for path in written]
+
+    assert run() == ["alpha", "beta"]
+    alpha = (outdir / "alpha.md").read_bytes()
+    assert run() == []
+    assert (outdir / "alpha.md").read_bytes() == alpha
+
+    _write(tmp_path / "products" / "beta.yml", _product("beta", "Beta Renamed"))
+    assert run() == ["alpha", "beta"]
+    assert "Beta Renamed" in (outdir / "alpha.md").read_text(encoding="utf-8")
+
+    _write(templates / "partials" / "header.md", "# New header\n")
+    assert run(jobs=2) == ["alpha", "beta"]
+    page = (outdir / "alpha.md").read_text(encoding="utf-8")
+    assert page == "# New headerAlpha T\nBeta Renamed"
+    (outdir / "beta.md").unlink()
+    assert run() == ["beta"]
+
+
+def test_write_if_changed_keeps_identical_files_untouched(tmp_path):
+    gd = load_gen_docs_module()
+    path = tmp_path / "README.md"
+    assert gd._write_if_changed(path, "same\n") is True
+    mtime = path.stat().st_mtime_ns
+    assert gd._write_if_changed(path, "same\n") is False
+    assert path.stat().st_mtime_ns == mtime
+    assert gd._write_if_changed(path, "new\n") is True
+
+
+def test_bytecode_cache_is_created_by_main_not_on_import(tmp_path, monkeypatch):
+    gd = load_gen_docs_module()
+    assert gd.env.bytecode_cache is None
+    cache_dir = tmp_path / ".pil_cache" / "jinja"
+    monkeypatch.setattr(gd, "BYTECODE_CACHE_DIR", cache_dir)
+    gd._enable_bytecode_cache()
+    assert cache_dir.is_dir()
+    assert gd.env.bytecode_cache.directory == str(cache_dir)
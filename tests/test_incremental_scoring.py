@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import yaml
+
+
+def _make_repo(repo: Path):
+    (repo / "src").mkdir(parents=True)
+    (repo / "docs").mkdir()
+    (repo / "src" / "stages.py").write_text("def stage_one(x):\n    return x > 1\n", encoding="utf-8")
+    (repo / "docs" / "spec_a.md").write_text("spec a\n", encoding="utf-8")
+    pm = {
+        "a": {"implementation_files": ["src/stages.py"], "validation_artifacts": ["docs/spec_a.md"]},
+        "b": {"implementation_files": ["src/stages.py"]},
+        "c": {"implementation_files": ["src/stages.py"], "dependencies": ["a"]},
+    }
+    (repo / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (repo / "scoring_kpis.yml").write_text(yaml.safe_dump({}), encoding="utf-8")
+
+
+def _dump(obj):
+    return json.dumps(obj, sort_keys=True, default=str)
+
+
+def test_incremental_reuses_unchanged_tasks(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+    out = tmp_path / "repos_index.yml"
+
+    first = scanner_module.aggregate_all_repos([str(repo)], previous_index=scanner_module.load_repos_index(str(out)))
+    assert first["repo"]["rescored"] == ["a", "b", "c"]
+    scanner_module.save_repos_index(first, str(out))
+    saved = yaml.safe_load(out.read_text(encoding="utf-8"))["repo"]
+    assert "rescored" not in saved and "task_fingerprints" not in saved
+    assert (repo / ".pil_cache" / "task_fingerprints.json").exists()
+
+    second = scanner_module.aggregate_all_repos([str(repo)], previous_index=scanner_module.load_repos_index(str(out)))
+    assert second["repo"]["rescored"] == []
+    assert second["repo"]["deltas"]["changed"] == []
+    full = scanner_module.aggregate_all_repos([str(repo)])
+    assert _dump(second["repo"]["scoring"]) == _dump(full["repo"]["scoring"])
+    assert _dump(second["repo"]["dependencies"]) == _dump(full["repo"]["dependencies"])
+    scanner_module.save_repos_index(second, str(out))
+
+    # a validation artifact edit only invalidates the task that declares it
+    (repo / "docs" / "spec_a.md").write_text("spec a, revised\n", encoding="utf-8")
+    third = scanner_module.aggregate_all_repos([str(repo)], previous_index=scanner_module.load_repos_index(str(out)))
+    assert third["repo"]["rescored"] == ["a"]
+
+
+def test_incremental_rescores_tasks_whose_previous_result_differs(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+    first = scanner_module.aggregate_all_repos([str(repo)], previous_index={})
+
+    # an index from some other run: b's stored fingerprint no longer vouches for it
+    stale = json.loads(_dump(first))
+    stale["repo"]["scoring"]["b"]["final_score"] = -1
+    second = scanner_module.aggregate_all_repos([str(repo)], previous_index=stale)
+    assert second["repo"]["rescored"] == ["b"]
+    assert _dump(second["repo"]["scoring"]) == _dump(first["repo"]["scoring"])
+
+
+def test_incremental_rescores_when_dependency_status_changes(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+    scanner = scanner_module.PILScanner(str(repo))
+
+    previous = {"scoring": scanner.scoring_loop(previous={}, dependency_index={})}
+    previous["task_fingerprints"] = scanner.incremental_state["fingerprints"]
+
+    scanner.scoring_loop(previous=previous, dependency_index={"a": "done"})
+    assert scanner.incremental_state["rescored"] == ["c"]
+    assert scanner.incremental_state["dependencies"]["c"]["ok"] is True
+
+
+def test_non_incremental_scan_records_no_state(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+    index = scanner_module.aggregate_all_repos([str(repo)])
+    assert "task_fingerprints" not in index["repo"]
+    assert "rescored" not in index["repo"]
+    assert not (repo / ".pil_cache" / "task_fingerprints.json").exists()
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import yaml
+
+
+def _write_report(path: Path, cases):
+    body = "".join(
+        f'<testcase name="{name}" file="{file}">{"<failure/>" if not passed else ""}</testcase>' for file, name, passed in cases
+    )
+    path.write_text(f'<?xml version="1.0"?><testsuites><testsuite>{body}</testsuite></testsuites>', encoding="utf-8")
+
+
+def test_index_lookups(tmp_path, scanner_module):
+    reports = tmp_path / "test-reports"
+    reports.mkdir()
+    _write_report(
+        reports / "a.xml",
+        [
+            ("tests/test_a.py", "test_ok", True),
+            ("tests/test_a.py", "test_bad", False),
+            ("tests/test_b.py", "test_ok", False),
+        ],
+    )
+    (reports / "broken.xml").write_text("<testsuite><testcase name='x'>", encoding="utf-8")
+
+    index = scanner_module.JUnitResultIndex.from_reports(reports)
+
+    assert len(index) == 3
+    assert index.get("tests/test_a.py::test_bad") is False
+    # first key in report order wins for suffix and file matches
+    assert index.by_test_name("test_ok") is True
+    assert index.by_test_name("missing") is None
+    assert index.by_file("tests/test_b.py") is False
+    assert index.by_file("test_a.py") is True
+    assert index.by_file("tests/test_c.py") is None
+    # the legacy mapping API is unchanged
+    assert scanner_module.PILScanner(str(tmp_path)).parse_junit_reports() == index.results
+
+
+def test_scoring_loop_parses_reports_once(tmp_path, scanner_module):
+    reports = tmp_path / "test-reports"
+    reports.mkdir()
+    _write_report(reports / "r.xml", [("tests/test_a.py", "test_ok", True)])
+    (tmp_path / "a.py").write_text("print('x')\n", encoding="utf-8")
+    pm = {f"T{i}": {"implementation_files": ["a.py"], "validation_artifacts": ["tests/test_a.py::test_ok"]} for i in range(5)}
+    (tmp_path / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (tmp_path / "scoring_kpis.yml").write_text(yaml.safe_dump({"score_weights": {"TESTS_PASS": 100}}), encoding="utf-8")
+
+    scanner = scanner_module.PILScanner(str(tmp_path))
+    calls = []
+    original = scanner.junit_index
+
+    def counting_index():
+        calls.append(1)
+        return original()
+
+    scanner.junit_index = counting_index
+    results = scanner.scoring_loop()
+
+    assert len(calls) == 1
+    assert all(res["metrics"]["TESTS_PASS"] == 1.0 for res in results.values())
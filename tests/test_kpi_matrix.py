@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+SCORE_KEYS = ("pre_gate_score", "post_gate_score", "progress_score", "compliance_score", "combined_score", "final_score")
+
+
+def _backends():
+    backends = [False]
+    try:
+        import numpy  # noqa: F401
+
+        backends.append(True)
+    except ImportError:
+        pass
+    return backends
+
+
+def _make_repo(repo: Path, sk):
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "stages.py").write_text("def stage_one(x):\n    return x > 1\n", encoding="utf-8")
+    (repo / "src" / "docs_helper.py").write_text("class Thing:\n    pass\n", encoding="utf-8")
+    pm = {
+        "a": {"implementation_files": ["src/stages.py"], "done_contract": ["state_transition_implemented"]},
+        "b": {"implementation_files": ["src/docs_helper.py"], "task_type": "documentation"},
+        "c": {"implementation_files": ["src/missing.py"], "done_contract": ["tests_pass"], "validation_artifacts": ["tests/test_c.py"]},
+    }
+    (repo / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (repo / "scoring_kpis.yml").write_text(yaml.safe_dump(sk), encoding="utf-8")
+
+
+@pytest.mark.parametrize("use_numpy", _backends())
+def test_rescore_reproduces_scoring_loop(tmp_path, use_numpy, scanner_module):
+    _make_repo(tmp_path, {"gates": {"TESTS_PASS": 40}, "task_type_weights": {"documentation": 0.8}})
+    scanner = scanner_module.PILScanner(str(tmp_path))
+    results = scanner.scoring_loop()
+
+    rescored = scanner.kpi_matrix(results, use_numpy=use_numpy).rescore()
+
+    for task_id, res in results.items():
+        assert rescored[task_id] == {k: res[k] for k in SCORE_KEYS}
+
+
+@pytest.mark.parametrize("use_numpy", _backends())
+def test_rescore_matches_a_rescan_with_new_weights(tmp_path, use_numpy, scanner_module):
+    _make_repo(tmp_path, {})
+    results = scanner_module.PILScanner(str(tmp_path)).scoring_loop()
+    matrix = scanner_module.PILScanner(str(tmp_path)).kpi_matrix(results, use_numpy=use_numpy)
+
+    weights = {"TESTS_PASS": 30, "DOCUMENTATION": 10, "COMPLEXITY_PROFILE": 0.3, "SANITY_GATE": 5}
+    gates = ["DOCUMENTATION", "TESTS_PASS"]
+    type_weights = {"documentation": 0.5}
+    what_if = matrix.rescore(weights, gates, type_weights)
+
+    (tmp_path / "scoring_kpis.yml").write_text(
+        yaml.safe_dump({"score_weights": weights, "gates": gates, "task_type_weights": type_weights}), encoding="utf-8"
+    )
+    truth = scanner_module.PILScanner(str(tmp_path)).scoring_loop()
+    for task_id, res in truth.items():
+        assert what_if[task_id] == {k: res[k] for k in SCORE_KEYS}
+
+
+def test_not_applicable_kpis_skip_gates(scanner_module):
+    matrix = scanner_module.KPIMatrix(
+        ["t"], ["TESTS_PASS", "STATE_TRANSITION"], [[1.0, None]], [["STATE_TRANSITION"]], ["core"], use_numpy=False
+    )
+    scores = matrix.rescore({"TESTS_PASS": 1}, {"STATE_TRANSITION": 10})["t"]
+    assert scores["pre_gate_score"] == 100
+    assert scores["post_gate_score"] == 100
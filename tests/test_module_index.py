@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import yaml
+
+
+def _make_repo(repo: Path, tasks: int = 4):
+    src = repo / "src"
+    src.mkdir(parents=True)
+    (src / "stages.py").write_text("def stage_one(x):\n    return x > 1\n", encoding="utf-8")
+    (src / "validators.py").write_text("class MyValidator:\n    pass\n", encoding="utf-8")
+    (src / "flow.py").write_text("def apply_transition(state):\n    return state\n", encoding="utf-8")
+    pm = {
+        f"t{i}": {
+            "implementation_files": ["src/stages.py", "src/flow.py"],
+            "done_contract": ["state_transition_implemented"],
+        }
+        for i in range(tasks)
+    }
+    (repo / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (repo / "scoring_kpis.yml").write_text(yaml.safe_dump({}), encoding="utf-8")
+
+
+def test_scoring_loop_parses_each_file_once(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+    scanner = scanner_module.PILScanner(str(repo))
+
+    with scanner.scan_scope() as index:
+        results = scanner.scoring_loop()
+        assert sorted(results) == ["t0", "t1", "t2", "t3"]
+        assert index.parse_count == 3
+        # an enclosing scan scope keeps its index across scoring loops
+        assert scanner.scoring_loop() == results
+        assert index.parse_count == 3
+
+
+def test_scoring_loop_index_is_scan_scoped(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo, tasks=1)
+    scanner = scanner_module.PILScanner(str(repo))
+
+    first = scanner.scoring_loop()
+    assert first["t0"]["metrics"]["STATE_TRANSITION"] == 1.0
+
+    # edits between scans are observed because the index does not outlive a scan
+    (repo / "src" / "flow.py").write_text("def other():\n    pass\n", encoding="utf-8")
+    second = scanner.scoring_loop()
+    assert second["t0"]["metrics"]["STATE_TRANSITION"] == 0.0
+
+
+def test_module_index_records_parse_errors(tmp_path, scanner_module):
+    bad = tmp_path / "bad.py"
+    bad.write_text("def broken(:\n", encoding="utf-8")
+    index = scanner_module.ModuleIndex(tmp_path)
+
+    assert index.facts(bad) is None
+    assert index.error(bad)
+    # failures are cached too and never re-parsed
+    assert index.facts(str(bad)) is None
+    assert index.parse_count == 0
+
+
+def test_parallel_scoring_matches_serial(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo, tasks=6)
+
+    serial = scanner_module.PILScanner(str(repo)).scoring_loop()
+    parallel = scanner_module.PILScanner(str(repo), jobs=3).scoring_loop()
+
+    assert list(parallel) == list(serial)
+    assert yaml.safe_dump(parallel) == yaml.safe_dump(serial)
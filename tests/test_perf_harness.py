@@ -0,0 +1,102 @@
+import importlib.util
+import json
+from pathlib import Path
+
+import yaml
+
+
+def load_perf_harness_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    target = repo_root / "tools" / "perf_harness.py"
+    spec = importlib.util.spec_from_file_location("perf_harness", str(target))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _result(scoring, aggregate, files, span=("small", "large")):
+    sizes = {}
+    for name, s, a, f in zip(span, scoring, aggregate, files):
+        sizes[name] = {
+            "scoring_loop_s": s,
+            "aggregate_s": a,
+            "peak_rss_kb": 20000,
+            "shape": {"files": f, "tasks": f // 2, "testcases": f * 2, "depth": 2},
+        }
+    return sizes
+
+
+def test_generate_synthetic_repo_shape(tmp_path):
+    ph = load_perf_harness_module()
+    repo = ph.generate_synthetic_repo(tmp_path / "repo", files=9, tasks=5, testcases=12, depth=3)
+    py_files = sorted(p.relative_to(repo).as_posix() for p in (repo / "src").rglob("*.py"))
+    assert len(py_files) == 9
+    assert any(p.count("/") == 4 for p in py_files)  # src/pkgN/level1/level2/module.py
+    pm = yaml.safe_load((repo / "project_map.yml").read_text(encoding="utf-8"))
+    assert len(pm) == 5
+    assert pm["TASK-0001"]["dependencies"] == ["TASK-0000"]
+    assert (repo / "test-reports" / "junit.xml").read_text(encoding="utf-8").count("<testcase") == 12
+    kpis = yaml.safe_load((repo / "scoring_kpis.yml").read_text(encoding="utf-8"))
+    assert kpis["group_weights"] == {"progress": 0.5, "compliance": 0.5}
+    assert kpis["score_weights"]["TESTS_PASS"] == 30
+
+
+def test_measure_repo_reports_parsed_files(tmp_path):
+    ph = load_perf_harness_module()
+    repo = ph.generate_synthetic_repo(tmp_path / "repo", files=6, tasks=3, testcases=4, depth=2)
+    result = ph.measure_repo(repo, runs=1)
+    assert result["files_parsed"] == 6
+    assert result["scoring_loop_s"] > 0 and result["aggregate_s"] > 0
+    assert result["files_per_second"] > 0
+    json.dumps(result)
+
+
+def test_compare_flags_slowdown_and_worse_scaling():
+    ph = load_perf_harness_module()
+    sizes = _result((0.1, 1.0), (0.1, 1.0), (10, 100))
+    baseline = {"sizes": sizes, "scaling": ph.scaling_exponents(sizes), "scaling_span": ["small", "large"]}
+    assert baseline["scaling"]["scoring_loop_s"] == 1.0
+    assert ph.compare_to_baseline(baseline, baseline) == []
+
+    # same small size, quadratic growth to the large size
+    quadratic = _result((0.1, 10.0), (0.1, 10.0), (10, 100))
+    current = {"sizes": quadratic, "scaling": ph.scaling_exponents(quadratic), "scaling_span": ["small", "large"]}
+    failures = ph.compare_to_baseline(current, baseline)
+    assert any(f.startswith("large: scoring_loop_s") for f in failures)
+    assert any(f.startswith("scaling: scoring_loop_s") for f in failures)
+
+
+def test_compare_skips_scaling_over_a_different_span():
+    ph = load_perf_harness_module()
+    baseline_sizes = _result((0.1, 1.0), (0.1, 1.0), (10, 100))
+    baseline = {"sizes": baseline_sizes, "scaling": {"scoring_loop_s": 0.5}, "scaling_span": ["small", "large"]}
+    sizes = _result((0.1, 0.4), (0.1, 0.4), (10, 40), span=("small", "medium"))
+    current = {"sizes": sizes, "scaling": ph.scaling_exponents(sizes), "scaling_span": ["small", "medium"]}
+    assert ph.compare_to_baseline(current, baseline) == []
+
+
+def test_schema_validation_benchmark_reports_per_document_cost():
+    ph = load_perf_harness_module()
+    docs = ph.synthetic_schema_documents(15)
+    assert [name for name, _ in docs[:3]] == list(ph.API_SCHEMAS)
+    result = ph.measure_schema_validation(docs, runs=1)
+    assert result["documents"] == 15
+    assert result["uncached_us_per_doc"] > 0 and result["cached_us_per_doc"] > 0
+    json.dumps(result)
+
+
+def test_canonical_preflight_benchmark_compares_subprocess_and_in_process():
+    ph = load_perf_harness_module()
+    result = ph.measure_canonical_preflight(runs=1)
+    assert result["subprocess_ms"] > result["in_process_memoized_ms"] >= 0
+    json.dumps(result)
+
+
+def test_fused_signal_visitor_is_cheaper_than_separate_walks(record_property):
+    ph = load_perf_harness_module()
+    result = ph.measure_signal_visitor(functions=300, runs=3)
+    for key in ("fused_ms_per_file", "multi_walk_ms_per_file", "speedup"):
+        record_property(key, result[key])
+    # one traversal against five (about 4x locally); requiring half of that
+    # leaves room for noisy machines but fails once walks are added back
+    assert result["fused_ms_per_file"] * 2 < result["multi_walk_ms_per_file"]
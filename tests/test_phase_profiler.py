@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import yaml
+
+
+def _make_repo(repo: Path):
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "alpha.py").write_text("def alpha(x):\n    return x > 1\n", encoding="utf-8")
+    (repo / "src" / "beta.py").write_text("class Beta:\n    pass\n", encoding="utf-8")
+    pm = {
+        "a": {"implementation_files": ["src/alpha.py"], "done_contract": ["state_transition_implemented"]},
+        "b": {"implementation_files": ["src/beta.py"], "dependencies": ["a"]},
+    }
+    sk = {"weights": {"progress": 0.5, "compliance": 0.5}}
+    (repo / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (repo / "scoring_kpis.yml").write_text(yaml.safe_dump(sk), encoding="utf-8")
+    return repo
+
+
+def test_profiler_records_phases_with_calls_and_files(tmp_path, scanner_module):
+    repo = _make_repo(tmp_path / "repo")
+    profiler = scanner_module.PhaseProfiler()
+    scanner_module.PILScanner(str(repo), profiler=profiler).scoring_loop()
+
+    phases = profiler.report()["phases"]
+    for name in ("scoring_loop", "file_inventory", "median", "task.structure", "task.impl_signals"):
+        assert name in phases, name
+    assert phases["scoring_loop"]["calls"] == 1
+    assert phases["task.structure"]["calls"] == 2
+    assert phases["module_parse"]["files"] == 2
+    assert all(stat["wall_s"] >= 0 for stat in phases.values())
+
+
+def test_profiled_run_matches_unprofiled(tmp_path, scanner_module):
+    repo = _make_repo(tmp_path / "repo")
+    plain = scanner_module.PILScanner(str(repo)).scoring_loop()
+    profiled = scanner_module.PILScanner(str(repo), profiler=scanner_module.PhaseProfiler()).scoring_loop()
+    assert profiled == plain
+
+
+def test_parallel_workers_merge_task_phases(tmp_path, scanner_module):
+    repo = _make_repo(tmp_path / "repo")
+    serial = scanner_module.PhaseProfiler()
+    scanner_module.PILScanner(str(repo), profiler=serial).scoring_loop()
+    parallel = scanner_module.PhaseProfiler()
+    scanner_module.PILScanner(str(repo), jobs=2, profiler=parallel).scoring_loop()
+
+    for name in ("task.structure", "task.impl_signals", "task.complexity"):
+        assert parallel.report()["phases"][name]["calls"] == serial.report()["phases"][name]["calls"]
+
+
+def test_aggregate_records_dependency_and_save_phases(tmp_path, scanner_module):
+    repo = _make_repo(tmp_path / "repo")
+    profiler = scanner_module.PhaseProfiler()
+    index = scanner_module.aggregate_all_repos([str(repo)], profiler=profiler)
+    scanner_module.save_repos_index_with_history(index, str(tmp_path / "repos_index.yml"), profiler=profiler)
+
+    phases = profiler.report()["phases"]
+    assert phases["dependency_checks"]["calls"] == 1
+    assert phases["save_repos_index_with_history"]["files"] == 1
+    assert "drift_detection" in phases
@@ -0,0 +1,32 @@
+import sys
+import types
+
+import pytest
+
+from validation import process_pool
+
+
+def _double(value):
+    return value * 2
+
+
+def test_stand_in_module_is_registered_only_while_the_pool_runs():
+    name = "pil_process_pool_stand_in"
+    entry = types.FunctionType(_double.__code__, {}, "_double")
+    entry.__module__ = name
+    assert name not in sys.modules
+    with process_pool.entry_points_registered(entry):
+        assert sys.modules[name]._double is entry
+    assert name not in sys.modules
+
+
+def test_existing_module_holding_the_entry_points_is_left_alone():
+    module = sys.modules[__name__]
+    with process_pool.entry_points_registered(_double):
+        assert sys.modules[__name__] is module
+
+
+@pytest.mark.skipif(process_pool.fork_context() is None, reason="fork unavailable")
+def test_fork_pool_maps_in_order():
+    with process_pool.fork_pool(2, _double) as pool:
+        assert list(pool.map(_double, [1, 2, 3])) == [2, 4, 6]
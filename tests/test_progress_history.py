@@ -0,0 +1,56 @@
+import json
+
+import yaml
+
+
+def _index(**scores):
+    return {
+        name: {"repo_path": name, "scoring": {"T-1": {"final_score": score}}}
+        for name, score in scores.items()
+    }
+
+
+def test_history_is_appended_to_store_and_rendered(tmp_path, scanner_module):
+    out = tmp_path / "repos_index.yml"
+    for score in (10, 50, 100):
+        scanner_module.save_repos_index_with_history(_index(alpha=score, beta=100 - score), str(out), history_len=2)
+
+    store = tmp_path / "repos_index.history.jsonl"
+    lines = [json.loads(line) for line in store.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 6
+    assert lines[-1] == {"repo": "beta", "value": 0.0}
+
+    saved = yaml.safe_load(out.read_text(encoding="utf-8"))
+    assert saved["alpha"]["progress_history_values"] == [50.0, 100.0]
+    assert saved["beta"]["progress_history_values"] == [50.0, 0.0]
+    assert saved["alpha"]["progress_history"] == "▅█"
+
+
+def test_missing_store_is_seeded_from_previous_index(tmp_path, scanner_module):
+    out = tmp_path / "repos_index.yml"
+    legacy = _index(alpha=0)
+    legacy["alpha"]["progress_history_values"] = [20.0, 40.0]
+    out.write_text(yaml.safe_dump(legacy), encoding="utf-8")
+
+    scanner_module.save_repos_index_with_history(_index(alpha=60), str(out))
+    saved = yaml.safe_load(out.read_text(encoding="utf-8"))
+    assert saved["alpha"]["progress_history_values"] == [20.0, 40.0, 60.0]
+
+
+def test_tail_reads_across_block_boundaries(tmp_path, scanner_module):
+    store = scanner_module.ProgressHistoryStore(str(tmp_path / "h.jsonl"))
+    store.BLOCK_SIZE = 7
+    for i in range(30):
+        store.append({"alpha": float(i), "beta": float(-i)})
+    store.append({"alpha": 99.0})
+
+    tail = store.tail(["alpha", "beta", "gamma"], 3)
+    assert tail == {"alpha": [28.0, 29.0, 99.0], "beta": [-27.0, -28.0, -29.0], "gamma": []}
+
+
+def test_json_index_path_writes_json(tmp_path, scanner_module):
+    out = tmp_path / "repos_index.json"
+    scanner_module.save_repos_index_with_history(_index(alpha=80), str(out))
+    saved = json.loads(out.read_text(encoding="utf-8"))
+    assert saved["alpha"]["progress_history_values"] == [80.0]
+    assert scanner_module.load_repos_index(str(out)) == saved
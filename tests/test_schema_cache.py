@@ -0,0 +1,36 @@
+import pytest
+from jsonschema import Draft7Validator, SchemaError, ValidationError, validate
+
+from validation import schema_cache
+from validation.validator import CHECKLIST_SCHEMA, validate_yaml_text
+
+
+def test_equal_schemas_share_one_compiled_validator(monkeypatch):
+    schema_cache.clear_cache()
+    checks = []
+    real_check = Draft7Validator.check_schema.__func__
+    monkeypatch.setattr(
+        Draft7Validator,
+        "check_schema",
+        classmethod(lambda cls, s: checks.append(1) or real_check(cls, s)),
+    )
+    schema = {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object"}
+    first = schema_cache.compiled_validator(schema)
+    assert isinstance(first, Draft7Validator)
+    assert schema_cache.compiled_validator(dict(reversed(schema.items()))) is first
+    assert checks == [1]
+
+    with pytest.raises(SchemaError):
+        schema_cache.compiled_validator({"type": 5})
+    with pytest.raises(SchemaError):
+        schema_cache.compiled_validator({"type": 5})
+
+
+def test_validate_instance_reports_the_same_error_as_jsonschema():
+    instance = {"metadata": {"product_id": 3}, "states": {}, "phases": [], "items": []}
+    with pytest.raises(ValidationError) as expected:
+        validate(instance=instance, schema=CHECKLIST_SCHEMA)
+    with pytest.raises(ValidationError) as cached:
+        schema_cache.validate_instance(instance, CHECKLIST_SCHEMA)
+    assert str(cached.value) == str(expected.value)
+    assert validate_yaml_text(instance, CHECKLIST_SCHEMA) == (False, [str(expected.value)])
@@ -0,0 +1,86 @@
+import json
+import os
+from pathlib import Path
+
+import yaml
+
+
+def _make_repo(repo: Path):
+    src = repo / "src"
+    src.mkdir(parents=True)
+    (src / "a.py").write_text("def stage_a():\n    pass\n", encoding="utf-8")
+    (src / "b.py").write_text("def validate_b(x):\n    return True\n", encoding="utf-8")
+    (src / "c.py").write_text("class CAdapter:\n    pass\n", encoding="utf-8")
+    pm = {"t1": {"implementation_files": ["src/a.py", "src/b.py"]}}
+    (repo / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (repo / "scoring_kpis.yml").write_text(yaml.safe_dump({}), encoding="utf-8")
+
+
+def _scan(module, repo):
+    scanner = module.PILScanner(str(repo), use_cache=True)
+    # the scope flushes the signal cache on exit
+    with scanner.scan_scope() as index:
+        results = scanner.scoring_loop()
+    return results, index
+
+
+def test_rescan_only_parses_changed_files(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+
+    cold, cold_index = _scan(scanner_module, repo)
+    assert cold_index.parse_count == 3
+    assert (repo / ".pil_cache" / "signals.json").exists()
+
+    warm, warm_index = _scan(scanner_module, repo)
+    assert warm_index.parse_count == 0
+    assert warm == cold
+
+    # touching a file without changing content is resolved by its hash
+    a = repo / "src" / "a.py"
+    st = a.stat()
+    os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    _, touched_index = _scan(scanner_module, repo)
+    assert touched_index.parse_count == 0
+
+    (repo / "src" / "b.py").write_text("def other(x):\n    return 1\n", encoding="utf-8")
+    edited, edited_index = _scan(scanner_module, repo)
+    assert edited_index.parse_count == 1
+    assert edited == scanner_module.PILScanner(str(repo)).scoring_loop()
+
+
+def test_cache_invalidated_when_heuristics_change(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+    _scan(scanner_module, repo)
+
+    cache_file = repo / ".pil_cache" / "signals.json"
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    data["fingerprint"] = "stale"
+    cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+    _, index = _scan(scanner_module, repo)
+    assert index.parse_count == 3
+
+
+def test_cache_is_opt_in(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+
+    scanner_module.PILScanner(str(repo)).scoring_loop()
+    assert not (repo / ".pil_cache").exists()
+
+    scanner_module.PILScanner(str(repo), use_cache=True).scoring_loop()
+    assert (repo / ".pil_cache" / "signals.json").exists()
+
+
+def test_signature_checks_reuse_cached_facts(tmp_path, scanner_module):
+    repo = tmp_path / "repo"
+    _make_repo(repo)
+    _scan(scanner_module, repo)
+
+    scanner = scanner_module.PILScanner(str(repo), use_cache=True)
+    with scanner.scan_scope() as index:
+        batch = scanner.ast_check_batch({"src/b.py": [{"function": "validate_b", "params": ["x"]}]})
+    assert batch["src/b.py"][0]["compliant"] is True
+    assert index.parse_count == 0
@@ -0,0 +1,70 @@
+import ast
+
+
+SAMPLE = '''
+import pipelines.core
+
+def outer(x):
+    def inner(y):
+        return y > 1
+    return inner
+
+class ThingValidator:
+    def check(self, value):
+        if value:
+            self.status = "ok"
+        return not value
+
+def step(current_state):
+    set_state(current_state)
+    return current_state
+'''
+
+
+def test_visitor_collects_all_heuristics(scanner_module):
+    facts = scanner_module.extract_module_facts(ast.parse(SAMPLE))
+
+    assert facts["functions"] == 4
+    assert facts["classes"] == 1
+    assert facts["validator_classes"] == 1
+    assert facts["imports_pipeline"] is True
+    # outer() counts: the bool-like return lives in its nested function
+    assert facts["bool_validators"] == 3
+    # breadth-first first hit: top-level step() precedes the nested assignment
+    assert facts["state_transition"] == ["func_with_state_param_and_return:step@", ":['current_state']"]
+
+
+def test_visitor_handles_deeply_nested_expressions(scanner_module):
+    src = "def f(x):\n    return " + "+".join(["x"] * 2000) + " > 1\n"
+    facts = scanner_module.extract_module_facts(ast.parse(src))
+    assert facts["bool_validators"] == 1
+
+
+def test_visitor_matches_separate_walks_on_large_modules(scanner_module):
+    body = []
+    for i in range(300):
+        body.append(
+            f"def validate_{i}(x):\n"
+            f"    if x > {i}:\n"
+            f"        schema_check(x, [a for a in range({i})])\n"
+            f"        return x == {i}\n"
+            f"    return not x\n"
+        )
+        body.append(f"class Adapter{i}:\n    def run(self, state):\n        self.state = state\n        return state\n")
+    tree = ast.parse("\n".join(body))
+
+    facts = scanner_module.extract_module_facts(tree)
+    nodes = list(ast.walk(tree))
+    functions = [n for n in nodes if isinstance(n, ast.FunctionDef)]
+    classes = [n for n in nodes if isinstance(n, ast.ClassDef)]
+    calls = [n for n in nodes if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)]
+    assert facts["functions"] == len(functions)
+    assert facts["classes"] == len(classes)
+    assert sorted(facts["function_names"]) == sorted(f.name.lower() for f in functions)
+    # signature checks take the first match in walk order
+    assert [row[0] for row in facts["function_defs"]] == [f.name for f in functions]
+    assert facts["validate_functions"] == sum("validate" in f.name for f in functions)
+    assert facts["adapter_classes"] == sum("adapter" in c.name.lower() for c in classes)
+    assert facts["validator_calls"] == sum("schema" in c.func.id or "validate" in c.func.id for c in calls)
+    # validate_* functions are excluded and run() returns its state, not a bool
+    assert facts["bool_validators"] == 0
@@ -0,0 +1,87 @@
+import os
+
+import yaml
+
+from validation import yaml_loader
+from validation.spec_repository import SpecRepository, spec_repository
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+
+def _tree(root):
+    _write(root / "products" / "beta.yml", {"id": "beta", "name": "Beta Guard"})
+    _write(root / "products" / "alpha.yml", {"id": "alpha", "name": "Alpha Scan"})
+    _write(root / "products" / "alpha_worksheet.yml", {"notes": []})
+    _write(root / "products" / "guardsuite_master_spec.yml", {"products": []})
+    _write(root / "product_specs" / "legacy.yml", {"id": "legacy"})
+    _write(root / "contracts" / "alpha.yml", {"contract": "alpha"})
+    _write(
+        root / "products" / "product_index.yml",
+        {
+            "products": [
+                {"product_id": "alpha", "contract_ref": "contracts/alpha.yml"},
+                {"product_id": "beta", "contract_ref": "contracts/missing.yml"},
+            ]
+        },
+    )
+    return root
+
+
+def test_discovery_and_lookups(tmp_path):
+    specs = SpecRepository(_tree(tmp_path))
+    assert specs.product_ids() == ["alpha", "beta"]
+    assert specs.spec_path("legacy") == tmp_path / "product_specs" / "legacy.yml"
+    assert specs.spec_path("nope") is None
+    assert specs.display_name("beta") == "Beta Guard"
+    assert specs.display_name("nope") == "nope"
+    assert specs.index_entry("alpha")["contract_ref"] == "contracts/alpha.yml"
+    assert specs.contract("alpha") == {"contract": "alpha"}
+    assert specs.contract("beta") is None
+    assert specs.schema("alpha") is None
+
+
+def test_shared_instance_parses_each_file_once(tmp_path, monkeypatch):
+    _tree(tmp_path)
+    parses = []
+    real_load = yaml.load
+    monkeypatch.setattr(
+        yaml_loader.yaml, "load", lambda *a, **k: parses.append(1) or real_load(*a, **k)
+    )
+    specs = spec_repository(tmp_path)
+    assert spec_repository(tmp_path / "products" / "..") is specs
+    for _ in range(3):
+        specs.spec("alpha")
+        specs.display_name("alpha")
+        specs.index_entries()
+    assert len(parses) == 2
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+def test_lookups_follow_changes_without_reload(tmp_path):
+    specs = SpecRepository(_tree(tmp_path))
+    assert specs.product_ids() == ["alpha", "beta"]
+    assert specs.index_entry("beta")["contract_ref"] == "contracts/missing.yml"
+
+    _write(tmp_path / "products" / "gamma.yml", {"id": "gamma", "name": "Gamma"})
+    (tmp_path / "products" / "beta.yml").unlink()
+    _bump_mtime(tmp_path / "products")
+    assert specs.product_ids() == ["alpha", "gamma"]
+
+    _write(tmp_path / "products" / "alpha.yml", {"id": "alpha", "name": "Alpha Renamed"})
+    _bump_mtime(tmp_path / "products" / "alpha.yml")
+    assert specs.display_name("alpha") == "Alpha Renamed"
+
+    _write(
+        tmp_path / "products" / "product_index.yml",
+        {"products": [{"product_id": "gamma", "contract_ref": "contracts/alpha.yml"}]},
+    )
+    _bump_mtime(tmp_path / "products" / "product_index.yml")
+    assert specs.index_entry("beta") is None
+    assert specs.contract("gamma") == {"contract": "alpha"}
@@ -0,0 +1,124 @@
+import importlib.util
+from pathlib import Path
+
+import yaml
+
+
+def load_validate_products_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    target = repo_root / "scripts" / "validate_products.py"
+    spec = importlib.util.spec_from_file_location("validate_products", str(target))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+SCHEMA = {
+    "type": "object",
+    "required": ["name", "version"],
+    "properties": {"name": {"type": "string"}, "version": {"type": "integer"}},
+}
+
+
+def _entry(tmp_path, name, payload, schema=SCHEMA):
+    doc = tmp_path / f"{name}.yml"
+    schema_path = tmp_path / f"{name}.schema.yml"
+    if payload is not None:
+        doc.write_text(yaml.safe_dump(payload), encoding="utf-8")
+    schema_path.write_text(yaml.safe_dump(schema), encoding="utf-8")
+    hint = f"semantic {name}"
+    return (doc, schema_path, f"{name} schema failed: ", hint, f"{hint} schema")
+
+
+def test_all_failures_reported_in_registry_order(tmp_path):
+    vp = load_validate_products_module()
+    checks = [
+        _entry(tmp_path, "good", {"name": "x", "version": 1}),
+        _entry(tmp_path, "typed", {"name": 3, "version": "one"}),
+        _entry(tmp_path, "absent", None),
+        _entry(tmp_path, "empty", {}),
+        _entry(tmp_path, "listed", ["name", "version"]),
+        _entry(tmp_path, "undecodable", None),
+        _entry(tmp_path, "last", {"name": "x"}),
+    ]
+    (tmp_path / "undecodable.yml").write_bytes(b"name: \xff\xfe\n")
+    expected = [
+        "typed schema failed: name: 3 is not of type 'string'",
+        "typed schema failed: version: 'one' is not of type 'integer'",
+        f"absent schema failed: {tmp_path / 'absent.yml'} missing; bootstrap semantic absent",
+        "empty schema failed: 'name' is a required property",
+        "empty schema failed: 'version' is a required property",
+        f"listed schema failed: {tmp_path / 'listed.yml'} root must be a mapping",
+        "undecodable schema failed: unreadable: ",
+        "last schema failed: 'version' is a required property",
+    ]
+    def matches(failures):
+        # the decoder's message text is not ours; match the unreadable line by prefix
+        return len(failures) == len(expected) and all(
+            got == want or (want.endswith("unreadable: ") and got.startswith(want))
+            for got, want in zip(failures, expected)
+        )
+
+    assert matches(vp.validate_semantic_documents(checks, jobs=1))
+    for _ in range(5):
+        assert matches(vp.validate_semantic_documents(checks, jobs=4))
+
+
+def test_registry_covers_repository_documents():
+    vp = load_validate_products_module()
+    prefixes = [entry[2] for entry in vp.SEMANTIC_CHECKS]
+    assert len(prefixes) == len(set(prefixes))
+    semantic = [entry for entry in vp.SEMANTIC_CHECKS if entry[0].parent == vp.SEMANTIC_DIR]
+    assert vp.validate_semantic_documents(semantic) == []
+
+
+def test_missing_registry_files_keep_their_bootstrap_hints(tmp_path):
+    vp = load_validate_products_module()
+    rules, *_, pillar = vp.SEMANTIC_CHECKS
+    assert rules[0] == vp.SEMANTIC_DIR / "semantic_rules.yml"
+    missing_rules = (vp.SEMANTIC_DIR / "absent.yml", *rules[1:])
+    assert vp.validate_semantic_documents([missing_rules]) == [
+        "Semantic rules schema failed: absent.yml missing; bootstrap semantic governance"
+    ]
+    _, schema, prefix, spec_hint, schema_hint = pillar
+    missing_spec = (vp.PRODUCTS / "absent.yml", schema, prefix, spec_hint, schema_hint)
+    present = tmp_path / "pillar-template.yml"
+    present.write_text("id: pillar-template\n", encoding="utf-8")
+    missing_schema = (present, vp.PRODUCTS / "absent.schema.yml", *pillar[2:])
+    assert vp.validate_semantic_documents([missing_spec, missing_schema]) == [
+        "Pillar template schema failed: products/absent.yml missing; "
+        "bootstrap pillar template spec",
+        "Pillar template schema failed: products/absent.schema.yml missing; "
+        "bootstrap pillar template schema",
+    ]
+
+
+def test_product_pool_matches_serial_order(tmp_path, monkeypatch):
+    vp = load_validate_products_module()
+    monkeypatch.setattr(vp, "ROOT", tmp_path)
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "shared.yml").write_text("a: 1\n", encoding="utf-8")
+    index = {}
+    for idx in range(6):
+        pid = f"p{idx}"
+        spec = {"id": pid, "name": pid, "contract_ref": "contracts/shared.yml"}
+        if idx % 2:
+            spec["contract_ref"] = f"contracts/{pid}.yml"
+        spec_path = tmp_path / "products" / f"{pid}.yml"
+        spec_path.parent.mkdir(exist_ok=True)
+        spec_path.write_text(yaml.safe_dump(spec), encoding="utf-8")
+        index[pid] = {"product_id": pid, "contract_ref": spec["contract_ref"]}
+    paths = vp.spec_repository(tmp_path).spec_paths().values()
+    known = set(index)
+
+    def strip(results):
+        return [(path, pid, errors) for path, pid, errors, _, _ in results]
+
+    serial = vp.validate_product_files(list(paths), index, known, jobs=1)
+    pooled = vp.validate_product_files(list(paths), index, known, jobs=3)
+    assert strip(pooled) == strip(serial)
+    assert [pid for _, pid, _ in strip(serial)] == [f"p{idx}" for idx in range(6)]
+    missing = "contract_ref file contracts/p1.yml missing on disk"
+    assert any(missing in error for error in serial[1][2])
+    assert not any("contract_ref file" in error for error in serial[0][2])
+    assert all(result[4] >= 0 for result in pooled)
@@ -0,0 +1,87 @@
+import importlib.util
+from pathlib import Path
+
+import yaml
+
+from validation import validation_manifest as vm
+
+
+def load_script(name):
+    repo_root = Path(__file__).resolve().parents[1]
+    target = repo_root / "scripts" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, str(target))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_lookup_hits_only_while_inputs_and_code_are_unchanged(tmp_path):
+    doc = tmp_path / "doc.yml"
+    schema = tmp_path / "doc.schema.yml"
+    doc.write_text("a: 1\n", encoding="utf-8")
+    schema.write_text("type: object\n", encoding="utf-8")
+    path = tmp_path / ".pil_cache" / "v.manifest.json"
+
+    first = vm.ValidationManifest(path, "code-1", tmp_path)
+    assert first.lookup("doc") is None
+    first.record("doc", [doc, schema, tmp_path / "absent.yml"], {"product_id": "x"})
+    first.save()
+
+    assert vm.ValidationManifest(path, "code-1", tmp_path).lookup("doc") == {"product_id": "x"}
+    assert vm.ValidationManifest(path, "code-1", tmp_path, full=True).lookup("doc") is None
+    assert vm.ValidationManifest(path, "code-2", tmp_path).lookup("doc") is None
+    assert vm.ValidationManifest(path, "code-1", tmp_path).lookup("doc", context="other") is None
+
+    (tmp_path / "absent.yml").write_text("now: present\n", encoding="utf-8")
+    assert vm.ValidationManifest(path, "code-1", tmp_path).lookup("doc") is None
+    (tmp_path / "absent.yml").unlink()
+    schema.write_text("type: array\n", encoding="utf-8")
+    assert vm.ValidationManifest(path, "code-1", tmp_path).lookup("doc") is None
+
+
+def test_corrupt_manifest_behaves_like_an_empty_one(tmp_path):
+    path = tmp_path / "m.json"
+    path.write_text("{not json", encoding="utf-8")
+    manifest = vm.ValidationManifest(path, "code", tmp_path)
+    assert manifest.lookup("anything") is None
+    manifest.record("anything", [])
+    manifest.save()
+    assert vm.ValidationManifest(path, "code", tmp_path).lookup("anything") == {}
+
+
+def test_semantic_checks_skip_unchanged_passes_but_recheck_failures(tmp_path, monkeypatch):
+    vp = load_script("validate_products")
+    schema = {"type": "object", "required": ["name"]}
+    checks = []
+    for name, payload in (("good", {"name": "x"}), ("bad", {})):
+        doc = tmp_path / f"{name}.yml"
+        doc.write_text(yaml.safe_dump(payload), encoding="utf-8")
+        schema_path = tmp_path / f"{name}.schema.yml"
+        schema_path.write_text(yaml.safe_dump(schema), encoding="utf-8")
+        checks.append((doc, schema_path, f"{name}: ", name, name))
+    path = tmp_path / "m.json"
+
+    def run():
+        manifest = vm.ValidationManifest(path, "code", tmp_path)
+        failures = vp.validate_semantic_documents(checks, jobs=2, manifest=manifest)
+        manifest.save()
+        return failures, manifest.hits
+
+    checked = []
+    real_check = vp._check_semantic_document
+    monkeypatch.setattr(
+        vp,
+        "_check_semantic_document",
+        lambda doc, *rest: checked.append(doc.stem) or real_check(doc, *rest),
+    )
+    assert run() == (["bad: 'name' is a required property"], 0)
+    checked.clear()
+    assert run() == (["bad: 'name' is a required property"], 1)
+    assert checked == ["bad"]
+
+
+def test_shared_sources_exist_and_feed_the_code_version(tmp_path):
+    assert vm.SHARED_SOURCES and all(path.is_file() for path in vm.SHARED_SOURCES)
+    script = tmp_path / "script.py"
+    script.write_text("x = 1\n", encoding="utf-8")
+    assert vm.code_version(script, *vm.SHARED_SOURCES) != vm.code_version(script)
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+
+import yaml
+
+
+def _make_repo(repo: Path):
+    (repo / "src").mkdir(parents=True)
+    (repo / "tests").mkdir()
+    (repo / "src" / "alpha.py").write_text("def alpha(x):\n    return x > 1\n", encoding="utf-8")
+    (repo / "tests" / "test_beta.py").write_text("def test_beta():\n    assert True\n", encoding="utf-8")
+    pm = {
+        "a": {"implementation_files": ["src/alpha.py"]},
+        "b": {"implementation_files": ["src/alpha.py"], "validation_artifacts": ["tests/test_beta.py"]},
+    }
+    (repo / "project_map.yml").write_text(yaml.safe_dump(pm), encoding="utf-8")
+    (repo / "scoring_kpis.yml").write_text(yaml.safe_dump({"weights": {"progress": 0.5, "compliance": 0.5}}), encoding="utf-8")
+    return repo
+
+
+def _touch(path: Path, text: str):
+    path.write_text(text, encoding="utf-8")
+    st = os.stat(path)
+    # make sure the poll sees a new mtime even on coarse-grained filesystems
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+class ScriptedSleep:
+    """Stands in for time.sleep; runs one scripted edit per call."""
+
+    def __init__(self, edits):
+        self.edits = list(edits)
+        self.calls = 0
+
+    def __call__(self, seconds):
+        self.calls += 1
+        if self.edits:
+            edit = self.edits.pop(0)
+            if edit is not None:
+                edit()
+
+
+def test_watch_rescores_only_tasks_whose_inputs_changed(tmp_path, scanner_module):
+    repo = _make_repo(tmp_path / "repo")
+    artifact = repo / "tests" / "test_beta.py"
+    sleep = ScriptedSleep([None, lambda: _touch(artifact, "def test_beta():\n    assert 1\n")])
+    scanner = scanner_module.PILScanner(str(repo))
+
+    first, second = list(scanner.watch(interval=0, debounce=0, max_updates=2, sleep=sleep))
+
+    assert sorted(first["rescored"]) == ["a", "b"]
+    assert sorted(first["deltas"]) == ["a", "b"]
+    assert second["changed"] == [os.path.join("tests", "test_beta.py")]
+    assert second["rescored"] == ["b"]
+    assert second["results"] == scanner_module.PILScanner(str(repo)).scoring_loop()
+
+
+def test_watch_debounces_a_burst_of_changes(tmp_path, scanner_module):
+    repo = _make_repo(tmp_path / "repo")
+    impl = repo / "src" / "alpha.py"
+    sleep = ScriptedSleep(
+        [
+            lambda: _touch(impl, "def alpha(x):\n    return x > 2\n"),
+            lambda: _touch(repo / "src" / "gamma.py", "class GammaAdapter:\n    pass\n"),
+            None,
+        ]
+    )
+    scanner = scanner_module.PILScanner(str(repo))
+
+    updates = list(scanner.watch(interval=0, debounce=0, max_updates=2, sleep=sleep))
+
+    # interval poll, one debounce poll that saw the second edit, one that settled
+    assert sleep.calls == 3
+    assert updates[1]["changed"] == [os.path.join("src", "alpha.py"), os.path.join("src", "gamma.py")]
+    assert sorted(updates[1]["rescored"]) == ["a", "b"]
+    assert updates[1]["results"] == scanner_module.PILScanner(str(repo)).scoring_loop()
+
+
+def test_score_deltas_reports_changed_added_and_removed_tasks(scanner_module):
+    before = {"a": {"final_score": 10}, "b": {"final_score": 20}, "c": {"final_score": 5}}
+    after = {"a": {"final_score": 10}, "b": {"final_score": 25}, "d": {"final_score": 1}}
+    assert scanner_module.score_deltas(before, after) == {
+        "b": {"before": 20, "after": 25},
+        "c": {"before": 5, "after": None},
+        "d": {"before": None, "after": 1},
+    }
+    assert scanner_module.score_deltas(before, {"status": "UNABLE_TO_SCORE"})["a"] == {"before": 10, "after": None}
@@ -0,0 +1,32 @@
+import os
+
+import yaml
+
+from validation import yaml_loader
+
+
+def test_unchanged_file_is_parsed_once_and_copies_are_independent(tmp_path, monkeypatch):
+    path = tmp_path / "spec.yml"
+    path.write_text("name: alpha\nfeatures: [a, b]\n", encoding="utf-8")
+    parses = []
+    real_load = yaml.load
+    monkeypatch.setattr(
+        yaml_loader.yaml, "load", lambda *a, **k: parses.append(1) or real_load(*a, **k)
+    )
+
+    first = yaml_loader.load_yaml(path)
+    first["features"].append("mutated")
+    assert yaml_loader.load_yaml(path) == {"name": "alpha", "features": ["a", "b"]}
+    assert yaml_loader.load_yaml(path, copy=False) is yaml_loader.load_yaml(path, copy=False)
+    assert len(parses) == 1
+
+    path.write_text("name: beta\n", encoding="utf-8")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    assert yaml_loader.load_yaml(path) == {"name": "beta"}
+    assert len(parses) == 2
+
+
+def test_parse_yaml_matches_safe_load():
+    text = "a: 1\nb: [x, {c: null}]\nd: 2024-01-01\n"
+    assert yaml_loader.parse_yaml(text) == yaml.safe_load(text)
@@ -18,9 +18,14 @@ import json
 import subprocess
 from pathlib import Path
 from datetime import datetime, timezone
-import yaml
 import sys
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from validation.yaml_loader import load_yaml
+
 
 def load_json(path: Path):
     with path.open("r", encoding="utf-8") as f:
@@ -61,7 +66,7 @@ def classify_file(relpath):
 def extract_rule_spec_info(root: Path, relpath: str):
     p = root / relpath
     try:
-        data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+        data = load_yaml(p, copy=False) or {}
         return {
             "rule_id": data.get("rule_id"),
             "applies_to": data.get("applies_to"),
@@ -73,7 +78,7 @@ def extract_rule_spec_info(root: Path, relpath: str):
 def extract_metadata_sections(root: Path, relpath: str):
     p = root / relpath
     try:
-        data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+        data = load_yaml(p, copy=False) or {}
         if isinstance(data, dict):
             return sorted(list(data.keys()))
         return []
@@ -6,19 +6,61 @@ By default this runs a small Python timeit to produce quick timing numbers. It w
 
 Usage:
   python3 tools/perf_harness.py --cmd "python -m timeit -n100 -r3 'sum(range(100))'"
+  python3 tools/perf_harness.py --scanner [--sizes small,medium] [--update-baseline]
+  python3 tools/perf_harness.py --schema-validation [--documents 300]
+  python3 tools/perf_harness.py --canonical-preflight
+  python3 tools/perf_harness.py --signal-visitor [--functions 300]
 
 If no command provided, runs a default microbenchmark.
+
+`--scanner` runs the repo-scanner benchmark suite instead: it generates synthetic PIL
+repos (N Python files, M project_map tasks, a JUnit report with K test cases, `src/`
+nested D levels deep), times `PILScanner.scoring_loop` and `aggregate_all_repos` on
+each in a fresh interpreter, and records latency, peak RSS and files parsed per second
+in `ai_reports/scanner_bench.json`. Results are compared against the committed
+`tools/perf_baseline.json`; the run exits non-zero when a size got more than
+`--tolerance` times slower or when latency scales worse with repo size than the
+baseline did (the scaling exponent is ~1 for linear and ~2 for quadratic growth).
+
+`--schema-validation` times per-document jsonschema validation of synthetic API
+product records (spec, checklist and bootstrap documents) with a fresh
+`jsonschema.validate()` per call against the cached validators from
+`validation.schema_cache`, and writes `ai_reports/schema_validation_bench.json`.
+
+`--canonical-preflight` times the canonical schema preflight as the
+`validate_products.py --check-canonical` subprocess that gen_docs and export_for_ai
+used to spawn against the in-process `validation.canonical_schema` check (cold and
+memoized), and writes `ai_reports/canonical_preflight_bench.json`.
+
+`--signal-visitor` times the scanner's single-traversal `extract_module_facts` against
+the five separate `ast.walk` passes it replaced, per parsed module, on a synthetic
+module with `--functions` validator/adapter pairs, and writes
+`ai_reports/signal_visitor_bench.json`.
 """
 from pathlib import Path
 import subprocess
+import sys
 import json
+import math
 import argparse
 import statistics
+import tempfile
+import time
 from datetime import datetime
 
 ROOT = Path(__file__).resolve().parents[1]
 AI = ROOT / "ai_reports"
-AI.mkdir(parents=True, exist_ok=True)
+SCANNER = ROOT / "repo-scanner.py"
+BASELINE = Path(__file__).resolve().parent / "perf_baseline.json"
+
+# synthetic repo shapes, smallest first; scaling is measured across them
+SCANNER_SIZES = {
+    "small": {"files": 20, "tasks": 10, "testcases": 40, "depth": 2},
+    "medium": {"files": 80, "tasks": 40, "testcases": 160, "depth": 3},
+    "large": {"files": 240, "tasks": 120, "testcases": 480, "depth": 4},
+}
+TIMED_METRICS = ("scoring_loop_s", "aggregate_s")
+API_SCHEMAS = ("product_schema.yml", "checklist_schema.yml", "bootstrap_schema.yml")
 
 
 def run_cmd(cmd):
@@ -26,12 +68,473 @@ def run_cmd(cmd):
     return p.returncode, p.stdout
 
 
+def _write_json(path, payload):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8", newline="\n")
+
+
+def generate_synthetic_repo(root, files, tasks, testcases, depth):
+    """Write a deterministic PIL repo under `root` and return its path.
+
+    Python files are spread over four packages nested `depth` levels below
+    `src/`; every task points at two of them, references two JUnit test
+    cases and depends on the previous task.
+    """
+    import yaml
+
+    root = Path(root)
+    impl = []
+    for i in range(files):
+        pkg = Path("src", f"pkg{i % 4}", *[f"level{d}" for d in range(1, depth)][: i % depth])
+        (root / pkg).mkdir(parents=True, exist_ok=True)
+        rel = pkg / f"module_{i}.py"
+        body = [
+            "import os",
+            "",
+            f"def validate_{i}(value):",
+            "    if value is None:",
+            "        return False",
+            "    return value > 1",
+            "",
+            f"class Stage{i}:",
+            "    def run(self, state):",
+            "        for item in state:",
+            "            if item:",
+            "                state.status = 'done'",
+            "        return state",
+        ]
+        if i % 3 == 0:
+            body += ["", "@state_transition()", f"def advance_{i}(state):", "    set_state(state)"]
+        (root / rel).write_text("\n".join(body) + "\n", encoding="utf-8")
+        impl.append(rel.as_posix())
+
+    cases = []
+    for k in range(testcases):
+        failure = "<failure/>" if k % 10 == 9 else ""
+        cases.append(f'<testcase name="test_{k}" file="tests/test_mod{k % 8}.py">{failure}</testcase>')
+    (root / "test-reports").mkdir(parents=True, exist_ok=True)
+    (root / "test-reports" / "junit.xml").write_text(
+        "<testsuite>" + "".join(cases) + "</testsuite>\n", encoding="utf-8"
+    )
+
+    project_map = {}
+    for t in range(tasks):
+        entry = {
+            "implementation_files": [impl[(2 * t) % files], impl[(2 * t + 1) % files]],
+            "validation_artifacts": [
+                f"tests/test_mod{k % 8}.py::test_{k}" for k in (t % testcases, (t * 7) % testcases)
+            ],
+            "task_type": ("pipeline_stage", "core", "documentation")[t % 3],
+        }
+        if t:
+            entry["dependencies"] = [f"TASK-{t - 1:04d}"]
+        if t % 2 == 0:
+            entry["done_contract"] = ["state_transition_implemented", "tests_pass"]
+        project_map[f"TASK-{t:04d}"] = entry
+    (root / "project_map.yml").write_text(yaml.safe_dump(project_map, sort_keys=True), encoding="utf-8")
+    scoring_kpis = {
+        "score_weights": {
+            "TESTS_PASS": 30,
+            "CODE_ARTIFACT_PRESENT": 20,
+            "SPEC_COVERAGE": 20,
+            "COMPLEXITY_PROFILE": 10,
+            "SANITY_GATE": 10,
+            "DOCUMENTATION": 10,
+        },
+        "group_weights": {"progress": 0.5, "compliance": 0.5},
+    }
+    (root / "scoring_kpis.yml").write_text(yaml.safe_dump(scoring_kpis, sort_keys=True), encoding="utf-8")
+    return root
+
+
+def _load_scanner():
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("repo_scanner", str(SCANNER))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _timed(fn, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def measure_repo(repo, runs):
+    """Time the scanner entry points against `repo` in this process."""
+    mod = _load_scanner()
+    repo = str(repo)
+    # one profiled warm-up run, which also counts the files the scan parses
+    profiler = mod.PhaseProfiler()
+    mod.PILScanner(repo, profiler=profiler).scoring_loop()
+    parsed = int(profiler.phases.get("module_parse", {}).get("files", 0))
+
+    scoring = _timed(lambda: mod.PILScanner(repo).scoring_loop(), runs)
+    aggregate = _timed(lambda: mod.aggregate_all_repos([repo]), runs)
+    peak_rss_kb = None
+    try:
+        import resource
+
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_rss_kb //= 1024
+    except ImportError:
+        pass
+    return {
+        "scoring_loop_s": round(scoring, 6),
+        "aggregate_s": round(aggregate, 6),
+        "files_parsed": parsed,
+        "files_per_second": round(parsed / scoring, 1) if scoring > 0 else None,
+        "peak_rss_kb": peak_rss_kb,
+    }
+
+
+def _measure_in_subprocess(repo, runs):
+    # a fresh interpreter per size keeps peak RSS attributable to that size
+    p = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--measure-repo", str(repo), "--runs", str(runs)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=str(ROOT),
+    )
+    if p.returncode != 0:
+        raise RuntimeError(f"scanner benchmark failed for {repo}:\n{p.stderr}")
+    return json.loads(p.stdout.strip().splitlines()[-1])
+
+
+def _scaling_span(sizes):
+    ordered = sorted(sizes, key=lambda name: sizes[name]["shape"]["files"])
+    return [ordered[0], ordered[-1]] if len(ordered) > 1 else []
+
+
+def scaling_exponents(sizes):
+    """Return log-log slope of each timed metric between the smallest and largest size."""
+    span = _scaling_span(sizes)
+    if not span:
+        return {}
+    small, large = sizes[span[0]], sizes[span[1]]
+    ratio = large["shape"]["files"] / small["shape"]["files"]
+    out = {}
+    for metric in TIMED_METRICS:
+        if small[metric] > 0 and large[metric] > 0 and ratio > 1:
+            out[metric] = round(math.log(large[metric] / small[metric]) / math.log(ratio), 3)
+    return out
+
+
+def run_scanner_suite(sizes, runs, shapes=None):
+    shapes = shapes or SCANNER_SIZES
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="pil-bench-") as td:
+        for name in sizes:
+            shape = shapes[name]
+            repo = generate_synthetic_repo(Path(td) / name, **shape)
+            entry = _measure_in_subprocess(repo, runs)
+            entry["shape"] = dict(shape)
+            results[name] = entry
+            print(
+                f"{name}: scoring_loop {entry['scoring_loop_s']:.3f}s, aggregate {entry['aggregate_s']:.3f}s, "
+                f"{entry['files_per_second']} files/s, peak RSS {entry['peak_rss_kb']} KiB"
+            )
+    return {
+        "generated_at": datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "runs": runs,
+        "sizes": results,
+        "scaling": scaling_exponents(results),
+        "scaling_span": _scaling_span(results),
+    }
+
+
+def compare_to_baseline(current, baseline, tolerance=2.5, exponent_slack=0.35):
+    """Return human-readable regressions of `current` against `baseline`."""
+    failures = []
+    for name, cur in sorted(current.get("sizes", {}).items()):
+        base = baseline.get("sizes", {}).get(name)
+        if not base:
+            continue
+        if base.get("shape") != cur.get("shape"):
+            failures.append(f"{name}: shape {cur.get('shape')} differs from baseline {base.get('shape')}")
+            continue
+        for metric in TIMED_METRICS + ("peak_rss_kb",):
+            if cur.get(metric) is None or not base.get(metric):
+                continue
+            if cur[metric] > base[metric] * tolerance:
+                failures.append(
+                    f"{name}: {metric} {cur[metric]} exceeds {tolerance}x baseline {base[metric]}"
+                )
+    # exponents are only comparable when measured over the same pair of sizes
+    same_span = current.get("scaling_span") == baseline.get("scaling_span")
+    for metric, exponent in sorted(current.get("scaling", {}).items() if same_span else ()):
+        base_exponent = baseline.get("scaling", {}).get(metric)
+        if base_exponent is not None and exponent > base_exponent + exponent_slack:
+            failures.append(
+                f"scaling: {metric} grows with exponent {exponent} (baseline {base_exponent})"
+            )
+    return failures
+
+
+def synthetic_schema_documents(count):
+    """Return `count` (schema name, instance) pairs cycling over `API_SCHEMAS`.
+
+    Instances mirror what `api.validate.validate_product` checks per product;
+    every fifth checklist lacks its items so error reporting is timed too.
+    """
+    docs = []
+    for i in range(count):
+        pid = f"product-{i // 3}"
+        name = API_SCHEMAS[i % 3]
+        if name == "product_schema.yml":
+            instance = {
+                "id": pid, "name": pid.title(), "owner": "guardsuite", "version": "1.0.0",
+                "tags": ["scanner", "iac"], "spec_yaml": "id: x\n", "checklist_yaml": "items: []\n",
+                "gpt_instructions_yaml": "product: x\n",
+            }
+        elif name == "checklist_schema.yml":
+            instance = {
+                "metadata": {"checklist_version": "1", "product_id": pid, "description": "d"},
+                "states": {"allowed": ["todo", "done"]},
+                "phases": [{"id": f"P{p}", "name": f"Phase {p}", "description": "d"} for p in range(3)],
+                "items": [
+                    {
+                        "id": f"C{k}", "phase": f"P{k % 3}", "title": f"Item {k}", "status": "todo",
+                        "acceptance_criteria": ["works", "tested"], "dependencies": [f"C{k - 1}"] if k else [],
+                    }
+                    for k in range(12)
+                ],
+            }
+            if i % 5 == 4:
+                del instance["items"]
+        else:
+            instance = {
+                "product": pid, "timestamp": "2024-01-01T00:00:00Z", "version": "1", "spec": "s",
+                "checklist": "c", "gpt_instructions": "g", "incomplete": False, "validation_errors": [],
+                "architect_session_state": {
+                    "last_checklist_item": None, "last_instruction_version": 1, "last_implementor_status": None,
+                },
+            }
+        docs.append((name, instance))
+    return docs
+
+
+def measure_schema_validation(documents, runs):
+    """Time uncached `jsonschema.validate()` against the cached validators, per document."""
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from jsonschema import ValidationError, validate
+    from validation.schema_cache import clear_cache, validate_instance
+    from validation.validator import load_schema
+
+    schemas = {name: load_schema(name) for name in API_SCHEMAS}
+
+    def run(check):
+        for name, instance in documents:
+            try:
+                check(instance, schemas[name])
+            except ValidationError:
+                pass
+
+    clear_cache()
+    uncached = _timed(lambda: run(lambda instance, schema: validate(instance=instance, schema=schema)), runs)
+    cached = _timed(lambda: run(validate_instance), runs)
+    count = len(documents)
+    return {
+        "documents": count,
+        "uncached_us_per_doc": round(uncached / count * 1e6, 2),
+        "cached_us_per_doc": round(cached / count * 1e6, 2),
+        "speedup": round(uncached / cached, 2) if cached > 0 else None,
+    }
+
+
+def schema_validation_main(args):
+    result = measure_schema_validation(synthetic_schema_documents(args.documents), args.runs)
+    result["runs"] = args.runs
+    result["generated_at"] = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    print(
+        f"{result['documents']} documents: jsonschema.validate {result['uncached_us_per_doc']} us/doc, "
+        f"cached validators {result['cached_us_per_doc']} us/doc ({result['speedup']}x)"
+    )
+    out_path = AI / "schema_validation_bench.json"
+    _write_json(out_path, result)
+    print("Wrote schema validation benchmark to", out_path)
+    return 0
+
+
+def measure_canonical_preflight(runs):
+    """Time the `--check-canonical` subprocess against the in-process preflight."""
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from validation.canonical_schema import check_canonical_schema, clear_cache
+
+    cmd = [sys.executable, str(ROOT / "scripts" / "validate_products.py"), "--check-canonical"]
+    spawned = _timed(lambda: subprocess.run(cmd, capture_output=True, check=True, cwd=str(ROOT)), runs)
+
+    def cold():
+        clear_cache()
+        check_canonical_schema(ROOT)
+
+    cold_s = _timed(cold, runs)
+    memoized = _timed(lambda: check_canonical_schema(ROOT), runs)
+    return {
+        "subprocess_ms": round(spawned * 1000, 3),
+        "in_process_cold_ms": round(cold_s * 1000, 3),
+        "in_process_memoized_ms": round(memoized * 1000, 3),
+        # export_for_ai preflights twice per run, gen_docs and the mkdocs hook once
+        "export_run_saved_ms": round((2 * spawned - cold_s - memoized) * 1000, 3),
+    }
+
+
+def canonical_preflight_main(args):
+    result = measure_canonical_preflight(args.runs)
+    result["runs"] = args.runs
+    result["generated_at"] = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    print(
+        f"canonical preflight: subprocess {result['subprocess_ms']} ms, in-process "
+        f"{result['in_process_cold_ms']} ms cold / {result['in_process_memoized_ms']} ms memoized; "
+        f"export_for_ai saves {result['export_run_saved_ms']} ms per run"
+    )
+    out_path = AI / "canonical_preflight_bench.json"
+    _write_json(out_path, result)
+    print("Wrote canonical preflight benchmark to", out_path)
+    return 0
+
+
+def synthetic_module_tree(functions):
+    """Parse a module holding `functions` validator functions and adapter classes."""
+    import ast
+
+    body = []
+    for i in range(functions):
+        body.append(
+            f"def validate_{i}(x):\n"
+            f"    if x > {i}:\n"
+            f"        schema_check(x, [a for a in range({i})])\n"
+            f"        return x == {i}\n"
+            f"    return not x\n"
+        )
+        body.append(f"class Adapter{i}:\n    def run(self, state):\n        self.state = state\n        return state\n")
+    return ast.parse("\n".join(body))
+
+
+def multi_walk_signals(tree):
+    """Per-file walk pattern the scanner used before its fused signal visitor."""
+    import ast
+
+    counts = 0
+    for _ in range(2):  # duplicated import-detection loops
+        for n in ast.walk(tree):
+            counts += isinstance(n, (ast.Import, ast.ImportFrom))
+    for _ in range(2):  # implementation signals + complexity profile
+        for n in ast.walk(tree):
+            if isinstance(n, ast.FunctionDef):
+                counts += sum(isinstance(s, ast.Return) for s in ast.walk(n))
+            counts += isinstance(n, (ast.ClassDef, ast.Call))
+    for n in ast.walk(tree):  # state-transition probe
+        if isinstance(n, ast.FunctionDef):
+            counts += any(isinstance(s, ast.Return) for s in ast.walk(n))
+    return counts
+
+
+def measure_signal_visitor(functions, runs):
+    """Time `extract_module_facts` against `multi_walk_signals` on one synthetic module."""
+    mod = _load_scanner()
+    tree = synthetic_module_tree(functions)
+    fused = _timed(lambda: mod.extract_module_facts(tree), runs)
+    legacy = _timed(lambda: multi_walk_signals(tree), runs)
+    return {
+        "functions": functions,
+        "fused_ms_per_file": round(fused * 1000, 3),
+        "multi_walk_ms_per_file": round(legacy * 1000, 3),
+        "speedup": round(legacy / fused, 2) if fused > 0 else None,
+    }
+
+
+def signal_visitor_main(args):
+    result = measure_signal_visitor(args.functions, args.runs)
+    result["runs"] = args.runs
+    result["generated_at"] = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    print(
+        f"{result['functions']}-function module: fused visitor {result['fused_ms_per_file']} ms, "
+        f"multi-walk {result['multi_walk_ms_per_file']} ms ({result['speedup']}x)"
+    )
+    out_path = AI / "signal_visitor_bench.json"
+    _write_json(out_path, result)
+    print("Wrote signal visitor benchmark to", out_path)
+    return 0
+
+
+def scanner_main(args):
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SCANNER_SIZES]
+    if unknown:
+        print(f"Unknown sizes: {', '.join(unknown)} (choose from {', '.join(SCANNER_SIZES)})", file=sys.stderr)
+        return 2
+    current = run_scanner_suite(sizes, args.runs)
+    out_path = AI / "scanner_bench.json"
+    _write_json(out_path, current)
+    print("Wrote scanner benchmark to", out_path)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        _write_json(baseline_path, current)
+        print("Updated baseline", baseline_path)
+        return 0
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return 0
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    failures = compare_to_baseline(current, baseline, args.tolerance, args.exponent_slack)
+    for failure in failures:
+        print("REGRESSION:", failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
 def main():
     p = argparse.ArgumentParser()
     p.add_argument("--cmd", help="Command to benchmark (shell) ")
-    p.add_argument("--runs", type=int, default=5, help="Number of iterations")
+    p.add_argument("--runs", type=int, help="Number of iterations (default: 5, or 3 with --scanner)")
+    p.add_argument("--scanner", action="store_true", help="Run the synthetic-repo scanner benchmark suite")
+    p.add_argument("--sizes", default=",".join(SCANNER_SIZES), help="Comma-separated scanner sizes to run")
+    p.add_argument("--baseline", default=str(BASELINE), help="Baseline JSON to compare scanner results against")
+    p.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with this run")
+    p.add_argument("--tolerance", type=float, default=2.5, help="Allowed slowdown factor per size and metric")
+    p.add_argument(
+        "--exponent-slack", type=float, default=0.35, help="Allowed increase of the size scaling exponent"
+    )
+    p.add_argument(
+        "--schema-validation", action="store_true", help="Benchmark per-document jsonschema validation cost"
+    )
+    p.add_argument("--documents", type=int, default=300, help="Documents per --schema-validation run")
+    p.add_argument(
+        "--canonical-preflight", action="store_true", help="Benchmark subprocess vs in-process canonical preflight"
+    )
+    p.add_argument(
+        "--signal-visitor", action="store_true", help="Benchmark the fused AST visitor against separate walks"
+    )
+    p.add_argument("--functions", type=int, default=300, help="Function/class pairs per --signal-visitor module")
+    p.add_argument("--measure-repo", help=argparse.SUPPRESS)
     args = p.parse_args()
 
+    if args.runs is None:
+        args.runs = 3 if args.scanner or args.measure_repo else 5
+    if args.measure_repo:
+        print(json.dumps(measure_repo(args.measure_repo, args.runs)))
+        return 0
+    if args.scanner:
+        return scanner_main(args)
+    if args.schema_validation:
+        return schema_validation_main(args)
+    if args.canonical_preflight:
+        return canonical_preflight_main(args)
+    if args.signal_visitor:
+        return signal_visitor_main(args)
+
     cmd = args.cmd or "python -m timeit -n100 -r3 'sum(range(1000))'"
     results = []
     outputs = []
@@ -69,9 +572,11 @@ def main():
         summary["stdev_seconds"] = statistics.stdev(times) if len(times) > 1 else 0.0
 
     out_path = AI / "perf_results.json"
+    AI.mkdir(parents=True, exist_ok=True)
     out_path.write_text(json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8", newline="\n")
     print("Wrote perf results to", out_path)
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
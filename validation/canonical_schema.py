@@ -0,0 +1,99 @@
+"""In-process canonical plan schema preflight.
+
+`check_canonical_schema` runs the sanity checks behind
+`validate_products.py --check-canonical` without spawning an interpreter,
+and memoizes the verdict per schema file content hash. Docs builds, the
+mkdocs hook and exports can therefore preflight as often as they like: the
+schema is re-checked only when its bytes change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+CANONICAL_SCHEMA_REL = "guardsuite-core/canonical_schema.json"
+CANONICAL_REQUIRED_TOP_LEVEL = {
+    "plan_id",
+    "schema_version",
+    "resources",
+    "metadata",
+}
+CANONICAL_STATUS_OK = "canonical_schema: OK"
+
+# (path, sha256) -> (payload, None) on success, (None, ValueError message) otherwise
+_RESULTS: Dict[Tuple[str, str], Tuple[Optional[dict], Optional[str]]] = {}
+_LOCK = threading.Lock()
+
+
+def _sanity_check(payload: dict) -> None:
+    if payload.get("type") != "object":
+        raise ValueError(
+            "Canonical schema sanity check failed: top-level type must be 'object'"
+        )
+    if not isinstance(payload.get("properties"), dict):
+        raise ValueError(
+            "Canonical schema sanity check failed: missing properties object"
+        )
+    if not isinstance(payload.get("required"), list):
+        raise ValueError("Canonical schema sanity check failed: missing required list")
+    missing_required = CANONICAL_REQUIRED_TOP_LEVEL - set(payload.get("required", []))
+    if missing_required:
+        raise ValueError(
+            "Canonical schema sanity check failed: required list missing keys "
+            + ", ".join(sorted(missing_required))
+        )
+    missing_properties = CANONICAL_REQUIRED_TOP_LEVEL - set(
+        payload.get("properties", {}).keys()
+    )
+    if missing_properties:
+        raise ValueError(
+            "Canonical schema sanity check failed: properties block missing keys "
+            + ", ".join(sorted(missing_properties))
+        )
+
+
+def check_canonical_schema(root: Path) -> dict:
+    """Return the sanity-checked canonical schema under `root`.
+
+    Raises FileNotFoundError when the schema is absent and ValueError when it
+    is not valid JSON or fails a sanity check. The returned payload is shared
+    between callers and must not be mutated.
+    """
+    path = Path(root) / CANONICAL_SCHEMA_REL
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Canonical schema missing at {CANONICAL_SCHEMA_REL}; "
+            "run canonical schema scaffolding"
+        ) from None
+    key = (str(path.resolve()), hashlib.sha256(raw).hexdigest())
+    with _LOCK:
+        cached = _RESULTS.get(key)
+    if cached is None:
+        try:
+            payload = json.loads(raw.decode("utf-8"))
+            _sanity_check(payload)
+            cached = (payload, None)
+        except json.JSONDecodeError as exc:
+            cached = (
+                None,
+                f"Canonical schema JSON invalid at {CANONICAL_SCHEMA_REL}: {exc}",
+            )
+        except ValueError as exc:
+            cached = (None, str(exc))
+        with _LOCK:
+            _RESULTS[key] = cached
+    payload, failure = cached
+    if failure is not None:
+        raise ValueError(failure)
+    return payload
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _RESULTS.clear()
@@ -0,0 +1,71 @@
+"""Forked process pools for scripts that are loaded by file path.
+
+`scripts/validate_products.py` and `scripts/gen_docs.py` are loaded through
+importlib rather than imported by package name. Spawned interpreters could
+not re-import them, so their pools fork instead and inherit the parent's
+state. Pickle still has to resolve each pool entry
+point by module name, so `fork_pool` registers a stand-in module holding the
+entry points for as long as the pool runs.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator
+
+
+def fork_context():
+    """Return the 'fork' multiprocessing context, or None where unsupported."""
+    import multiprocessing
+
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+
+@contextlib.contextmanager
+def entry_points_registered(*entry_points: Callable) -> Iterator[None]:
+    """Make `entry_points` resolvable under their `__module__` while a pool runs.
+
+    When the module is already registered with these functions nothing
+    changes; otherwise a minimal stand-in is registered for the duration and
+    the previous entry (if any) is restored afterwards.
+    """
+    name = entry_points[0].__module__
+    previous = sys.modules.get(name)
+    if previous is not None and all(
+        getattr(previous, fn.__name__, None) is fn for fn in entry_points
+    ):
+        yield
+        return
+    stand_in = types.ModuleType(name)
+    for fn in entry_points:
+        setattr(stand_in, fn.__name__, fn)
+    sys.modules[name] = stand_in
+    try:
+        yield
+    finally:
+        if previous is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = previous
+
+
+@contextlib.contextmanager
+def fork_pool(
+    max_workers: int, *entry_points: Callable
+) -> Iterator[ProcessPoolExecutor]:
+    """A fork-context `ProcessPoolExecutor` that can pickle `entry_points`.
+
+    Callers check `fork_context()` first and fall back to running serially
+    where fork is unavailable.
+    """
+    with entry_points_registered(*entry_points):
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=fork_context()
+        ) as pool:
+            yield pool
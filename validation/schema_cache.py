@@ -0,0 +1,72 @@
+"""Process-wide cache of compiled jsonschema validators.
+
+`jsonschema.validate()` re-checks the schema against its meta-schema and
+builds a new validator (and `$ref` registry) on every call. Validation paths
+here instead ask `compiled_validator` for a validator keyed by the schema's
+content hash, so each distinct schema is checked and compiled once per
+process however many documents it validates. Validators are reused as-is and
+must not be mutated; `validate_instance` mirrors `jsonschema.validate()`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from jsonschema import SchemaError, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+_VALIDATORS: Dict[Tuple[type, str], Any] = {}
+_SCHEMA_ERRORS: Dict[Tuple[type, str], SchemaError] = {}
+_LOCK = threading.Lock()
+
+
+def schema_digest(schema: Any) -> str:
+    """Return a sha256 over the canonical JSON form of `schema`."""
+    payload = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compiled_validator(schema: Any, cls: Optional[type] = None) -> Any:
+    """Return the cached validator for `schema`, compiling it on first use.
+
+    The class defaults to the one named by `$schema` (latest draft otherwise),
+    as with `jsonschema.validate()`. Raises `SchemaError` when the schema is
+    invalid; the failure is cached too.
+    """
+    cls = cls or validator_for(schema)
+    key = (cls, schema_digest(schema))
+    with _LOCK:
+        validator = _VALIDATORS.get(key)
+        error = _SCHEMA_ERRORS.get(key)
+    if validator is not None:
+        return validator
+    if error is not None:
+        raise error
+    try:
+        cls.check_schema(schema)
+    except SchemaError as exc:
+        with _LOCK:
+            _SCHEMA_ERRORS[key] = exc
+        raise
+    validator = cls(schema)
+    with _LOCK:
+        return _VALIDATORS.setdefault(key, validator)
+
+
+def validate_instance(instance: Any, schema: Any, cls: Optional[type] = None) -> None:
+    """Cached equivalent of `jsonschema.validate()`: raise the best error, if any."""
+    error: Optional[ValidationError] = best_match(
+        compiled_validator(schema, cls).iter_errors(instance)
+    )
+    if error is not None:
+        raise error
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _VALIDATORS.clear()
+        _SCHEMA_ERRORS.clear()
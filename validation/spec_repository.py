@@ -0,0 +1,157 @@
+"""In-memory model of the GuardSuite spec tree, discovered and loaded once.
+
+`SpecRepository` owns the product discovery rules (`products/*.yml` minus
+worksheets, the master spec and the index, with `product_specs/` as the
+fallback location) and indexes products, `product_index.yml` entries and
+display names by id. Documents are parsed through `validation.yaml_loader`
+and returned as shared objects: callers must copy before mutating.
+Discovery and index lookups are re-derived whenever the `products/` or
+`product_specs/` directory or `product_index.yml` changes (mtime_ns, size),
+so a long-lived process such as `mkdocs serve` never renders stale data.
+
+Use `spec_repository(root)` to get the process-wide instance for a tree, so
+validate, docs and export stages running in one process share every parse.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from validation.yaml_loader import load_yaml
+
+NON_PRODUCT_FILES = {"guardsuite_master_spec.yml", "product_index.yml"}
+
+
+class SpecRepository:
+    """Product specs and registry documents under one repository root."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self.products_dir = self.root / "products"
+        self.product_specs_dir = self.root / "product_specs"
+        self.index_path = self.products_dir / "product_index.yml"
+        self.reload()
+
+    def reload(self) -> None:
+        """Forget discovered paths and index lookups (documents re-check mtime)."""
+        self._signature = self._current_signature()
+        self._spec_paths: Optional[Dict[str, Path]] = None
+        self._fallback_paths: Dict[str, Optional[Path]] = {}
+        self._index_entries: Optional[Dict[str, dict]] = None
+
+    def _current_signature(self) -> Tuple[Optional[Tuple[int, int]], ...]:
+        signature = []
+        for path in (self.products_dir, self.product_specs_dir, self.index_path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    def _refresh(self) -> None:
+        """Drop memoized lookups when a spec directory or the index changed."""
+        if self._current_signature() != self._signature:
+            self.reload()
+
+    # discovery -----------------------------------------------------------
+
+    def spec_paths(self) -> Dict[str, Path]:
+        """Product specs under `products/`, keyed by id in sorted order."""
+        self._refresh()
+        if self._spec_paths is None:
+            files = sorted(
+                p
+                for p in self.products_dir.glob("*.yml")
+                if not p.name.endswith("_worksheet.yml")
+                and p.name not in NON_PRODUCT_FILES
+            )
+            self._spec_paths = {p.stem: p for p in files}
+        return self._spec_paths
+
+    def product_ids(self) -> List[str]:
+        return list(self.spec_paths())
+
+    def spec_path(self, product_id: str) -> Optional[Path]:
+        """Return the spec for `product_id` from `products/`, else `product_specs/`."""
+        path = self.spec_paths().get(product_id)
+        if path is not None:
+            return path
+        if product_id not in self._fallback_paths:
+            candidate = self.product_specs_dir / f"{product_id}.yml"
+            found = candidate if candidate.exists() else None
+            self._fallback_paths[product_id] = found
+        return self._fallback_paths[product_id]
+
+    # documents -----------------------------------------------------------
+
+    def load(self, relative_path: str | Path) -> Any:
+        """Parse a repo-relative YAML document (contract, schema, snippet)."""
+        return load_yaml(self.root / relative_path, copy=False)
+
+    def spec(self, product_id: str) -> Any:
+        path = self.spec_path(product_id)
+        if path is None:
+            raise FileNotFoundError(
+                f"Product '{product_id}' spec missing under products/ or product_specs/."
+            )
+        return load_yaml(path, copy=False)
+
+    def display_name(self, product_id: str) -> str:
+        """Return the spec's `name`, falling back to the id when unreadable."""
+        try:
+            return self.spec(product_id).get("name", product_id)
+        except Exception:
+            return product_id
+
+    # product index -------------------------------------------------------
+
+    def index_document(self) -> dict:
+        if not self.index_path.exists():
+            return {}
+        return load_yaml(self.index_path, copy=False) or {}
+
+    def index_entries(self) -> List[dict]:
+        return self.index_document().get("products", [])
+
+    def index_by_id(self) -> Dict[str, dict]:
+        """`product_index.yml` entries keyed by `product_id` (later entries win)."""
+        self._refresh()
+        if self._index_entries is None:
+            self._index_entries = {}
+            for entry in self.index_entries():
+                pid = entry.get("product_id")
+                if pid:
+                    self._index_entries[pid] = entry
+        return self._index_entries
+
+    def index_entry(self, product_id: str) -> Optional[dict]:
+        return self.index_by_id().get(product_id)
+
+    def _index_ref(self, product_id: str, field: str) -> Any:
+        ref = (self.index_entry(product_id) or {}).get(field)
+        if not ref or not (self.root / ref).exists():
+            return None
+        return self.load(ref)
+
+    def contract(self, product_id: str) -> Any:
+        """The index entry's `contract_ref` document, or None when absent."""
+        return self._index_ref(product_id, "contract_ref")
+
+    def schema(self, product_id: str) -> Any:
+        """The index entry's `schema_path` document, or None when absent."""
+        return self._index_ref(product_id, "schema_path")
+
+
+_REPOSITORIES: Dict[Path, SpecRepository] = {}
+
+
+def spec_repository(root: Path) -> SpecRepository:
+    """Return the shared `SpecRepository` for `root`, creating it on first use."""
+    key = Path(root).resolve()
+    if key not in _REPOSITORIES:
+        _REPOSITORIES[key] = SpecRepository(key)
+    return _REPOSITORIES[key]
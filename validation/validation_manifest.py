@@ -0,0 +1,173 @@
+"""Content-hash manifest of passing validation results under `.pil_cache/`.
+
+Validators record, per checked document, the SHA-256 of every input that
+decided its verdict (the document, its schema, files it references) plus a
+code version covering the validator's own source. On the next run an entry
+whose code version and input hashes all still match is reported as passing
+without being validated again. Only passes are recorded, so a failing
+document is re-checked (and re-reported) on every run. Reads and writes are
+best-effort: a missing or corrupt manifest behaves like an empty one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+MANIFEST_DIR = ".pil_cache"
+# bump when the shape of the stored entries changes
+MANIFEST_VERSION = 1
+# shared modules that decide verdicts and rendered pages; callers list them
+# in their code version so editing one invalidates stale entries
+SHARED_SOURCES = tuple(
+    Path(__file__).resolve().with_name(f"{name}.py")
+    for name in ("canonical_schema", "schema_cache", "spec_repository", "yaml_loader")
+)
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    """Return the SHA-256 of `path`, or None when it does not exist."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def code_version(*sources: Path) -> str:
+    """Return a digest of the validator sources and the jsonschema release."""
+    try:
+        from importlib.metadata import version
+
+        jsonschema_version = version("jsonschema")
+    except Exception:
+        jsonschema_version = "unknown"
+    h = hashlib.sha256(
+        f"v{MANIFEST_VERSION}:jsonschema-{jsonschema_version}".encode("utf-8")
+    )
+    for source in (Path(__file__), *sources):
+        h.update((file_sha256(source) or "missing").encode("utf-8"))
+    return h.hexdigest()
+
+
+class ValidationManifest:
+    """Per-validator store of passing verdicts keyed by document.
+
+    `lookup(key)` returns the stored result when every recorded input still
+    hashes the same, else None; with `full=True` it always misses, but passes
+    are still recorded so the next incremental run can use them. File hashes
+    are memoized for the lifetime of the object, so a schema shared by many
+    documents is read once per run.
+    """
+
+    def __init__(self, path: Path, version: str, root: Path, full: bool = False):
+        self.path = Path(path)
+        self.version = version
+        self.root = Path(root).resolve()
+        self.full = full
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @classmethod
+    def for_validator(
+        cls, root: Path, name: str, sources: Iterable[Path], full: bool = False
+    ) -> "ValidationManifest":
+        """Open `<root>/.pil_cache/<name>.manifest.json` for a validator script."""
+        path = Path(root) / MANIFEST_DIR / f"{name}.manifest.json"
+        return cls(path, code_version(*sources), root, full=full)
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(data, dict) or data.get("code_version") != self.version:
+            # validator changed (or foreign file): start over
+            self._dirty = True
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def _rel(self, path: Path) -> str:
+        resolved = Path(path).resolve()
+        try:
+            return resolved.relative_to(self.root).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def _abs(self, rel: str) -> Path:
+        p = Path(rel)
+        return p if p.is_absolute() else self.root / p
+
+    def digest(self, path: Path) -> Optional[str]:
+        rel = self._rel(path)
+        if rel not in self._hashes:
+            self._hashes[rel] = file_sha256(self._abs(rel))
+        return self._hashes[rel]
+
+    def invalidate(self, path: Path) -> None:
+        """Forget the memoized hash of `path` after the caller rewrote it."""
+        self._hashes.pop(self._rel(path), None)
+
+    def lookup(self, key: str, context: Any = None) -> Optional[Dict[str, Any]]:
+        """Return the last passing result for `key` if none of its inputs changed."""
+        entry = self._entries.get(key)
+        current = (
+            not self.full
+            and isinstance(entry, dict)
+            and isinstance(entry.get("inputs"), dict)
+            and entry.get("context") == context
+            and all(
+                self.digest(self._abs(rel)) == sha
+                for rel, sha in entry["inputs"].items()
+            )
+        )
+        if current:
+            self.hits += 1
+            return entry.get("result") or {}
+        self.misses += 1
+        return None
+
+    def record(
+        self,
+        key: str,
+        inputs: Iterable[Path],
+        result: Optional[Dict[str, Any]] = None,
+        context: Any = None,
+    ) -> None:
+        """Store a passing verdict for `key` together with its input hashes.
+
+        Missing inputs are recorded as well (hash None), so creating such a
+        file later also invalidates the entry.
+        """
+        self._entries[key] = {
+            "inputs": {self._rel(p): self.digest(p) for p in inputs},
+            "context": context,
+            "result": result or {},
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the manifest atomically."""
+        if not self._dirty:
+            return
+        payload = {"code_version": self.version, "entries": self._entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(str(tmp), str(self.path))
+            self._dirty = False
+        except OSError as exc:
+            print(
+                f"warning: could not write validation manifest {self.path}: {exc}",
+                file=sys.stderr,
+            )
@@ -6,14 +6,16 @@ from pathlib import Path
 from typing import Any, List, Tuple
 
 import yaml
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+
+from validation.schema_cache import validate_instance
+from validation.yaml_loader import load_yaml, parse_yaml
 
 SCHEMA_DIR = Path(__file__).resolve().parents[1] / "schemas"
 
 
 def load_schema(name: str) -> Any:
-    path = SCHEMA_DIR / name
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+    return load_yaml(SCHEMA_DIR / name)
 
 
 PRODUCT_SCHEMA = load_schema("product_schema.yml")
@@ -32,8 +34,8 @@ def _ensure_yaml_text(raw: Any) -> str:
 def validate_yaml_text(yaml_text: Any, schema: Any) -> Tuple[bool, List[str]]:
     text = _ensure_yaml_text(yaml_text)
     try:
-        data = yaml.safe_load(text) if text else {}
-        validate(instance=data, schema=schema)
+        data = parse_yaml(text) if text else {}
+        validate_instance(data, schema)
         return True, []
     except (yaml.YAMLError, ValidationError) as exc:
         return False, [str(exc)]
@@ -0,0 +1,57 @@
+"""Shared YAML loading for GuardSpecs scripts and validators.
+
+Parsing uses libyaml's `CSafeLoader` when PyYAML was built with it and falls
+back to the pure-Python `SafeLoader` otherwise; both produce the same data.
+Parsed files are cached in-process keyed by (path, mtime_ns, size), so a
+spec read by several stages of one run is parsed once. `load_yaml` returns a
+deep copy by default; pass `copy=False` for a shared, read-only result.
+
+There is deliberately no C-accelerated dumper here: libyaml wraps long
+scalars differently from `yaml.safe_dump`, and generated docs and exports
+must be byte-identical whether or not libyaml is installed.
+"""
+
+from __future__ import annotations
+
+import copy as _copy
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import yaml
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def parse_yaml(text: str) -> Any:
+    """Parse a YAML string with the fastest available safe loader."""
+    return yaml.load(text, Loader=SafeLoader)
+
+
+def load_yaml(path: Path, copy: bool = True) -> Any:
+    """Parse the YAML file at `path`, reusing the cached result while it is unchanged.
+
+    With `copy=False` the cached object itself is returned; callers must not
+    mutate it.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    with _LOCK:
+        cached = _CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        data = cached[2]
+    else:
+        with open(key, "r", encoding="utf-8") as handle:
+            data = yaml.load(handle, Loader=SafeLoader)
+        with _LOCK:
+            _CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return _copy.deepcopy(data) if copy else data
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()